@@ -4,82 +4,178 @@ Secure Password Vault Application
 """
 
 import customtkinter as ctk
+from typing import TYPE_CHECKING, Iterable, Optional
+import importlib
 import os
 import sys
+import threading
 
-# Add the src directory to path for imports
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+# Add the src directory to path for imports when run as a script
+if not __package__:
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from ui.login_window import LoginWindow
-from ui.main_window import MainWindow
-from ui.theme import Colors, IS_NEW_USER
+from core.paths import vault_exists
+from ui.clipboard import clipboard_for
+from ui.login_window import LoginView
+from ui.theme import Colors, Dimensions
+
+if TYPE_CHECKING:
+    from ui.main_window import MainView
+
+# Not needed to paint the login view; imported in the background while the
+# greeting animates so that unlocking doesn't wait for them
+PREWARM_MODULES = ("services.auth_service", "ui.main_window")
+
+
+def prewarm(modules: Iterable[str] = PREWARM_MODULES) -> threading.Thread:
+    """Import ``modules`` on a daemon thread."""
+
+    def _import_all():
+        for name in modules:
+            try:
+                importlib.import_module(name)
+            except Exception:
+                pass  # Imported again where it's used, which reports the error
+
+    thread = threading.Thread(
+        target=_import_all, name="lockguardium-prewarm", daemon=True
+    )
+    thread.start()
+    return thread
 
 
 class LockGuardiumApp:
     """
     Main application controller.
-    Manages the application lifecycle and window transitions.
+    Owns the single root window and swaps the login and main views in it.
+
+    Both views are built once and kept for the life of the process:
+    locking wipes the vault's secrets from the main view and shows the
+    login view again, so re-unlocking only waits for the KDF. There is
+    exactly one Tk event loop.
     """
 
     def __init__(self):
-        self.current_window = None
         self.is_authenticated = False
+        self.vault_service = None
 
         # Configure global appearance
         ctk.set_appearance_mode("dark")
         ctk.set_default_color_theme("green")
 
+        self.root = ctk.CTk()
+        self.root.title("LockGuardium Lite")
+        self.root.configure(fg_color=Colors.BG_PRIMARY)
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
+
+        self.login_view: Optional[LoginView] = None
+        self.main_view: Optional["MainView"] = None
+        self.current_view = None
+        self._closing = False
+
     def run(self):
         """Start the application."""
         self._show_login()
 
-    def _show_login(self):
-        """Show the login window."""
-        # Destroy current window if exists
-        if self.current_window:
-            self.current_window.destroy()
+        # Load the rest of the app once the login view has painted
+        self.root.after_idle(prewarm)
+        self.root.mainloop()
+
+    def _show_view(self, view, width: int, height: int, resizable: bool):
+        """Swap ``view`` into the root window and size the window for it."""
+        if self.current_view is not None and self.current_view is not view:
+            self.current_view.pack_forget()
+        view.pack(fill="both", expand=True)
+        self.current_view = view
+
+        self.root.resizable(resizable, resizable)
+        self.root.minsize(
+            Dimensions.MAIN_MIN_WIDTH if resizable else width,
+            Dimensions.MAIN_MIN_HEIGHT if resizable else height,
+        )
 
-        # Check if this is a new user (placeholder - would check if vault exists)
-        is_new_user = IS_NEW_USER
+        # Center window on screen
+        self.root.update_idletasks()
+        x = (self.root.winfo_screenwidth() - width) // 2
+        y = (self.root.winfo_screenheight() - height) // 2
+        self.root.geometry(f"{width}x{height}+{x}+{y}")
 
-        # Create login window
-        self.current_window = LoginWindow(
-            on_login_success=self._on_login_success, is_new_user=is_new_user
+    def _show_login(self):
+        """Show the login view (new user if no vault file exists yet)."""
+        is_new_user = not vault_exists()
+        if self.login_view is not None and self.login_view.is_new_user != is_new_user:
+            # Vault was just created: switch to the unlock form
+            self.login_view.destroy()
+            self.login_view = None
+
+        if self.login_view is None:
+            self.login_view = LoginView(
+                self.root,
+                on_login_success=self._on_login_success,
+                is_new_user=is_new_user,
+            )
+        else:
+            self.login_view.reset()
+
+        self._show_view(
+            self.login_view, Dimensions.LOGIN_WIDTH, Dimensions.LOGIN_HEIGHT, False
         )
-        self.current_window.mainloop()
 
-    def _on_login_success(self):
+    def _on_login_success(self, vault_service):
         """Handle successful login."""
         self.is_authenticated = True
+        self.vault_service = vault_service
 
-        # Destroy login window
-        if self.current_window:
-            self.current_window.destroy()
-
-        # Show main vault window
+        # Show main vault view
         self._show_main()
 
     def _show_main(self):
-        """Show the main vault window."""
-        self.current_window = MainWindow(on_lock=self._on_lock)
-        self.current_window.mainloop()
+        """Show the main vault view, built once and re-attached on unlock."""
+        if self.main_view is None:
+            from ui.main_window import MainView
+
+            self.main_view = MainView(
+                self.root, on_lock=self._on_lock, vault_service=self.vault_service
+            )
+        else:
+            self.main_view.attach(self.vault_service)
+
+        self._show_view(
+            self.main_view,
+            Dimensions.MAIN_DEFAULT_WIDTH,
+            Dimensions.MAIN_DEFAULT_HEIGHT,
+            True,
+        )
 
     def _on_lock(self):
-        """Handle lock action from main window."""
+        """Handle lock action from the main view (its secrets are wiped)."""
         self.is_authenticated = False
+        self.vault_service = None
 
-        # Destroy main window
-        if self.current_window:
-            self.current_window.destroy()
-
-        # Show login window
+        # Show login view
         self._show_login()
 
+    def _on_close(self):
+        """Lock (saving usage) and clear the clipboard before the window closes."""
+        if self._closing:
+            return
+        self._closing = True
+        clipboard_for(self.root).clear()
+
+        if self.main_view is None or not self.main_view.lock(on_done=self.root.destroy):
+            self.root.destroy()
+
 
 def main():
     """Main entry point."""
     app = LockGuardiumApp()
-    app.run()
+    try:
+        app.run()
+    finally:
+        # Only loaded (and only running) once something used the services
+        runtime = sys.modules.get("services.runtime")
+        if runtime is not None:
+            runtime.get_runtime().stop()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,147 @@
+"""
+LockGuardium Lite - Startup Budget Check
+Fails when cold start gets slower or the login path imports too much
+
+Run from anywhere (exit status 1 on failure):
+    python src/lockguardium-lite/check_startup.py
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+from typing import Dict, List, Optional, Tuple
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Cumulative import time of ``app`` as reported by ``-X importtime``
+IMPORT_BUDGET_MS = 150
+
+# From spawning the interpreter to the login view's first paint
+FIRST_PAINT_BUDGET_MS = 1000
+
+# Modules the login view must not pull in (they're prewarmed after paint)
+LOGIN_PATH_EXCLUDED = (
+    "asyncio",
+    "cryptography",
+    "core.crypto",
+    "core.storage",
+    "services",
+    "ui.components",
+    "ui.main_window",
+)
+
+# Builds the login view, paints it and reports the modules loaded by then
+_PAINT_SCRIPT = """
+import sys
+import app
+application = app.LockGuardiumApp()
+application._show_login()
+application.root.update()
+print("painted", flush=True)
+print(" ".join(sys.modules), flush=True)
+application.root.destroy()
+"""
+
+
+def measure_imports(runs: int = 3) -> Tuple[float, Dict[str, float]]:
+    """
+    Import ``app`` in fresh interpreters under ``-X importtime``.
+
+    Returns:
+        (best cumulative ms for ``app``, cumulative ms by module of that run)
+    """
+    best: Optional[Tuple[float, Dict[str, float]]] = None
+    for _ in range(runs):
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", "import app"],
+            cwd=APP_DIR,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+
+        # "import time: self [us] | cumulative | imported package"
+        cumulative: Dict[str, float] = {}
+        for line in result.stderr.splitlines():
+            if not line.startswith("import time:"):
+                continue
+            fields = line[len("import time:") :].split("|")
+            if len(fields) != 3 or not fields[1].strip().isdigit():
+                continue
+            cumulative[fields[2].strip()] = int(fields[1]) / 1000
+
+        total = cumulative.get("app", 0.0)
+        if best is None or total < best[0]:
+            best = (total, cumulative)
+    return best
+
+
+def measure_first_paint() -> Tuple[Optional[float], List[str]]:
+    """
+    Milliseconds from spawning the interpreter to the painted login view,
+    and the modules loaded by then. None when no display is available.
+    """
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "-c", _PAINT_SCRIPT],
+        cwd=APP_DIR,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    painted = process.stdout.readline()
+    elapsed = (time.perf_counter() - start) * 1000
+    modules = process.stdout.readline().split()
+    process.communicate()
+
+    if painted.strip() != "painted":
+        return None, []
+    return elapsed, modules
+
+
+def _excluded(modules) -> List[str]:
+    return sorted(
+        name
+        for name in modules
+        if any(name == p or name.startswith(p + ".") for p in LOGIN_PATH_EXCLUDED)
+    )
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[1])
+    parser.add_argument("--import-budget", type=float, default=IMPORT_BUDGET_MS)
+    parser.add_argument("--paint-budget", type=float, default=FIRST_PAINT_BUDGET_MS)
+    args = parser.parse_args(argv)
+    failures = []
+
+    total, cumulative = measure_imports()
+    print(f"import app: {total:.0f} ms (budget {args.import_budget:.0f} ms)")
+    for name, ms in sorted(cumulative.items(), key=lambda kv: -kv[1])[1:9]:
+        print(f"    {ms:7.1f} ms  {name}")
+    if total > args.import_budget:
+        failures.append("importing app is over budget")
+
+    loaded = _excluded(cumulative)
+    if loaded:
+        failures.append("app imports " + ", ".join(loaded))
+
+    paint, modules = measure_first_paint()
+    if paint is None:
+        print("first paint: skipped (no display)")
+    else:
+        print(f"first paint: {paint:.0f} ms (budget {args.paint_budget:.0f} ms)")
+        if paint > args.paint_budget:
+            failures.append("first paint is over budget")
+        loaded = _excluded(modules)
+        if loaded:
+            failures.append("the login view loads " + ", ".join(loaded))
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,31 +1,44 @@
 import os, base64
 from cryptography.fernet import Fernet
 from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 
 SALT_PATH = "salt.bin"
+SALT_SIZE = 16
+KDF_ITERATIONS = 200_000
 
 def load_or_create_salt() -> bytes:
     """Load the salt from a file or create a new one if it does not exist."""
     if os.path.exists(SALT_PATH):
         return open(SALT_PATH, "rb").read()
-    salt = os.urandom(16)
+    salt = os.urandom(SALT_SIZE)
     with open(SALT_PATH, "wb") as f:
         f.write(salt)
     return salt
 
-def derive_key(password: str, salt: bytes) -> bytes:
+def derive_key(password: str, salt: bytes, iterations: int = KDF_ITERATIONS) -> bytes:
     """Derive a key from the password and salt using PBKDF2."""
     pwd = password.encode("utf-8")
     kdf = PBKDF2HMAC(
         algorithm=hashes.SHA256(),
         length=32,
         salt=salt,
-        iterations=200_000, 
+        iterations=iterations, 
     )
     raw_key = kdf.derive(pwd)
     return base64.urlsafe_b64encode(raw_key) # Ensure the key is URL-safe and 32 bytes long
 
+def derive_subkey(key: bytes, purpose: str) -> bytes:
+    """Derive an independent Fernet key for ``purpose`` from a vault key using HKDF."""
+    hkdf = HKDF(
+        algorithm=hashes.SHA256(),
+        length=32,
+        salt=None,
+        info=f"lockguardium/{purpose}".encode("utf-8"),
+    )
+    return base64.urlsafe_b64encode(hkdf.derive(base64.urlsafe_b64decode(key)))
+
 def encrypt_password(key: bytes, plaintext: str) -> bytes:
     """Encrypt a plaintext password using the provided key."""
     fernet = Fernet(key)
@@ -34,4 +47,4 @@ def encrypt_password(key: bytes, plaintext: str) -> bytes:
 def decrypt_password(key: bytes, token: bytes) -> str:
     """Decrypt a token using the provided key."""
     fernet = Fernet(key)
-    return fernet.decrypt(token).decode("utf-8")
\ No newline at end of file
+    return fernet.decrypt(token).decode("utf-8")
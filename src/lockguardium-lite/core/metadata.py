@@ -0,0 +1,190 @@
+"""
+LockGuardium Lite - Metadata Index
+Non-secret entry fields in a private in-memory SQLite database
+"""
+
+import sqlite3
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+from core.models import VaultChange
+
+# Columns callers may filter, sort and group on (never the password)
+METADATA_COLUMNS = (
+    "service",
+    "email",
+    "username",
+    "domain",
+    "created_at",
+    "modified_at",
+)
+
+# (column, operator, value), e.g. ("domain", "=", "company.com")
+Filter = Tuple[str, str, str]
+
+_OPERATORS = {
+    "=": "{} = ?",
+    "!=": "{} != ?",
+    "<": "{} < ?",
+    "<=": "{} <= ?",
+    ">": "{} > ?",
+    ">=": "{} >= ?",
+    "contains": "{} LIKE ? ESCAPE '\\'",
+    "prefix": "{} LIKE ? ESCAPE '\\'",
+}
+
+_SCHEMA = """
+CREATE TABLE entries (
+    id INTEGER PRIMARY KEY,
+    service TEXT NOT NULL COLLATE NOCASE,
+    email TEXT NOT NULL COLLATE NOCASE,
+    username TEXT NOT NULL COLLATE NOCASE,
+    domain TEXT NOT NULL COLLATE NOCASE,
+    created_at TEXT NOT NULL,
+    modified_at TEXT NOT NULL
+);
+"""
+
+# Created after the initial bulk load, which is faster than updating them per row
+_INDEXES = """
+CREATE INDEX entries_service ON entries (service);
+CREATE INDEX entries_email ON entries (email);
+CREATE INDEX entries_username ON entries (username);
+CREATE INDEX entries_domain ON entries (domain);
+CREATE INDEX entries_created ON entries (created_at);
+CREATE INDEX entries_modified ON entries (modified_at);
+"""
+
+
+def _row(entry: dict) -> tuple:
+    email = entry.get("email", "")
+    return (
+        entry["id"],
+        entry.get("service", ""),
+        email,
+        entry.get("username", ""),
+        email.rpartition("@")[2] if "@" in email else "",
+        entry.get("created_at", ""),
+        entry.get("modified_at", ""),
+    )
+
+
+def _like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+class MetadataIndex:
+    """
+    Entry metadata (everything but the password) in a ``:memory:`` SQLite
+    database, for sorting, filtering and grouping with indexed SQL.
+
+    The database lives only in this process: it is never attached to a
+    file, temporary b-trees for large sorts are kept in memory, and
+    ``close`` frees it. Text columns compare case-insensitively (NOCASE),
+    so ordering by service matches what the user sees and ``prefix``
+    filters can use the column indexes.
+
+    Not thread-safe on its own; VaultService serializes access.
+    """
+
+    def __init__(self):
+        self._db = sqlite3.connect(":memory:", check_same_thread=False)
+        self._db.execute("PRAGMA temp_store = MEMORY")
+        self._db.executescript(_SCHEMA)
+
+    def load(self, entries: Iterable[dict]):
+        """Insert every entry and index the table (once, when built)."""
+        with self._db:
+            self._db.executemany(
+                "INSERT INTO entries VALUES (?, ?, ?, ?, ?, ?, ?)", map(_row, entries)
+            )
+        self._db.executescript(_INDEXES)
+
+    def apply(self, change: VaultChange):
+        """Fold one committed vault change into the table."""
+        with self._db:
+            self._db.executemany(
+                "DELETE FROM entries WHERE id = ?", ((i,) for i in change.removed)
+            )
+            self._db.executemany(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?, ?)",
+                map(_row, change.added + change.updated),
+            )
+
+    # ===== Queries =====
+
+    def select(
+        self,
+        where: Optional[Sequence[Filter]] = None,
+        order_by: str = "service",
+        descending: bool = False,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> List[int]:
+        """
+        Ids of the entries matching every filter in ``where``, sorted.
+
+        Args:
+            where: (column, operator, value) filters, all of which must hold
+            order_by: Column to sort on; ties keep id order
+            descending: Sort from highest to lowest
+            limit: Maximum number of ids (all if None)
+            offset: Number of leading ids to skip
+        """
+        direction = "DESC" if descending else "ASC"
+        clause, params = self._where(where)
+        sql = (
+            f"SELECT id FROM entries{clause} "
+            f"ORDER BY {self._column(order_by)} {direction}, id {direction}"
+        )
+        if limit is not None or offset:
+            sql += " LIMIT ? OFFSET ?"
+            params += [-1 if limit is None else limit, offset]
+        return [row[0] for row in self._db.execute(sql, params)]
+
+    def count(self, where: Optional[Sequence[Filter]] = None) -> int:
+        """Number of entries matching ``where``."""
+        clause, params = self._where(where)
+        sql = f"SELECT COUNT(*) FROM entries{clause}"
+        return self._db.execute(sql, params).fetchone()[0]
+
+    def group_counts(
+        self, column: str, where: Optional[Sequence[Filter]] = None
+    ) -> List[Tuple[str, int]]:
+        """(value, count) per distinct ``column`` value, largest group first."""
+        column = self._column(column)
+        clause, params = self._where(where)
+        sql = (
+            f"SELECT {column}, COUNT(*) AS n FROM entries{clause} "
+            f"GROUP BY {column} ORDER BY n DESC, {column}"
+        )
+        return list(self._db.execute(sql, params))
+
+    def close(self):
+        """Free the database."""
+        self._db.close()
+
+    # ===== SQL Helpers =====
+
+    @staticmethod
+    def _column(name: str) -> str:
+        if name not in METADATA_COLUMNS:
+            raise ValueError(f"Unknown metadata column: {name!r}")
+        return name
+
+    def _where(self, where: Optional[Sequence[Filter]]) -> Tuple[str, list]:
+        """Render filters as a WHERE clause with bound parameters."""
+        if not where:
+            return "", []
+
+        terms, params = [], []
+        for column, op, value in where:
+            template = _OPERATORS.get(op)
+            if template is None:
+                raise ValueError(f"Unknown filter operator: {op!r}")
+            terms.append(template.format(self._column(column)))
+            if op == "contains":
+                value = f"%{_like(value)}%"
+            elif op == "prefix":
+                value = f"{_like(value)}%"
+            params.append(value)
+        return " WHERE " + " AND ".join(terms), params
@@ -0,0 +1,88 @@
+"""
+LockGuardium Lite - Data Models
+Plain data containers shared between core and services
+"""
+
+from dataclasses import dataclass, field
+from typing import Iterator, List, Optional
+
+from core.persistent import PersistentMap
+from core.storage import VaultHeader
+
+
+@dataclass
+class VaultSession:
+    """
+    An unlocked vault: the derived key, the header it was derived from and
+    the decrypted entries. Produced by AuthService, owned by VaultService.
+    """
+
+    key: Optional[bytes]
+    header: VaultHeader
+    entries: List[dict] = field(default_factory=list)
+    next_id: int = 1
+    saved_searches: List[dict] = field(default_factory=list)
+    usage: List[list] = field(default_factory=list)
+
+    def wipe(self):
+        """Drop references to the key and decrypted entries."""
+        self.key = None
+        self.entries = []
+        self.saved_searches = []
+        self.usage = []
+
+
+@dataclass
+class VaultChange:
+    """
+    Coalesced result of one committed batch of vault mutations.
+    An entry appears in at most one list: adding then editing an entry in the
+    same batch reports it as added, adding then deleting it reports nothing.
+    ``metadata`` names vault-level data (e.g. "saved_searches") that changed.
+    """
+
+    added: List[dict] = field(default_factory=list)
+    updated: List[dict] = field(default_factory=list)
+    removed: List[int] = field(default_factory=list)
+    generation: int = 0
+    metadata: List[str] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.updated or self.removed or self.metadata)
+
+
+class VaultSnapshot:
+    """
+    Immutable, consistent view of the vault at one committed generation.
+
+    Taking a snapshot is O(1): it holds a reference to the persistent entry
+    map that was current at commit time. Later writes build new maps that
+    share structure with it, so readers on any thread can iterate a snapshot
+    without locks while the vault keeps changing. Entry dicts are shared
+    with the vault and must be treated as read-only.
+    """
+
+    __slots__ = ("_entries", "generation")
+
+    def __init__(self, entries: PersistentMap, generation: int):
+        self._entries = entries
+        self.generation = generation
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[dict]:
+        return self._entries.values()
+
+    def __contains__(self, entry_id: int) -> bool:
+        return entry_id in self._entries
+
+    def get(self, entry_id: int) -> Optional[dict]:
+        return self._entries.get(entry_id)
+
+    def ids(self) -> Iterator[int]:
+        return self._entries.keys()
+
+    def entries(self) -> List[dict]:
+        """All entries in insertion (id) order."""
+        return list(self._entries.values())
@@ -0,0 +1,156 @@
+"""
+LockGuardium Lite - Command Palette
+Prefix trie and decayed frecency scores for the quick switcher
+"""
+
+import re
+import time
+from typing import Dict, Hashable, Iterable, List, Optional, Set, Tuple
+
+_WORD_RE = re.compile(r"[^\W_]+")
+
+
+def words(text: str) -> List[str]:
+    """Lowercased words of ``text`` (the units a palette query matches)."""
+    return _WORD_RE.findall(text.lower())
+
+
+class _TrieNode:
+    __slots__ = ("children", "keys")
+
+    def __init__(self):
+        self.children: Dict[str, "_TrieNode"] = {}
+        # key -> number of that key's words passing through this node
+        self.keys: Dict[Hashable, int] = {}
+
+
+class PrefixTrie:
+    """
+    Maps word prefixes to the keys whose label contains a word with that
+    prefix ("hub" and "git" both find "Git Hub", "gi" finds "GitHub").
+
+    Every node keeps the keys below it, so a lookup is O(len(prefix))
+    plus the size of the answer; no subtree is walked at query time.
+    """
+
+    def __init__(self):
+        self._root = _TrieNode()
+        self._labels: Dict[Hashable, str] = {}
+
+    def __len__(self) -> int:
+        return len(self._labels)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._labels
+
+    def label(self, key: Hashable) -> str:
+        return self._labels[key]
+
+    def keys(self) -> Iterable[Hashable]:
+        return self._labels.keys()
+
+    def add(self, key: Hashable, label: str):
+        """Index ``key`` under every word of ``label`` (replaces an old label)."""
+        if key in self._labels:
+            self.remove(key)
+        self._labels[key] = label
+
+        for word in set(words(label)):
+            node = self._root
+            for char in word:
+                node = node.children.setdefault(char, _TrieNode())
+                node.keys[key] = node.keys.get(key, 0) + 1
+
+    def remove(self, key: Hashable):
+        """Drop ``key``; pruning nodes no other key passes through."""
+        label = self._labels.pop(key, None)
+        if label is None:
+            return
+
+        for word in set(words(label)):
+            node = self._root
+            for char in word:
+                child = node.children[char]
+                count = child.keys[key] - 1
+                if count:
+                    child.keys[key] = count
+                else:
+                    del child.keys[key]
+                if not child.keys:
+                    del node.children[char]
+                    break
+                node = child
+
+    def find(self, prefix: str) -> Set[Hashable]:
+        """Keys with a word starting with ``prefix`` (a single word)."""
+        node = self._root
+        for char in prefix:
+            node = node.children.get(char)
+            if node is None:
+                return set()
+        return set(node.keys) if node is not self._root else set(self._labels)
+
+    def search(self, query: str) -> Set[Hashable]:
+        """Keys matching every word of ``query`` as a prefix."""
+        terms = sorted(set(words(query)), key=len, reverse=True)
+        if not terms:
+            return set(self._labels)
+
+        # The longest term usually has the fewest keys
+        result = self.find(terms[0])
+        for term in terms[1:]:
+            if not result:
+                break
+            result &= self.find(term)
+        return result
+
+
+class Frecency:
+    """
+    Exponentially decayed use counts ("frecency").
+
+    Each use adds 1 to a key's score and the score halves every
+    ``HALF_LIFE`` seconds, so recent and frequent uses both count and old
+    habits fade without any periodic maintenance. Only the score at the
+    last use and its timestamp are stored per key.
+    """
+
+    HALF_LIFE = 7 * 24 * 3600
+
+    def __init__(self, data: Optional[Iterable[Tuple[Hashable, float, float]]] = None):
+        self._data: Dict[Hashable, Tuple[float, float]] = {
+            key: (score, stamp) for key, score, stamp in data or ()
+        }
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._data
+
+    def keys(self) -> Iterable[Hashable]:
+        return self._data.keys()
+
+    def score(self, key: Hashable, now: Optional[float] = None) -> float:
+        """Decayed score of ``key`` at ``now`` (0.0 if never used)."""
+        entry = self._data.get(key)
+        if entry is None:
+            return 0.0
+        score, stamp = entry
+        now = time.time() if now is None else now
+        return score * 0.5 ** (max(now - stamp, 0.0) / self.HALF_LIFE)
+
+    def bump(self, key: Hashable, now: Optional[float] = None) -> float:
+        """Record one use of ``key`` and return its new score."""
+        now = time.time() if now is None else now
+        score = self.score(key, now) + 1.0
+        self._data[key] = (score, now)
+        return score
+
+    def remove(self, key: Hashable):
+        self._data.pop(key, None)
+
+    def dump(self) -> List[list]:
+        """JSON-friendly ``[key, score, stamp]`` rows for ``Frecency(data)``."""
+        items = list(self._data.items())  # May be bumped from another thread
+        return [[key, score, stamp] for key, (score, stamp) in items]
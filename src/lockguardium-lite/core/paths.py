@@ -0,0 +1,13 @@
+"""
+LockGuardium Lite - Paths
+Where the vault lives, importable without the crypto and storage stack
+"""
+
+import os
+
+DEFAULT_VAULT_PATH = os.path.join("data", "vault.lgv")
+
+
+def vault_exists(path: str = DEFAULT_VAULT_PATH) -> bool:
+    """Check whether a vault file has been created at ``path``."""
+    return os.path.isfile(path)
@@ -0,0 +1,217 @@
+"""
+LockGuardium Lite - Persistent Data Structures
+Immutable, structurally shared collections for copy-on-write vault state
+"""
+
+from typing import Any, Callable, Iterable, Iterator, Optional, Tuple
+
+_MASK64 = (1 << 64) - 1
+
+
+def _priority(key: Any) -> int:
+    """Deterministic pseudo-random heap priority for a key (splitmix64 finalizer)."""
+    h = (hash(key) + 0x9E3779B97F4A7C15) & _MASK64
+    h = ((h ^ (h >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    h = ((h ^ (h >> 27)) * 0x94D049BB133111EB) & _MASK64
+    return h ^ (h >> 31)
+
+
+class _Node:
+    """Treap node. Never mutated once it is reachable from a published map."""
+
+    __slots__ = ("key", "value", "priority", "left", "right", "size")
+
+    def __init__(self, key, value, priority, left=None, right=None):
+        self.key = key
+        self.value = value
+        self.priority = priority
+        self.left = left
+        self.right = right
+        self.size = 1 + _size(left) + _size(right)
+
+
+def _size(node: Optional[_Node]) -> int:
+    return node.size if node is not None else 0
+
+
+def _with(node: _Node, left: Optional[_Node], right: Optional[_Node]) -> _Node:
+    return _Node(node.key, node.value, node.priority, left, right)
+
+
+def _insert(node: Optional[_Node], key, value, priority: int) -> _Node:
+    if node is None:
+        return _Node(key, value, priority)
+
+    if key == node.key:
+        return _Node(key, value, node.priority, node.left, node.right)
+
+    if key < node.key:
+        left = _insert(node.left, key, value, priority)
+        if left.priority > node.priority:
+            # Rotate right
+            return _with(left, left.left, _with(node, left.right, node.right))
+        return _with(node, left, node.right)
+
+    right = _insert(node.right, key, value, priority)
+    if right.priority > node.priority:
+        # Rotate left
+        return _with(right, _with(node, node.left, right.left), right.right)
+    return _with(node, node.left, right)
+
+
+def _merge(a: Optional[_Node], b: Optional[_Node]) -> Optional[_Node]:
+    """Merge two treaps where every key in ``a`` is below every key in ``b``."""
+    if a is None:
+        return b
+    if b is None:
+        return a
+    if a.priority > b.priority:
+        return _with(a, a.left, _merge(a.right, b))
+    return _with(b, _merge(a, b.left), b.right)
+
+
+def _delete(node: Optional[_Node], key) -> Optional[_Node]:
+    if node is None:
+        raise KeyError(key)
+    if key == node.key:
+        return _merge(node.left, node.right)
+    if key < node.key:
+        return _with(node, _delete(node.left, key), node.right)
+    return _with(node, node.left, _delete(node.right, key))
+
+
+class PersistentMap:
+    """
+    Immutable ordered map (a treap with path copying).
+
+    ``set`` and ``delete`` return a new map in O(log n) that shares every
+    untouched node with the original, so holding on to an old version costs
+    nothing until it diverges, and unreferenced versions are reclaimed by
+    normal garbage collection. Iteration is in key order.
+    """
+
+    __slots__ = ("_root",)
+
+    def __init__(self, root: Optional[_Node] = None):
+        self._root = root
+
+    @classmethod
+    def from_items(cls, items: Iterable[Tuple[Any, Any]]) -> "PersistentMap":
+        """Build a map in O(n) (O(n log n) if ``items`` are not key-sorted)."""
+        items = list(items)
+        keys = [k for k, _ in items]
+        if any(a >= b for a, b in zip(keys, keys[1:])):
+            items = sorted(dict(items).items(), key=lambda kv: kv[0])
+
+        # Cartesian tree construction over the sorted keys. A node's subtree
+        # is final once it is popped, so sizes are filled in as we go.
+        stack = []
+        for key, value in items:
+            node = _Node(key, value, _priority(key))
+            last = None
+            while stack and stack[-1].priority < node.priority:
+                last = stack.pop()
+                last.size = 1 + _size(last.left) + _size(last.right)
+            node.left = last
+            if stack:
+                stack[-1].right = node
+            stack.append(node)
+
+        for node in reversed(stack):
+            node.size = 1 + _size(node.left) + _size(node.right)
+
+        return cls(stack[0] if stack else None)
+
+    # ===== Queries =====
+
+    def __len__(self) -> int:
+        return _size(self._root)
+
+    def __bool__(self) -> bool:
+        return self._root is not None
+
+    def __contains__(self, key) -> bool:
+        return self._find(key) is not None
+
+    def __getitem__(self, key):
+        node = self._find(key)
+        if node is None:
+            raise KeyError(key)
+        return node.value
+
+    def get(self, key, default=None):
+        node = self._find(key)
+        return node.value if node is not None else default
+
+    def _find(self, key) -> Optional[_Node]:
+        node = self._root
+        while node is not None:
+            if key == node.key:
+                return node
+            node = node.left if key < node.key else node.right
+        return None
+
+    def nth(self, index: int) -> Tuple[Any, Any]:
+        """Return the (key, value) pair at position ``index`` in key order."""
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+
+        node = self._root
+        while True:
+            left = _size(node.left)
+            if index < left:
+                node = node.left
+            elif index == left:
+                return node.key, node.value
+            else:
+                index -= left + 1
+                node = node.right
+
+    def rank(self, key) -> int:
+        """Number of keys strictly below ``key``."""
+        rank = 0
+        node = self._root
+        while node is not None:
+            if key <= node.key:
+                node = node.left
+            else:
+                rank += _size(node.left) + 1
+                node = node.right
+        return rank
+
+    def items(self) -> Iterator[Tuple[Any, Any]]:
+        """Iterate (key, value) pairs in key order."""
+        stack = []
+        node = self._root
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            yield node.key, node.value
+            node = node.right
+
+    def keys(self) -> Iterator[Any]:
+        return (k for k, _ in self.items())
+
+    def values(self) -> Iterator[Any]:
+        return (v for _, v in self.items())
+
+    __iter__ = keys
+
+    # ===== Updates (return new maps) =====
+
+    def set(self, key, value) -> "PersistentMap":
+        """Return a new map with ``key`` bound to ``value``."""
+        return PersistentMap(_insert(self._root, key, value, _priority(key)))
+
+    def delete(self, key) -> "PersistentMap":
+        """Return a new map without ``key`` (KeyError if absent)."""
+        return PersistentMap(_delete(self._root, key))
+
+    def update(self, key, func: Callable[[Any], Any]) -> "PersistentMap":
+        """Return a new map with ``key`` bound to ``func(old_value)``."""
+        return self.set(key, func(self[key]))
+
@@ -0,0 +1,177 @@
+"""
+LockGuardium Lite - Presence Signals
+Whether the user's session screen is locked, where the platform reports it
+"""
+
+import ctypes
+import functools
+import os
+import shutil
+import subprocess
+import sys
+from typing import Optional
+
+# OpenInputDesktop access right needed to probe the input desktop
+_DESKTOP_SWITCHDESKTOP = 0x0100
+
+# What OpenInputDesktop fails with while the secure (lock) desktop is active
+_ERROR_ACCESS_DENIED = 5
+
+# kCFStringEncodingUTF8
+_CF_UTF8 = 0x08000100
+
+
+def screen_locked() -> Optional[bool]:
+    """
+    True if the session's screen is locked, False if it is not, or None if
+    this platform (or desktop environment) doesn't say.
+
+    May block briefly (it can run ``loginctl`` on Linux); call it off the
+    Tk thread.
+    """
+    if sys.platform == "win32":
+        return _windows_locked()
+    if sys.platform == "darwin":
+        return _macos_locked()
+    if sys.platform.startswith("linux"):
+        return _linux_locked()
+    return None
+
+
+@functools.lru_cache(maxsize=1)
+def _user32():
+    """user32 with the signatures used below, or None."""
+    try:
+        from ctypes import wintypes
+
+        user32 = ctypes.WinDLL("user32", use_last_error=True)
+    except (AttributeError, ImportError, OSError):
+        return None
+
+    user32.OpenInputDesktop.restype = wintypes.HANDLE
+    user32.OpenInputDesktop.argtypes = [
+        wintypes.DWORD,
+        wintypes.BOOL,
+        wintypes.DWORD,
+    ]
+    user32.CloseDesktop.restype = wintypes.BOOL
+    user32.CloseDesktop.argtypes = [wintypes.HANDLE]
+    return user32
+
+
+def _windows_locked() -> Optional[bool]:
+    """The input desktop can't be opened while the workstation is locked."""
+    user32 = _user32()
+    if user32 is None:
+        return None
+    desktop = user32.OpenInputDesktop(0, False, _DESKTOP_SWITCHDESKTOP)
+    if not desktop:
+        # Any other failure says nothing about the lock state
+        if ctypes.get_last_error() == _ERROR_ACCESS_DENIED:
+            return True
+        return None
+    user32.CloseDesktop(desktop)
+    return False
+
+
+@functools.lru_cache(maxsize=1)
+def _quartz():
+    """(CoreGraphics, CoreFoundation) with the signatures used below, or None."""
+    try:
+        cg = ctypes.CDLL(
+            "/System/Library/Frameworks/CoreGraphics.framework/CoreGraphics"
+        )
+        cf = ctypes.CDLL(
+            "/System/Library/Frameworks/CoreFoundation.framework/CoreFoundation"
+        )
+    except OSError:
+        return None
+
+    cg.CGSessionCopyCurrentDictionary.restype = ctypes.c_void_p
+    cf.CFStringCreateWithCString.restype = ctypes.c_void_p
+    cf.CFStringCreateWithCString.argtypes = [
+        ctypes.c_void_p,
+        ctypes.c_char_p,
+        ctypes.c_uint32,
+    ]
+    cf.CFDictionaryGetValue.restype = ctypes.c_void_p
+    cf.CFDictionaryGetValue.argtypes = [ctypes.c_void_p, ctypes.c_void_p]
+    cf.CFBooleanGetValue.restype = ctypes.c_bool
+    cf.CFBooleanGetValue.argtypes = [ctypes.c_void_p]
+    cf.CFRelease.argtypes = [ctypes.c_void_p]
+    return cg, cf
+
+
+def _macos_locked() -> Optional[bool]:
+    """Read CGSSessionScreenIsLocked from the current Quartz session."""
+    libraries = _quartz()
+    if libraries is None:
+        return None
+    cg, cf = libraries
+
+    session = cg.CGSessionCopyCurrentDictionary()
+    if not session:
+        return None
+    try:
+        key = cf.CFStringCreateWithCString(None, b"CGSSessionScreenIsLocked", _CF_UTF8)
+        try:
+            value = cf.CFDictionaryGetValue(session, key)
+        finally:
+            cf.CFRelease(key)
+        return bool(value) and cf.CFBooleanGetValue(value)
+    finally:
+        cf.CFRelease(session)
+
+
+# Found once, then reused; lookups that fail are retried on the next probe
+_found = {}
+
+
+def _loginctl_path() -> Optional[str]:
+    if "loginctl" not in _found:
+        path = shutil.which("loginctl")
+        if path is None:
+            return None
+        _found["loginctl"] = path
+    return _found["loginctl"]
+
+
+def _loginctl(*args: str) -> Optional[str]:
+    """Output of ``loginctl args...``, or None if it isn't there or fails."""
+    loginctl = _loginctl_path()
+    if loginctl is None:
+        return None
+    try:
+        result = subprocess.run(
+            [loginctl, *args], capture_output=True, text=True, timeout=2
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return result.stdout.strip() if result.returncode == 0 else None
+
+
+def _linux_session() -> Optional[str]:
+    """This process's logind session, kept once it has been found."""
+    if "session" not in _found:
+        session = os.environ.get("XDG_SESSION_ID")
+        if not session:
+            # Started outside the session (e.g. from a launcher); use the
+            # user's display, which may not exist yet
+            uid = str(os.getuid())
+            session = _loginctl("show-user", uid, "-p", "Display", "--value")
+        if not session:
+            return None
+        _found["session"] = session
+    return _found["session"]
+
+
+def _linux_locked() -> Optional[bool]:
+    """Ask logind for the session's LockedHint (set by GNOME, KDE and others)."""
+    session = _linux_session()
+    if not session:
+        return None
+
+    value = _loginctl("show-session", session, "-p", "LockedHint", "--value")
+    if value not in ("yes", "no"):
+        return None
+    return value == "yes"
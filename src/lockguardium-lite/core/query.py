@@ -0,0 +1,432 @@
+"""
+LockGuardium Lite - Query Language
+Parses vault search queries and plans them against the search indexes
+
+Syntax (terms are ANDed unless joined with OR):
+
+    github                      any search field contains "github"
+    service:git email:@corp.com field-qualified substring match
+    service:=GitHub             exact (case-insensitive) field value
+    service:="Git Hub"          quoted values may contain spaces
+    -username:admin / NOT ...   negation
+    a OR b, a | b, ( ... )      alternatives and grouping
+    modified:<30d created:>1y   relative age (d, w, m, y)
+    modified:>=2024-01-01       absolute date comparison
+    created:2024-01-01..2024-06-30  inclusive date range
+"""
+
+import re
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from typing import Callable, Iterable, List, Optional, Set, Union
+
+from core.search import (
+    DATE_FIELDS,
+    SEARCH_FIELDS,
+    ExactIndex,
+    NGramIndex,
+    RecencyIndex,
+)
+
+# Qualifier names accepted in queries -> entry field
+FIELD_ALIASES = {
+    "service": "service",
+    "site": "service",
+    "email": "email",
+    "mail": "email",
+    "username": "username",
+    "user": "username",
+    "created": "created_at",
+    "modified": "modified_at",
+}
+
+_UNIT_DAYS = {"d": 1, "w": 7, "m": 30, "y": 365}
+
+_TOKEN = re.compile(
+    r"\s*(?:(?P<lparen>\()|(?P<rparen>\))|(?P<bar>\|)"
+    r'|(?P<term>-?(?:[A-Za-z]+:)?(?:(?:<=|>=|<|>|=)?"[^"]*"|[^\s()|"]+)))'
+)
+_RELATIVE = re.compile(r"^(\d+)([dwmy])$")
+_COMPARISON = re.compile(r"^(<=|>=|<|>|=)?(.*)$")
+_QUOTED = re.compile(r'^(<=|>=|<|>|=)?"(.*)"$')
+
+
+class QueryError(ValueError):
+    """Raised for a query that cannot be parsed."""
+
+
+# ===== Syntax Tree =====
+
+
+@dataclass
+class Text:
+    """Substring (or exact) match on one field, or on any search field."""
+
+    field: Optional[str]
+    value: str
+    exact: bool = False
+
+    def matches(self, entry: dict) -> bool:
+        fields = SEARCH_FIELDS if self.field is None else (self.field,)
+        for name in fields:
+            text = (entry.get(name) or "").lower()
+            if (text == self.value) if self.exact else (self.value in text):
+                return True
+        return False
+
+
+@dataclass
+class DateRange:
+    """Inclusive date range on a date field; None bounds are open."""
+
+    field: str
+    start: Optional[str] = None
+    end: Optional[str] = None
+
+    def matches(self, entry: dict) -> bool:
+        value = entry.get(self.field) or ""
+        if not value:
+            return False
+        if self.start is not None and value < self.start:
+            return False
+        return self.end is None or value <= self.end
+
+
+@dataclass
+class Not:
+    child: "Node"
+
+    def matches(self, entry: dict) -> bool:
+        return not self.child.matches(entry)
+
+
+@dataclass
+class And:
+    children: List["Node"] = field(default_factory=list)
+
+    def matches(self, entry: dict) -> bool:
+        return all(child.matches(entry) for child in self.children)
+
+
+@dataclass
+class Or:
+    children: List["Node"] = field(default_factory=list)
+
+    def matches(self, entry: dict) -> bool:
+        return any(child.matches(entry) for child in self.children)
+
+
+Node = Union[Text, DateRange, Not, And, Or]
+
+
+# ===== Parser =====
+
+
+def is_structured(text: str) -> bool:
+    """Whether ``text`` uses query syntax rather than being a plain search."""
+    for match in _TOKEN.finditer(text):
+        if match.group("lparen") or match.group("bar"):
+            return True
+        term = match.group("term")
+        if term is None:
+            continue
+        if term in ("OR", "AND", "NOT") or (term.startswith("-") and len(term) > 1):
+            return True
+        name, sep, _ = term.partition(":")
+        if sep and name.lower() in FIELD_ALIASES:
+            return True
+    return False
+
+
+def _tokenize(text: str) -> List[tuple]:
+    tokens = []
+    pos = 0
+    text = text.rstrip()
+    while pos < len(text):
+        match = _TOKEN.match(text, pos)
+        if match is None:
+            raise QueryError(f"Unexpected character at position {pos + 1}")
+        kind = match.lastgroup
+        value = match.group(kind)
+        pos = match.end()
+
+        # A qualifier written apart from its value: service: "Git Hub"
+        if (
+            kind == "term"
+            and value not in ("OR", "AND", "NOT")
+            and tokens
+            and _is_bare_qualifier(tokens[-1])
+        ):
+            tokens[-1] = ("term", tokens[-1][1] + value)
+            continue
+        tokens.append((kind, value))
+    return tokens
+
+
+def _is_bare_qualifier(token: tuple) -> bool:
+    kind, value = token
+    name = value[1:] if value.startswith("-") else value
+    return kind == "term" and name.endswith(":") and name[:-1].lower() in FIELD_ALIASES
+
+
+def _parse_date(value: str) -> date:
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        raise QueryError(f"Invalid date: {value!r} (use YYYY-MM-DD)")
+
+
+def _date_predicate(name: str, value: str, today: date) -> DateRange:
+    """Compile a date qualifier value into an inclusive DateRange."""
+    if ".." in value:
+        start, _, end = value.partition("..")
+        return DateRange(
+            name,
+            _parse_date(start).isoformat() if start else None,
+            _parse_date(end).isoformat() if end else None,
+        )
+
+    op, operand = _COMPARISON.match(value).groups()
+    one_day = timedelta(days=1)
+    relative = _RELATIVE.match(operand)
+
+    if relative:
+        # Ages: "<30d" means less than 30 days old, i.e. a later date
+        days = int(relative.group(1)) * _UNIT_DAYS[relative.group(2)]
+        cutoff = today - timedelta(days=days)
+        bounds = {
+            None: (cutoff, None),
+            "<": (cutoff + one_day, None),
+            "<=": (cutoff, None),
+            ">": (None, cutoff - one_day),
+            ">=": (None, cutoff),
+            "=": (cutoff, cutoff),
+        }[op]
+    else:
+        day = _parse_date(operand)
+        bounds = {
+            None: (day, day),
+            "=": (day, day),
+            "<": (None, day - one_day),
+            "<=": (None, day),
+            ">": (day + one_day, None),
+            ">=": (day, None),
+        }[op]
+
+    start, end = bounds
+    return DateRange(
+        name,
+        start.isoformat() if start else None,
+        end.isoformat() if end else None,
+    )
+
+
+def _parse_term(term: str, today: date) -> Node:
+    negate = term.startswith("-") and len(term) > 1
+    if negate:
+        term = term[1:]
+
+    name, sep, value = term.partition(":")
+    target = FIELD_ALIASES.get(name.lower()) if sep else None
+    if target is None:
+        name, value = None, term  # Plain text (may itself contain ':')
+
+    # Quotes may follow an operator: service:="Git Hub", created:>="2024-01-01"
+    quoted = _QUOTED.match(value)
+    if quoted:
+        value = (quoted.group(1) or "") + quoted.group(2)
+
+    if target in DATE_FIELDS:
+        node = _date_predicate(target, value, today)
+    else:
+        exact = value.startswith("=")
+        if exact:
+            value = value[1:]
+        if not value:
+            raise QueryError(f"Missing value in {term!r}")
+        node = Text(target, value.lower(), exact)
+
+    return Not(node) if negate else node
+
+
+class _Parser:
+    def __init__(self, tokens: List[tuple], today: date):
+        self.tokens = tokens
+        self.pos = 0
+        self.today = today
+
+    def peek(self) -> Optional[tuple]:
+        return self.tokens[self.pos] if self.pos < len(self.tokens) else None
+
+    def take(self) -> tuple:
+        token = self.tokens[self.pos]
+        self.pos += 1
+        return token
+
+    def is_or(self, token: Optional[tuple]) -> bool:
+        return token is not None and (token[0] == "bar" or token == ("term", "OR"))
+
+    def parse_or(self) -> Node:
+        children = [self.parse_and()]
+        while self.is_or(self.peek()):
+            self.take()
+            children.append(self.parse_and())
+        return children[0] if len(children) == 1 else Or(children)
+
+    def parse_and(self) -> Node:
+        children = []
+        while True:
+            token = self.peek()
+            if token is None or token[0] == "rparen" or self.is_or(token):
+                break
+            if token == ("term", "AND"):
+                self.take()
+                continue
+            children.append(self.parse_unary())
+        if not children:
+            raise QueryError("Expected a search term")
+        return children[0] if len(children) == 1 else And(children)
+
+    def parse_unary(self) -> Node:
+        kind, value = self.take()
+        if (kind, value) == ("term", "NOT"):
+            if self.peek() is None:
+                raise QueryError("Expected a search term after NOT")
+            return Not(self.parse_unary())
+        if kind == "lparen":
+            node = self.parse_or()
+            if self.peek() is None or self.take()[0] != "rparen":
+                raise QueryError("Missing closing parenthesis")
+            return node
+        if kind == "term":
+            return _parse_term(value, self.today)
+        raise QueryError(f"Unexpected {value!r}")
+
+
+def parse_query(text: str, today: Optional[date] = None) -> Node:
+    """
+    Parse a search query into a syntax tree.
+
+    Args:
+        text: Query text (see module docstring)
+        today: Reference date for relative ages (defaults to today)
+
+    Raises:
+        QueryError: If the query is malformed
+    """
+    parser = _Parser(_tokenize(text), today or date.today())
+    node = parser.parse_or()
+    if parser.peek() is not None:
+        raise QueryError(f"Unexpected {parser.peek()[1]!r}")
+    return node
+
+
+# ===== Planner =====
+
+
+class QueryPlanner:
+    """
+    Runs a parsed query against the search indexes.
+
+    Each indexable predicate can produce a candidate id set: exact values
+    from the ExactIndex, substrings of three or more characters from the
+    NGramIndex and date ranges from the RecencyIndex. For a conjunction the
+    planner starts from the child with the smallest estimated result and
+    only narrows further while the next index lookup is cheaper than
+    verifying. The surviving candidates are then checked against the full
+    query, so negations and short terms are applied by scanning them.
+    """
+
+    def __init__(
+        self,
+        ngrams: NGramIndex,
+        exact: ExactIndex,
+        recency: RecencyIndex,
+        all_ids: Callable[[], Iterable[int]],
+    ):
+        self.ngrams = ngrams
+        self.exact = exact
+        self.recency = recency
+        self.all_ids = all_ids
+
+    def estimate(self, node: Node) -> Optional[int]:
+        """Upper bound on the candidates ``node`` yields; None if unindexed."""
+        if isinstance(node, Text):
+            if node.exact:
+                return self.exact.count(node.field, node.value)
+            if len(node.value) >= NGramIndex.N:
+                return self.ngrams.estimate(node.value)
+            return None
+        if isinstance(node, DateRange):
+            return self.recency.count(node.field, node.start, node.end)
+        if isinstance(node, And):
+            estimates = [e for e in map(self.estimate, node.children) if e is not None]
+            return min(estimates) if estimates else None
+        if isinstance(node, Or):
+            estimates = [self.estimate(child) for child in node.children]
+            return None if None in estimates else sum(estimates)
+        return None
+
+    def candidates(
+        self, node: Node, within: Optional[Set[int]] = None
+    ) -> Optional[Set[int]]:
+        """
+        Superset of the ids matching ``node`` (restricted to ``within``),
+        or None when no index applies.
+        """
+        if isinstance(node, Text):
+            if node.exact:
+                ids = self.exact.lookup(node.field, node.value)
+            elif len(node.value) >= NGramIndex.N:
+                return set(self.ngrams.search(node.value, within))
+            else:
+                return None
+        elif isinstance(node, DateRange):
+            ids = set(self.recency.range(node.field, node.start, node.end))
+        elif isinstance(node, And):
+            return self._and_candidates(node, within)
+        elif isinstance(node, Or):
+            ids = set()
+            for child in node.children:
+                child_ids = self.candidates(child, within)
+                if child_ids is None:
+                    return None
+                ids |= child_ids
+        else:
+            return None
+        return ids if within is None else ids & within
+
+    def _and_candidates(
+        self, node: And, within: Optional[Set[int]]
+    ) -> Optional[Set[int]]:
+        planned = sorted(
+            (estimate, i)
+            for i, estimate in enumerate(map(self.estimate, node.children))
+            if estimate is not None
+        )
+        result = within
+        for estimate, i in planned:
+            if result is not None and estimate > 4 * len(result):
+                break  # Cheaper to verify what is left
+            result = self.candidates(node.children[i], result)
+        return result
+
+    def execute(
+        self, node: Node, get_entry: Callable[[int], Optional[dict]]
+    ) -> List[int]:
+        """
+        Ids of entries matching ``node``, in insertion (id) order.
+
+        Args:
+            node: Parsed query
+            get_entry: Resolves an id to its entry (e.g. ``snapshot.get``)
+        """
+        candidates = self.candidates(node)
+        ids = self.all_ids() if candidates is None else candidates
+        result = []
+        for doc_id in ids:
+            entry = get_entry(doc_id)
+            if entry is not None and node.matches(entry):
+                result.append(doc_id)
+        result.sort()
+        return result
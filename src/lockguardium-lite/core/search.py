@@ -0,0 +1,785 @@
+"""
+LockGuardium Lite - Search Indexes
+In-memory indexes over the non-secret entry fields
+"""
+
+import bisect
+import functools
+import hashlib
+import heapq
+import json
+import re
+import struct
+import sys
+from array import array
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+# Entry fields that free-text search looks at (never the password)
+SEARCH_FIELDS = ("service", "email", "username")
+
+# Joins fields in an indexed document so no n-gram spans two fields
+FIELD_SEPARATOR = "\x00"
+
+# Array typecode for posting lists (entry ids are small positive integers)
+_ID_TYPE = "I"
+
+_DUMP_LENGTH = struct.Struct(">I")
+
+# Bytes of each document's digest in a dump (enough to spot edits)
+_DIGEST_SIZE = 8
+
+
+def _digest(text: str) -> bytes:
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=_DIGEST_SIZE).digest()
+
+
+def searchable_text(entry: dict) -> str:
+    """Normalized text an entry is matched against."""
+    return FIELD_SEPARATOR.join(
+        (entry.get(field) or "").lower() for field in SEARCH_FIELDS
+    )
+
+
+class NGramIndex:
+    """
+    Trigram inverted index for case-insensitive substring search.
+
+    A query is answered by intersecting the posting lists of its trigrams,
+    starting from the rarest, and verifying the surviving candidates with a
+    real substring test. Because every candidate is verified, postings may
+    safely contain stale ids: deleting or editing an entry only updates the
+    document table, and stale postings are dropped on the next compaction.
+
+    Postings are stored as a compact, id-sorted ``array`` built in bulk plus
+    a small ``set`` delta for incremental additions.
+    """
+
+    N = 3
+
+    # Stop intersecting once this few candidates remain; verifying is cheaper
+    VERIFY_THRESHOLD = 64
+
+    def __init__(self):
+        self._docs: Dict[int, str] = {}
+        self._base: Dict[str, array] = {}
+        self._delta: Dict[str, Set[int]] = {}
+        self._stale = 0
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    def __contains__(self, doc_id: int) -> bool:
+        return doc_id in self._docs
+
+    @classmethod
+    def grams(cls, text: str) -> Set[str]:
+        """Distinct n-grams of ``text`` that don't cross a field boundary."""
+        n = cls.N
+        return {
+            text[i : i + n]
+            for i in range(len(text) - n + 1)
+            if FIELD_SEPARATOR not in text[i : i + n]
+        }
+
+    # ===== Building =====
+
+    def build(self, entries: Iterable[dict]):
+        """Replace the index contents with ``entries`` (bulk, id-sorted)."""
+        self.build_from_documents(
+            (entry["id"], searchable_text(entry)) for entry in entries
+        )
+
+    def build_from_documents(self, documents: Iterable[Tuple[int, str]]):
+        """Bulk-build from (id, normalized text) pairs."""
+        docs = dict(documents)
+        lists: Dict[str, List[int]] = {}
+        for doc_id in sorted(docs):
+            for gram in self.grams(docs[doc_id]):
+                posting = lists.get(gram)
+                if posting is None:
+                    lists[gram] = [doc_id]
+                else:
+                    posting.append(doc_id)
+
+        self._docs = docs
+        self._base = {gram: array(_ID_TYPE, ids) for gram, ids in lists.items()}
+        self._delta = {}
+        self._stale = 0
+
+    def compact(self):
+        """Fold the delta into the base postings and drop stale ids."""
+        self.build_from_documents(self._docs.items())
+
+    def dump(self) -> bytes:
+        """Serialize the postings (delta folded into base) for ``restore``."""
+        grams: List[str] = []
+        counts: List[int] = []
+        chunks: List[bytes] = []
+        for gram in self._base.keys() | self._delta.keys():
+            posting = self._base.get(gram, array(_ID_TYPE))
+            extra = self._delta.get(gram)
+            if extra:
+                posting = array(_ID_TYPE, sorted(extra.union(posting)))
+            grams.append(gram)
+            counts.append(len(posting))
+            chunks.append(posting.tobytes())
+
+        # A digest per document lets restore find edits nobody recorded
+        ids = array(_ID_TYPE, sorted(self._docs))
+        chunks.append(ids.tobytes())
+        chunks.extend(_digest(self._docs[doc_id]) for doc_id in ids)
+
+        meta = {
+            "n": self.N,
+            "itemsize": array(_ID_TYPE).itemsize,
+            "byteorder": sys.byteorder,
+            "grams": grams,
+            "counts": counts,
+            "docs": len(ids),
+        }
+        raw = json.dumps(meta, separators=(",", ":")).encode("utf-8")
+        return _DUMP_LENGTH.pack(len(raw)) + raw + b"".join(chunks)
+
+    @classmethod
+    def restore(
+        cls,
+        documents: Iterable[Tuple[int, str]],
+        data: bytes,
+        touched: Optional[Iterable[int]] = (),
+    ) -> "NGramIndex":
+        """
+        Recreate an index from ``dump()`` output without re-tokenizing.
+
+        Args:
+            documents: Current (id, normalized text) pairs
+            data: Bytes produced by ``dump``
+            touched: Ids changed since the dump; they are re-indexed. None
+                if unknown: every document whose text no longer matches its
+                digest in the dump is re-indexed instead.
+
+        Raises:
+            ValueError: If ``data`` is malformed or from another platform
+        """
+        (length,) = _DUMP_LENGTH.unpack_from(data)
+        start = _DUMP_LENGTH.size
+        meta = json.loads(bytes(data[start : start + length]).decode("utf-8"))
+        itemsize = array(_ID_TYPE).itemsize
+        if (
+            meta["n"] != cls.N
+            or meta["itemsize"] != itemsize
+            or meta["byteorder"] != sys.byteorder
+        ):
+            raise ValueError("Index dump was written with an incompatible layout")
+
+        index = cls()
+        index._docs = dict(documents)
+        view = memoryview(data)
+        pos = start + length
+        for gram, count in zip(meta["grams"], meta["counts"]):
+            end = pos + count * itemsize
+            posting = array(_ID_TYPE)
+            posting.frombytes(view[pos:end])
+            index._base[gram] = posting
+            pos = end
+
+        digests_at = pos + meta["docs"] * itemsize
+        if digests_at + meta["docs"] * _DIGEST_SIZE != len(data):
+            raise ValueError("Truncated index dump")
+
+        if touched is None:
+            ids = array(_ID_TYPE)
+            ids.frombytes(view[pos:digests_at])
+            dumped = {
+                doc_id: bytes(view[at : at + _DIGEST_SIZE])
+                for doc_id, at in zip(ids, range(digests_at, len(data), _DIGEST_SIZE))
+            }
+            touched = [
+                doc_id
+                for doc_id, text in index._docs.items()
+                if dumped.get(doc_id) != _digest(text)
+            ]
+
+        for doc_id in set(touched):
+            text = index._docs.get(doc_id)
+            if text is None:
+                continue
+            for gram in cls.grams(text):
+                index._delta.setdefault(gram, set()).add(doc_id)
+            index._stale += 1
+        return index
+
+    # ===== Incremental updates =====
+
+    def add(self, entry: dict):
+        """Index a new entry, or re-index an edited one."""
+        doc_id = entry["id"]
+        text = searchable_text(entry)
+        old = self._docs.get(doc_id)
+        if old == text:
+            return
+
+        old_grams = self.grams(old) if old is not None else set()
+        if old is not None:
+            self._stale += 1
+        self._docs[doc_id] = text
+
+        for gram in self.grams(text) - old_grams:
+            posting = self._delta.get(gram)
+            if posting is None:
+                self._delta[gram] = {doc_id}
+            else:
+                posting.add(doc_id)
+
+        self._maybe_compact()
+
+    update = add
+
+    def remove(self, doc_id: int):
+        """Forget an entry; its postings become stale and are skipped."""
+        if self._docs.pop(doc_id, None) is not None:
+            self._stale += 1
+            self._maybe_compact()
+
+    def _maybe_compact(self):
+        if self._stale > max(1024, len(self._docs) // 4):
+            self.compact()
+
+    # ===== Queries =====
+
+    def text(self, doc_id: int) -> Optional[str]:
+        """Normalized indexed text of an entry."""
+        return self._docs.get(doc_id)
+
+    def posting_size(self, gram: str) -> int:
+        """Upper bound on the number of documents containing ``gram``."""
+        return len(self._base.get(gram, ())) + len(self._delta.get(gram, ()))
+
+    def estimate(self, query: str) -> int:
+        """Cheap upper bound on the result size for ``query``."""
+        query = query.lower()
+        if len(query) < self.N:
+            return len(self._docs)
+        return min(self.posting_size(g) for g in self.grams(query))
+
+    def search(self, query: str, candidates: Optional[Set[int]] = None) -> List[int]:
+        """
+        Ids of entries whose searchable fields contain ``query``.
+
+        Args:
+            query: Case-insensitive substring
+            candidates: Optional id set to restrict the search to
+
+        Returns:
+            Matching ids in ascending (insertion) order
+        """
+        query = query.lower()
+        docs = self._docs
+
+        if not query:
+            ids = docs.keys() if candidates is None else candidates
+            return sorted(i for i in ids if i in docs)
+
+        if len(query) < self.N:
+            # Too short for trigrams: scan the (already lowercased) documents
+            if candidates is None:
+                return sorted(i for i, text in docs.items() if query in text)
+            return sorted(i for i in candidates if i in docs and query in docs[i])
+
+        grams = sorted(self.grams(query), key=self.posting_size)
+        if candidates is None:
+            candidates = self._posting(grams[0])
+            grams = grams[1:]
+        else:
+            candidates = set(candidates)
+
+        # Intersect with the next-rarest postings while that is cheaper than
+        # verifying; grams are sorted, so once one is too large all are.
+        for gram in grams:
+            if len(candidates) <= self.VERIFY_THRESHOLD:
+                break
+            if self.posting_size(gram) > 4 * len(candidates):
+                break
+            narrowed = candidates.intersection(self._base.get(gram, ()))
+            narrowed.update(candidates.intersection(self._delta.get(gram, ())))
+            candidates = narrowed
+
+        return sorted(i for i in candidates if query in docs.get(i, FIELD_SEPARATOR))
+
+    def _posting(self, gram: str) -> Set[int]:
+        result = set(self._base.get(gram, ()))
+        result.update(self._delta.get(gram, ()))
+        return result
+
+
+# Characters that start a new "word" inside a field (github.com, john_doe...)
+_WORD_BOUNDARY = re.compile(r"(?:^|(?<=[^A-Za-z0-9]))[A-Za-z0-9]|(?<=[a-z])[A-Z]")
+
+_MASK_BITS = {c: i for i, c in enumerate("abcdefghijklmnopqrstuvwxyz0123456789")}
+
+
+@functools.lru_cache(maxsize=64)
+def subsequence_pattern(query: str) -> "re.Pattern":
+    """Regex matching ``query`` as a subsequence within a single field."""
+    gap = "[^%s]*?" % re.escape(FIELD_SEPARATOR)
+    return re.compile(gap.join(re.escape(c) for c in query))
+
+
+def char_mask(text: str) -> int:
+    """Bit set of the letters and digits in lowercased ``text``."""
+    mask = 0
+    for c in set(text):
+        bit = _MASK_BITS.get(c)
+        if bit is not None:
+            mask |= 1 << bit
+    return mask
+
+
+def normalize_query(query: str) -> str:
+    """Lowercase a fuzzy query and drop its whitespace."""
+    return "".join(query.lower().split())
+
+
+class _FieldValue:
+    """One distinct field value and the entries that carry it."""
+
+    __slots__ = ("lowered", "starts", "mask", "ids")
+
+    def __init__(self, value: str):
+        self.lowered = value.lower()
+        self.starts = sum(1 << m.start() for m in _WORD_BOUNDARY.finditer(value))
+        self.mask = char_mask(self.lowered)
+        self.ids: Set[int] = set()
+
+
+# (-score, length, sequence, field index, value) - ordered best first
+FuzzyHit = Tuple[int, int, int, int, _FieldValue]
+
+
+class FuzzyIndex:
+    """
+    Ranked fuzzy (subsequence) matching over the searchable fields.
+
+    A query matches a field when its characters appear in order, so "gthb"
+    finds "GitHub". Matches are scored per field, rewarding prefix,
+    word-boundary and consecutive hits and penalizing gaps; service matches
+    get an extra bonus.
+
+    Scoring works on distinct field values rather than entries - vaults
+    repeat the same emails, usernames and services many times - and each
+    value keeps its lowercased text, word starts and character mask
+    precomputed. Values are filtered by mask and a compiled subsequence
+    regex, scored once, and popped best-first from a heap until ``k``
+    entries are collected; the first hit for an entry is its best field.
+    """
+
+    SCORE_MATCH = 16
+    BONUS_PREFIX = 24
+    BONUS_BOUNDARY = 12
+    BONUS_CONSECUTIVE = 8
+    PENALTY_GAP_START = 3
+    PENALTY_GAP_EXTEND = 1
+
+    # Added to a field's score, in SEARCH_FIELDS order
+    FIELD_BONUS = (20, 0, 0)
+
+    def __init__(self):
+        self._docs: Dict[int, Tuple[str, ...]] = {}
+        self._values: Tuple[Dict[str, _FieldValue], ...] = tuple(
+            {} for _ in SEARCH_FIELDS
+        )
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    def __contains__(self, doc_id: int) -> bool:
+        return doc_id in self._docs
+
+    def build(self, entries: Iterable[dict]):
+        """Replace the index contents with ``entries``."""
+        self._docs = {}
+        self._values = tuple({} for _ in SEARCH_FIELDS)
+        for entry in entries:
+            self.add(entry)
+
+    def add(self, entry: dict):
+        """Index a new entry, or re-index an edited one."""
+        doc_id = entry["id"]
+        values = tuple(entry.get(field) or "" for field in SEARCH_FIELDS)
+        if self._docs.get(doc_id) == values:
+            return
+
+        self.remove(doc_id)
+        self._docs[doc_id] = values
+        for table, value in zip(self._values, values):
+            field_value = table.get(value)
+            if field_value is None:
+                field_value = table[value] = _FieldValue(value)
+            field_value.ids.add(doc_id)
+
+    update = add
+
+    def remove(self, doc_id: int):
+        """Forget an entry."""
+        values = self._docs.pop(doc_id, None)
+        if values is None:
+            return
+        for table, value in zip(self._values, values):
+            field_value = table[value]
+            field_value.ids.discard(doc_id)
+            if not field_value.ids:
+                del table[value]
+
+    @classmethod
+    def _score_positions(cls, positions: Iterable[int], starts: int) -> int:
+        score = 0
+        prev = -1
+        for pos in positions:
+            score += cls.SCORE_MATCH
+            if pos == 0:
+                score += cls.BONUS_PREFIX
+            elif starts >> pos & 1:
+                score += cls.BONUS_BOUNDARY
+            if prev >= 0:
+                if pos == prev + 1:
+                    score += cls.BONUS_CONSECUTIVE
+                else:
+                    score -= cls.PENALTY_GAP_START
+                    score -= (pos - prev - 2) * cls.PENALTY_GAP_EXTEND
+            prev = pos
+        return score
+
+    @classmethod
+    def score_field(cls, query: str, text: str, starts: int) -> Optional[int]:
+        """
+        Score ``query`` against one lowercased field.
+
+        The alignment is found greedily left to right and then tightened
+        right to left; a contiguous occurrence is also tried. Returns None
+        when ``query`` is not a subsequence of ``text``.
+        """
+        pos = -1
+        for ch in query:
+            pos = text.find(ch, pos + 1)
+            if pos < 0:
+                return None
+
+        positions = [pos]
+        for ch in reversed(query[:-1]):
+            pos = text.rfind(ch, 0, pos)
+            positions.append(pos)
+        positions.reverse()
+        best = cls._score_positions(positions, starts)
+
+        found = text.find(query)
+        if found >= 0:
+            contiguous = range(found, found + len(query))
+            best = max(best, cls._score_positions(contiguous, starts))
+        return best
+
+    def score(self, query: str, doc_id: int) -> Optional[int]:
+        """Best field score of an entry, or None if nothing matches."""
+        query = normalize_query(query)
+        best = None
+        for i, (table, value) in enumerate(zip(self._values, self._docs[doc_id])):
+            field_value = table[value]
+            result = self.score_field(query, field_value.lowered, field_value.starts)
+            if result is not None and (
+                best is None or result + self.FIELD_BONUS[i] > best
+            ):
+                best = result + self.FIELD_BONUS[i]
+        return best
+
+    def matches(
+        self, query: str, within: Optional[List[FuzzyHit]] = None
+    ) -> List[FuzzyHit]:
+        """
+        Score every distinct field value that ``query`` matches.
+
+        Args:
+            query: Normalized query (see ``normalize_query``)
+            within: Hits of a query that ``query`` extends; since a longer
+                query can only match fewer values, only these are re-checked
+
+        Returns:
+            Unordered hits to pass to ``select``
+        """
+        qmask = char_mask(query)
+        match = subsequence_pattern(query).search
+
+        if within is None:
+            values = (
+                (i, field_value)
+                for i, table in enumerate(self._values)
+                for field_value in table.values()
+            )
+        else:
+            values = ((hit[3], hit[4]) for hit in within)
+
+        hits: List[FuzzyHit] = []
+        for i, field_value in values:
+            text = field_value.lowered
+            if qmask & ~field_value.mask or not match(text):
+                continue
+            score = self.score_field(query, text, field_value.starts)
+            score += self.FIELD_BONUS[i]
+            hits.append((-score, len(text), len(hits), i, field_value))
+        return hits
+
+    def select(
+        self, hits: List[FuzzyHit], k: int, candidates: Optional[Set[int]] = None
+    ) -> List[Tuple[int, int]]:
+        """
+        Pick the ``k`` best entries from ``hits`` (which is left untouched).
+
+        Returns:
+            (id, score) pairs, best first
+        """
+        heap = list(hits)
+        heapq.heapify(heap)
+
+        # Best values first; an entry's first appearance is its best score
+        results: List[Tuple[int, int]] = []
+        seen: Set[int] = set()
+        while heap and len(results) < k:
+            neg_score, _, _, _, field_value = heapq.heappop(heap)
+            if candidates is not None and candidates.isdisjoint(field_value.ids):
+                continue
+            for doc_id in sorted(field_value.ids):
+                if doc_id in seen or (
+                    candidates is not None and doc_id not in candidates
+                ):
+                    continue
+                seen.add(doc_id)
+                results.append((doc_id, -neg_score))
+                if len(results) == k:
+                    break
+        return results
+
+    @staticmethod
+    def count(hits: List[FuzzyHit]) -> int:
+        """Number of distinct entries among ``hits``."""
+        ids: Set[int] = set()
+        for hit in hits:
+            ids.update(hit[4].ids)
+        return len(ids)
+
+    def first(self, k: int) -> List[Tuple[int, int]]:
+        """The first ``k`` entries in insertion order (the empty query)."""
+        return [(i, 0) for i in heapq.nsmallest(k, self._docs)]
+
+    def top(
+        self, query: str, k: int, candidates: Optional[Set[int]] = None
+    ) -> List[Tuple[int, int]]:
+        """
+        The ``k`` best matches for ``query``.
+
+        Args:
+            query: Case-insensitive query; whitespace is ignored
+            k: Maximum number of results
+            candidates: Optional id set to restrict the search to
+
+        Returns:
+            (id, score) pairs, best first
+        """
+        query = normalize_query(query)
+        if not query:
+            if candidates is None:
+                return self.first(k)
+            ids = (i for i in candidates if i in self._docs)
+            return [(i, 0) for i in heapq.nsmallest(k, ids)]
+        return self.select(self.matches(query), k, candidates)
+
+
+class ExactIndex:
+    """
+    Exact, case-insensitive field value lookups (``service:=GitHub``).
+    Maps each (field, lowercased value) to the ids that carry it.
+    """
+
+    def __init__(self):
+        self._docs: Dict[int, Tuple[str, ...]] = {}
+        self._values: Tuple[Dict[str, Set[int]], ...] = tuple({} for _ in SEARCH_FIELDS)
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    def build(self, entries: Iterable[dict]):
+        """Replace the index contents with ``entries``."""
+        self._docs = {}
+        self._values = tuple({} for _ in SEARCH_FIELDS)
+        for entry in entries:
+            self.add(entry)
+
+    def add(self, entry: dict):
+        """Index a new entry, or re-index an edited one."""
+        doc_id = entry["id"]
+        values = tuple((entry.get(field) or "").lower() for field in SEARCH_FIELDS)
+        if self._docs.get(doc_id) == values:
+            return
+
+        self.remove(doc_id)
+        self._docs[doc_id] = values
+        for table, value in zip(self._values, values):
+            table.setdefault(value, set()).add(doc_id)
+
+    update = add
+
+    def remove(self, doc_id: int):
+        """Forget an entry."""
+        values = self._docs.pop(doc_id, None)
+        if values is None:
+            return
+        for table, value in zip(self._values, values):
+            ids = table[value]
+            ids.discard(doc_id)
+            if not ids:
+                del table[value]
+
+    def lookup(self, field: Optional[str], value: str) -> Set[int]:
+        """Ids whose ``field`` (any search field if None) equals ``value``."""
+        value = value.lower()
+        if field is not None:
+            return set(self._values[SEARCH_FIELDS.index(field)].get(value, ()))
+        result: Set[int] = set()
+        for table in self._values:
+            result.update(table.get(value, ()))
+        return result
+
+    def count(self, field: Optional[str], value: str) -> int:
+        """Upper bound on ``len(lookup(field, value))``."""
+        value = value.lower()
+        tables = (
+            self._values
+            if field is None
+            else (self._values[SEARCH_FIELDS.index(field)],)
+        )
+        return sum(len(table.get(value, ())) for table in tables)
+
+
+# Entry date fields ("%Y-%m-%d" strings) the recency index covers
+DATE_FIELDS = ("created_at", "modified_at")
+
+
+class RecencyIndex:
+    """
+    Entries ordered by date, for ``modified:<30d`` style range queries.
+    Each date field keeps a sorted list of (date, id) pairs; ranges are
+    answered with two binary searches.
+    """
+
+    def __init__(self):
+        self._docs: Dict[int, Tuple[str, ...]] = {}
+        self._sorted: Tuple[List[Tuple[str, int]], ...] = tuple([] for _ in DATE_FIELDS)
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    def build(self, entries: Iterable[dict]):
+        """Replace the index contents with ``entries``."""
+        self._docs = {
+            entry["id"]: tuple(entry.get(field) or "" for field in DATE_FIELDS)
+            for entry in entries
+        }
+        self._sorted = tuple(
+            sorted((dates[i], doc_id) for doc_id, dates in self._docs.items())
+            for i in range(len(DATE_FIELDS))
+        )
+
+    def add(self, entry: dict):
+        """Index a new entry, or re-index an edited one."""
+        doc_id = entry["id"]
+        dates = tuple(entry.get(field) or "" for field in DATE_FIELDS)
+        if self._docs.get(doc_id) == dates:
+            return
+
+        self.remove(doc_id)
+        self._docs[doc_id] = dates
+        for ordered, date in zip(self._sorted, dates):
+            bisect.insort(ordered, (date, doc_id))
+
+    update = add
+
+    def remove(self, doc_id: int):
+        """Forget an entry."""
+        dates = self._docs.pop(doc_id, None)
+        if dates is None:
+            return
+        for ordered, date in zip(self._sorted, dates):
+            del ordered[bisect.bisect_left(ordered, (date, doc_id))]
+
+    def _bounds(
+        self, field: str, start: Optional[str], end: Optional[str]
+    ) -> Tuple[List[Tuple[str, int]], int, int]:
+        ordered = self._sorted[DATE_FIELDS.index(field)]
+        # Entries without a date ("") never match a range
+        lo = bisect.bisect_left(ordered, (start or "\x01", -1))
+        hi = (
+            len(ordered)
+            if end is None
+            else bisect.bisect_right(ordered, (end, sys.maxsize))
+        )
+        return ordered, lo, hi
+
+    def range(self, field: str, start: Optional[str], end: Optional[str]) -> List[int]:
+        """Ids whose ``field`` lies in [start, end] (None = unbounded)."""
+        ordered, lo, hi = self._bounds(field, start, end)
+        return [doc_id for _, doc_id in ordered[lo:hi]]
+
+    def count(self, field: str, start: Optional[str], end: Optional[str]) -> int:
+        """Exact number of ids ``range`` would return."""
+        _, lo, hi = self._bounds(field, start, end)
+        return max(0, hi - lo)
+
+
+class QueryCache:
+    """
+    Small LRU of search results, valid for one index generation.
+
+    Search-as-you-type mostly extends or shortens the previous query, so
+    besides exact hits the cache can return the result of the longest
+    cached prefix of a query: results for a longer query are always a
+    subset, and the search only needs to refine them.
+    """
+
+    def __init__(self, maxsize: int = 32):
+        self.maxsize = maxsize
+        self.generation: Optional[int] = None
+        self._items: "OrderedDict[Tuple[str, str], Any]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def _check(self, generation: int):
+        if generation != self.generation:
+            self._items.clear()
+            self.generation = generation
+
+    def get(self, kind: str, query: str, generation: int) -> Any:
+        """Cached result for exactly ``query``, or None."""
+        self._check(generation)
+        key = (kind, query)
+        value = self._items.get(key)
+        if value is not None:
+            self._items.move_to_end(key)
+        return value
+
+    def get_prefix(self, kind: str, query: str, generation: int) -> Any:
+        """Cached result for the longest proper prefix of ``query``, or None."""
+        self._check(generation)
+        for end in range(len(query) - 1, 0, -1):
+            value = self._items.get((kind, query[:end]))
+            if value is not None:
+                return value
+        return None
+
+    def put(self, kind: str, query: str, generation: int, value: Any):
+        self._check(generation)
+        self._items[(kind, query)] = value
+        self._items.move_to_end((kind, query))
+        while len(self._items) > self.maxsize:
+            self._items.popitem(last=False)
+
+    def clear(self):
+        self._items.clear()
+        self.generation = None
@@ -0,0 +1,116 @@
+"""
+LockGuardium Lite - Sort Orders
+Per-column entry orders kept sorted under inserts, edits and deletes
+"""
+
+import bisect
+import math
+import unicodedata
+from typing import Dict, Iterable, Iterator, List, Sequence, Tuple
+
+# Columns the vault table can be sorted by
+SORT_FIELDS = ("service", "email", "username")
+
+CollationKey = Tuple[bool, str, str]
+
+
+def collation_key(value: str) -> CollationKey:
+    """
+    Key that orders text the way people read it: case- and accent-
+    insensitive ("éclair" next to "Eclair"), with the raw value as a
+    deterministic tie-break and empty values last.
+    """
+    if value.isascii():
+        folded = value.lower()
+    else:
+        folded = unicodedata.normalize("NFKD", value).casefold()
+        folded = "".join(c for c in folded if not unicodedata.combining(c))
+    return (not value, folded, value)
+
+
+class SortIndex:
+    """
+    Entry ids ordered by each of ``fields``.
+
+    Collation keys are computed once per entry. Every field keeps a sorted
+    list of (key, id) pairs that inserts and deletes maintain with binary
+    searches, so after ``build`` no change (or switch of sort column)
+    re-sorts the vault.
+    """
+
+    def __init__(self, fields: Sequence[str] = SORT_FIELDS):
+        self.fields = tuple(fields)
+        self._docs: Dict[int, Tuple[CollationKey, ...]] = {}
+        self._sorted: Tuple[List[Tuple[CollationKey, int]], ...] = tuple(
+            [] for _ in self.fields
+        )
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    def build(self, entries: Iterable[dict]):
+        """Replace the index contents with ``entries``."""
+        self._docs = {entry["id"]: self._keys(entry) for entry in entries}
+        self._sorted = tuple(
+            sorted((keys[i], doc_id) for doc_id, keys in self._docs.items())
+            for i in range(len(self.fields))
+        )
+
+    def _keys(self, entry: dict) -> Tuple[CollationKey, ...]:
+        return tuple(collation_key(entry.get(field) or "") for field in self.fields)
+
+    def add(self, entry: dict):
+        """Index a new entry, or re-index an edited one."""
+        doc_id = entry["id"]
+        keys = self._keys(entry)
+        old = self._docs.get(doc_id)
+        if old == keys:
+            return
+
+        self._docs[doc_id] = keys
+        for i, ordered in enumerate(self._sorted):
+            if old is not None:
+                if old[i] == keys[i]:
+                    continue
+                del ordered[bisect.bisect_left(ordered, (old[i], doc_id))]
+            bisect.insort(ordered, (keys[i], doc_id))
+
+    update = add
+
+    def remove(self, doc_id: int):
+        """Forget an entry."""
+        keys = self._docs.pop(doc_id, None)
+        if keys is None:
+            return
+        for ordered, key in zip(self._sorted, keys):
+            del ordered[bisect.bisect_left(ordered, (key, doc_id))]
+
+    def ordered(self, field: str, descending: bool = False) -> Iterator[int]:
+        """Every id in ``field`` order."""
+        ordered = self._sorted[self.fields.index(field)]
+        pairs = reversed(ordered) if descending else ordered
+        return (doc_id for _, doc_id in pairs)
+
+    def arrange(
+        self, ids: Sequence[int], field: str, descending: bool = False
+    ) -> List[int]:
+        """
+        Put ``ids`` (e.g. search results) in ``field`` order.
+
+        Small subsets are sorted by their stored keys; large ones are read
+        off the maintained order, whichever is cheaper. Unknown ids are
+        dropped.
+        """
+        n = len(self._docs)
+        if len(ids) * math.log2(len(ids) + 1) < n:
+            i = self.fields.index(field)
+            docs = self._docs
+            known = [doc_id for doc_id in ids if doc_id in docs]
+            return sorted(
+                known, key=lambda doc_id: (docs[doc_id][i], doc_id), reverse=descending
+            )
+
+        wanted = set(ids)
+        return [
+            doc_id for doc_id in self.ordered(field, descending) if doc_id in wanted
+        ]
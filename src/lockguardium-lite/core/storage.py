@@ -0,0 +1,245 @@
+"""
+LockGuardium Lite - Vault Storage
+Encrypted vault file layout and low-level file access
+
+File layout:
+    MAGIC (4 bytes) | header length (4 bytes, big-endian) | JSON header | payload
+
+The header is small and unencrypted (salt, KDF parameters, verifier token,
+generation) so it can be read before the key exists. The payload is a single
+Fernet token holding the encrypted vault entries.
+"""
+
+import base64
+import json
+import mmap
+import os
+import struct
+from dataclasses import dataclass, field
+from typing import List, Tuple
+
+from core.crypto import KDF_ITERATIONS
+from core.paths import DEFAULT_VAULT_PATH, vault_exists
+
+MAGIC = b"LGV1"
+FORMAT_VERSION = 1
+
+_LENGTH = struct.Struct(">I")
+_PREAMBLE_SIZE = len(MAGIC) + _LENGTH.size
+
+
+class StorageError(Exception):
+    """Raised when the vault file is missing, truncated or malformed."""
+
+
+@dataclass
+class VaultHeader:
+    """Unencrypted vault header: everything needed to derive and check the key."""
+
+    salt: bytes
+    iterations: int = KDF_ITERATIONS
+    kdf: str = "pbkdf2-sha256"
+    verifier: bytes = b""
+    generation: int = 0
+    version: int = FORMAT_VERSION
+    extra: dict = field(default_factory=dict)
+
+    def to_bytes(self) -> bytes:
+        """Serialize the header to its on-disk JSON form."""
+        data = {
+            "version": self.version,
+            "kdf": self.kdf,
+            "iterations": self.iterations,
+            "salt": base64.b64encode(self.salt).decode("ascii"),
+            "verifier": self.verifier.decode("ascii"),
+            "generation": self.generation,
+            **self.extra,
+        }
+        return json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+    @classmethod
+    def from_bytes(cls, raw: bytes) -> "VaultHeader":
+        """Parse a header previously written by ``to_bytes``."""
+        try:
+            data = json.loads(raw.decode("utf-8"))
+            return cls(
+                salt=base64.b64decode(data.pop("salt")),
+                iterations=int(data.pop("iterations")),
+                kdf=data.pop("kdf"),
+                verifier=data.pop("verifier").encode("ascii"),
+                generation=int(data.pop("generation", 0)),
+                version=int(data.pop("version")),
+                extra=data,
+            )
+        except (ValueError, KeyError, TypeError) as e:
+            raise StorageError(f"Corrupt vault header: {e}") from e
+
+
+class VaultStorage:
+    """
+    Reads and writes the vault file.
+    Header and payload are accessed separately so callers can start key
+    derivation as soon as the header is known.
+    """
+
+    def __init__(self, path: str = DEFAULT_VAULT_PATH):
+        self.path = path
+
+    def exists(self) -> bool:
+        """Check whether a vault file has been created."""
+        return vault_exists(self.path)
+
+    def read_header(self) -> Tuple[VaultHeader, int]:
+        """
+        Read only the vault header.
+
+        Returns:
+            Tuple of (header, payload_offset)
+        """
+        try:
+            with open(self.path, "rb") as f:
+                preamble = f.read(_PREAMBLE_SIZE)
+                if len(preamble) != _PREAMBLE_SIZE or preamble[:4] != MAGIC:
+                    raise StorageError("Not a LockGuardium vault file")
+                (length,) = _LENGTH.unpack(preamble[4:])
+                raw = f.read(length)
+        except OSError as e:
+            raise StorageError(f"Cannot read vault: {e}") from e
+
+        if len(raw) != length:
+            raise StorageError("Truncated vault header")
+
+        header = VaultHeader.from_bytes(raw)
+        if header.version > FORMAT_VERSION:
+            raise StorageError(f"Unsupported vault version {header.version}")
+        return header, _PREAMBLE_SIZE + length
+
+    def read_payload(self, offset: int) -> bytes:
+        """
+        Read the encrypted payload starting at ``offset``.
+        The file is memory-mapped so the OS can read ahead the whole
+        ciphertext in one pass.
+        """
+        try:
+            with open(self.path, "rb") as f:
+                size = os.fstat(f.fileno()).st_size
+                if size <= offset:
+                    return b""
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    if hasattr(mm, "madvise") and hasattr(mmap, "MADV_SEQUENTIAL"):
+                        mm.madvise(mmap.MADV_SEQUENTIAL)
+                    return mm[offset:]
+        except OSError as e:
+            raise StorageError(f"Cannot read vault: {e}") from e
+
+    def write(self, header: VaultHeader, payload: bytes):
+        """Atomically replace the vault file with a new header and payload."""
+        raw = header.to_bytes()
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(MAGIC)
+            f.write(_LENGTH.pack(len(raw)))
+            f.write(raw)
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+
+
+INDEX_MAGIC = b"LGI1"
+INDEX_SUFFIX = ".idx"
+
+
+class IndexStorage:
+    """
+    Reads and writes the search index file kept next to the vault.
+
+    File layout:
+        INDEX_MAGIC | header length | JSON header | base length | base
+        | (record length | record)*
+
+    The base is rewritten atomically; records are appended after it as a
+    journal of later changes. Both are opaque (encrypted) to this class. A
+    record cut short by a crash is ignored on read.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+
+    @classmethod
+    def for_vault(cls, vault_path: str) -> "IndexStorage":
+        return cls(vault_path + INDEX_SUFFIX)
+
+    def exists(self) -> bool:
+        return os.path.isfile(self.path)
+
+    def read(self) -> Tuple[dict, bytes, List[bytes]]:
+        """
+        Read the whole index file.
+
+        Each chunk is read straight into its own buffer, so the base is
+        copied out of the page cache once; decrypting needs it as bytes,
+        which is all a memory map could have handed out.
+
+        Returns:
+            Tuple of (header, base, journal records)
+        """
+        try:
+            with open(self.path, "rb") as f:
+                if os.fstat(f.fileno()).st_size < _PREAMBLE_SIZE:
+                    raise StorageError("Truncated index file")
+                if f.read(len(INDEX_MAGIC)) != INDEX_MAGIC:
+                    raise StorageError("Not a LockGuardium index file")
+                chunks = []
+                while True:
+                    prefix = f.read(_LENGTH.size)
+                    if len(prefix) < _LENGTH.size:
+                        break
+                    (length,) = _LENGTH.unpack(prefix)
+                    chunk = f.read(length)
+                    if len(chunk) < length:
+                        break  # Torn append
+                    chunks.append(chunk)
+        except OSError as e:
+            raise StorageError(f"Cannot read index: {e}") from e
+
+        if len(chunks) < 2:
+            raise StorageError("Truncated index file")
+        try:
+            header = json.loads(chunks[0].decode("utf-8"))
+        except ValueError as e:
+            raise StorageError(f"Corrupt index header: {e}") from e
+        return header, chunks[1], chunks[2:]
+
+    def write(self, header: dict, base: bytes):
+        """Atomically replace the index with a new base and an empty journal."""
+        raw = json.dumps(header, separators=(",", ":")).encode("utf-8")
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(INDEX_MAGIC)
+            f.write(_LENGTH.pack(len(raw)))
+            f.write(raw)
+            f.write(_LENGTH.pack(len(base)))
+            f.write(base)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+
+    def append(self, *records: bytes):
+        """Append journal records to an existing index file (one fsync)."""
+        data = b"".join(_LENGTH.pack(len(record)) + record for record in records)
+        with open(self.path, "ab") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+
+    def delete(self):
+        """Remove the index file if it exists."""
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
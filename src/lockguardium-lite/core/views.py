@@ -0,0 +1,66 @@
+"""
+LockGuardium Lite - Materialized Views
+Saved queries kept up to date as id sets
+"""
+
+from datetime import date
+from typing import Iterable, List, Optional, Set
+
+from core.models import VaultChange
+from core.query import And, DateRange, Node, Not, Or, parse_query
+
+
+def _has_dates(node: Node) -> bool:
+    if isinstance(node, DateRange):
+        return True
+    if isinstance(node, Not):
+        return _has_dates(node.child)
+    if isinstance(node, (And, Or)):
+        return any(_has_dates(child) for child in node.children)
+    return False
+
+
+class MaterializedView:
+    """
+    The ids matching a saved query, maintained from vault change events.
+
+    Applying a change costs O(entries in the change): removed ids are
+    dropped and added or edited entries are re-tested against the query.
+    Queries with relative dates ("modified:<30d") also depend on the day;
+    ``is_current`` reports when such a view has to be recomputed.
+    """
+
+    def __init__(self, name: str, query: str, today: Optional[date] = None):
+        self.name = name
+        self.query = query
+        self.today = today or date.today()
+        self.node = parse_query(query, self.today)
+        self.dated = _has_dates(self.node)
+        self.ids: Set[int] = set()
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def is_current(self, today: Optional[date] = None) -> bool:
+        """False once a date-dependent view was computed on an earlier day."""
+        return not self.dated or (today or date.today()) == self.today
+
+    def reset(self, ids: Iterable[int], today: Optional[date] = None):
+        """Replace the contents (e.g. with a fresh query result)."""
+        if today is not None and today != self.today:
+            self.today = today
+            self.node = parse_query(self.query, today)
+        self.ids = set(ids)
+
+    def apply(self, change: VaultChange):
+        """Fold a committed change into the view."""
+        self.ids.difference_update(change.removed)
+        for entry in (*change.added, *change.updated):
+            if self.node.matches(entry):
+                self.ids.add(entry["id"])
+            else:
+                self.ids.discard(entry["id"])
+
+    def sorted_ids(self) -> List[int]:
+        """Member ids in insertion order."""
+        return sorted(self.ids)
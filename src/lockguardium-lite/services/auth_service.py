@@ -0,0 +1,135 @@
+"""
+LockGuardium Lite - Auth Service
+Master password verification and vault unlock pipeline
+"""
+
+import asyncio
+import os
+from typing import Optional
+
+from cryptography.fernet import Fernet, InvalidToken
+
+from core.crypto import KDF_ITERATIONS, SALT_SIZE, derive_key
+from core.models import VaultSession
+from core.storage import StorageError, VaultHeader, VaultStorage
+from services.runtime import ServiceRuntime, get_runtime, to_thread
+from services.vault_service import VaultService, decode_payload, encode_payload
+
+# Known plaintext encrypted into the header to check a key without
+# decrypting the (potentially large) payload
+VERIFIER_PLAINTEXT = b"lockguardium-verifier"
+
+
+class AuthError(Exception):
+    """Raised when the master password is rejected or the vault can't be opened."""
+
+
+class AuthService:
+    """
+    Creates and unlocks vaults.
+
+    Unlocking runs as a staged pipeline:
+        1. read the small header (salt, KDF params, verifier)
+        2. derive the key on a worker thread while the payload is read
+        3. check the key against the verifier, then decrypt the payload
+        4. build the vault's metadata index
+    so wall-clock time is roughly max(KDF, I/O) rather than their sum.
+
+    The ``*_async`` coroutines are the primary API and run on the service
+    runtime; the plain methods are synchronous facades over them.
+    """
+
+    MIN_PASSWORD_LENGTH = 8
+
+    def __init__(
+        self,
+        storage: Optional[VaultStorage] = None,
+        runtime: Optional[ServiceRuntime] = None,
+    ):
+        self.storage = storage or VaultStorage()
+        self.runtime = runtime or get_runtime()
+
+    def vault_exists(self) -> bool:
+        """Check whether a vault has already been created."""
+        return self.storage.exists()
+
+    def validate_password(self, password: str):
+        """Check master password policy."""
+        if len(password) < self.MIN_PASSWORD_LENGTH:
+            raise AuthError(
+                f"Password must be at least {self.MIN_PASSWORD_LENGTH} characters"
+            )
+
+    def create_vault(self, password: str) -> VaultService:
+        """Create a new empty vault protected by ``password``."""
+        return self.runtime.run(self.create_vault_async(password))
+
+    def unlock(self, password: str) -> VaultService:
+        """Unlock the existing vault and return a ready VaultService."""
+        return self.runtime.run(self.unlock_async(password))
+
+    async def create_vault_async(self, password: str) -> VaultService:
+        """Coroutine version of ``create_vault``."""
+        self.validate_password(password)
+        if self.vault_exists():
+            raise AuthError("A vault already exists")
+
+        salt = os.urandom(SALT_SIZE)
+        key = await to_thread(derive_key, password, salt, KDF_ITERATIONS)
+        header = VaultHeader(
+            salt=salt,
+            iterations=KDF_ITERATIONS,
+            verifier=Fernet(key).encrypt(VERIFIER_PLAINTEXT),
+        )
+        session = VaultSession(key=key, header=header)
+
+        payload = encode_payload(key, [], session.next_id)
+        await to_thread(self.storage.write, header, payload)
+        return VaultService(session, self.storage)
+
+    async def unlock_async(self, password: str) -> VaultService:
+        """Coroutine version of ``unlock``."""
+        if not password:
+            raise AuthError("Invalid master password")
+
+        try:
+            # Stage 1: header only
+            header, offset = await to_thread(self.storage.read_header)
+
+            # Stage 2: KDF and payload I/O side by side
+            key, payload = await asyncio.gather(
+                to_thread(derive_key, password, header.salt, header.iterations),
+                to_thread(self.storage.read_payload, offset),
+            )
+        except StorageError as e:
+            raise AuthError(str(e)) from e
+
+        # Stage 3: verify, then decrypt
+        self._verify_key(key, header)
+        try:
+            data = await to_thread(decode_payload, key, payload)
+        except (InvalidToken, ValueError) as e:
+            raise AuthError("Vault data is corrupt") from e
+
+        session = VaultSession(
+            key=key,
+            header=header,
+            entries=data["entries"],
+            next_id=data["next_id"],
+            saved_searches=data.get("saved_searches", []),
+            usage=data.get("usage", []),
+        )
+        vault = VaultService(session, self.storage)
+
+        # The dashboard's first paint queries it on the Tk thread
+        await to_thread(vault.build_metadata_index)
+        return vault
+
+    def _verify_key(self, key: bytes, header: VaultHeader):
+        """Reject ``key`` unless it decrypts the header verifier."""
+        try:
+            ok = Fernet(key).decrypt(header.verifier) == VERIFIER_PLAINTEXT
+        except InvalidToken:
+            ok = False
+        if not ok:
+            raise AuthError("Invalid master password")
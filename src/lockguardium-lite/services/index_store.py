@@ -0,0 +1,202 @@
+"""
+LockGuardium Lite - Search Index Store
+Encrypted on-disk copy of the trigram index, kept next to the vault
+"""
+
+import json
+import threading
+from typing import Iterable, List, Optional, Set, Tuple, Union
+
+from cryptography.fernet import Fernet, InvalidToken
+
+from core.crypto import derive_subkey
+from core.models import VaultChange, VaultSnapshot
+from core.search import NGramIndex, searchable_text
+from core.storage import IndexStorage, StorageError
+
+INDEX_FORMAT_VERSION = 2
+
+
+class SearchIndexStore:
+    """
+    Persists the trigram index so unlocking doesn't have to rebuild it.
+
+    The file holds an encrypted dump of the postings taken at some vault
+    generation, followed by an encrypted journal with one record per later
+    commit (its generation and the ids it touched). Loading restores the
+    postings and re-indexes only the touched ids. If the journal doesn't
+    lead without gaps to the vault's current generation (a commit was made
+    while nothing was journaling), the dump's per-entry digests are
+    compared instead and ``needs_compaction`` asks for a fresh base. Only a
+    missing, corrupt or foreign file means a rebuild.
+
+    Everything written is encrypted with a key derived from the vault key,
+    so the file reveals no more than the vault itself.
+
+    Journal records (and bases from ``save_later``) are queued and written
+    by a background thread, batching whatever accumulated during the last
+    fsync into one append; commits never wait for the disk. ``flush``
+    waits for everything queued so far.
+    """
+
+    # Rewrite the base once the journal holds this many records
+    COMPACT_AFTER = 64
+
+    def __init__(self, storage: IndexStorage, key: bytes):
+        self.storage = storage
+        self._fernet = Fernet(derive_subkey(key, "search-index"))
+        self._journal_length = 0
+        self._generation: Optional[int] = None  # Last generation recorded
+        self._reconciled = False  # Loaded across a journal gap
+
+        # ("record", generation, touched ids) or ("base", generation, dump)
+        self._queue: List[Tuple[str, int, Union[List[int], bytes]]] = []
+        self._queue_lock = threading.Lock()
+        self._io_lock = threading.Lock()  # Held while writing, in queue order
+        self._writer: Optional[threading.Thread] = None
+
+    @classmethod
+    def for_vault(cls, vault) -> Optional["SearchIndexStore"]:
+        """Store for a persisted VaultService, or None for in-memory vaults."""
+        session = vault.session
+        if vault.storage is None or session is None or session.key is None:
+            return None
+        return cls(IndexStorage.for_vault(vault.storage.path), session.key)
+
+    @property
+    def needs_compaction(self) -> bool:
+        return self._reconciled or self._journal_length >= self.COMPACT_AFTER
+
+    def load(self, snapshot: VaultSnapshot) -> Optional[NGramIndex]:
+        """
+        Restore the index for ``snapshot``, or None if it must be rebuilt.
+        """
+        if not self.storage.exists():
+            return None
+        try:
+            header, base, records = self.storage.read()
+            if header.get("version") != INDEX_FORMAT_VERSION:
+                return None
+
+            generation = int(header["generation"])
+            touched: Optional[Set[int]] = set()
+            for record in records:
+                data = json.loads(self._fernet.decrypt(record))
+                if data["generation"] != generation + 1:
+                    break  # Gap: a commit was never journaled
+                generation = data["generation"]
+                touched.update(data["touched"])
+            if generation != snapshot.generation:
+                touched = None  # Find the changed entries by digest
+
+            documents = ((e["id"], searchable_text(e)) for e in snapshot)
+            index = NGramIndex.restore(documents, self._fernet.decrypt(base), touched)
+        except (StorageError, InvalidToken, ValueError, KeyError, TypeError):
+            return None
+
+        self._journal_length = len(records)
+        self._generation = snapshot.generation
+        self._reconciled = touched is None
+        return index
+
+    def save(self, index: NGramIndex, generation: int):
+        """Write a fresh base for ``generation`` now and clear the journal."""
+        base = self._fernet.encrypt(index.dump())
+        with self._io_lock:
+            with self._queue_lock:
+                # Queued records up to ``generation`` are part of the new base
+                self._queue = [
+                    item
+                    for item in self._queue
+                    if item[0] == "record" and item[1] > generation
+                ]
+                self._journal_length = len(self._queue)
+                self._generation = max(generation, self._generation or generation)
+                self._reconciled = False
+            self._write_base(generation, base)
+
+    def save_later(self, index: NGramIndex, generation: int):
+        """``save`` on the writer thread; the postings are dumped right away."""
+        dump = index.dump()
+        with self._queue_lock:
+            self._queue.append(("base", generation, dump))
+            self._journal_length = 0
+            self._generation = generation
+            self._reconciled = False
+            self._start_writer()
+
+    def record(self, change: VaultChange):
+        """Journal a committed change (only once a base has been written)."""
+        with self._queue_lock:
+            if self._generation is None or change.generation <= self._generation:
+                return  # No base yet, or already part of it
+            touched: Iterable[int] = [
+                *change.removed,
+                *(e["id"] for e in change.updated),
+                *(e["id"] for e in change.added),
+            ]
+            self._queue.append(("record", change.generation, list(touched)))
+            self._journal_length += 1
+            self._generation = change.generation
+            self._start_writer()
+
+    def flush(self):
+        """
+        Write everything queued so far and wait for it to be on disk.
+
+        Raises:
+            OSError: If writing failed (the next load then reconciles the gap)
+        """
+        with self._io_lock:
+            with self._queue_lock:
+                queue, self._queue = self._queue, []
+            if not queue:
+                return
+
+            bases = [i for i, item in enumerate(queue) if item[0] == "base"]
+            if bases:
+                # Only the newest base matters; it covers the records before it
+                _, generation, dump = queue[bases[-1]]
+                self._write_base(generation, self._fernet.encrypt(dump))
+                queue = queue[bases[-1] + 1 :]
+
+            records = [
+                json.dumps({"generation": generation, "touched": touched})
+                for _, generation, touched in queue
+            ]
+            records = [self._fernet.encrypt(r.encode("utf-8")) for r in records]
+            if records and self.storage.exists():
+                self.storage.append(*records)
+
+    def _write_base(self, generation: int, base: bytes):
+        """Replace the file (caller holds the I/O lock)."""
+        header = {"version": INDEX_FORMAT_VERSION, "generation": generation}
+        self.storage.write(header, base)
+
+    def _start_writer(self):
+        """Start a writer thread if none is running (caller holds the queue lock)."""
+        if self._writer is None:
+            self._writer = threading.Thread(
+                target=self._write_queued, name="lockguardium-index", daemon=True
+            )
+            self._writer.start()
+
+    def _write_queued(self):
+        while True:
+            try:
+                self.flush()
+            except OSError:
+                pass  # Best effort: the next load sees the gap
+            with self._queue_lock:
+                if not self._queue:
+                    self._writer = None
+                    return
+
+    def delete(self):
+        """Remove the index file, dropping anything not yet written."""
+        with self._io_lock:
+            with self._queue_lock:
+                self._queue.clear()
+                self._journal_length = 0
+                self._generation = None
+            self.storage.delete()
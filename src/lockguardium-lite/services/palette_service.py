@@ -0,0 +1,133 @@
+"""
+LockGuardium Lite - Palette Service
+Quick-switcher results over vault entries and application actions
+"""
+
+import heapq
+import itertools
+import threading
+import time
+from typing import Dict, Hashable, List, NamedTuple, Optional
+
+from core.models import VaultChange, VaultSnapshot
+from core.palette import PrefixTrie, words
+from services.runtime import to_thread
+from services.vault_service import VaultService
+
+
+class PaletteItem(NamedTuple):
+    """One palette result: a vault entry (int key) or an action (str key)."""
+
+    key: Hashable
+    label: str
+    detail: str
+    entry: Optional[dict]
+
+    @property
+    def is_action(self) -> bool:
+        return self.entry is None
+
+
+class PaletteService:
+    """
+    Answers command palette queries.
+
+    Entry service names and action labels share one PrefixTrie, kept in
+    step with the vault's change events after it is first built. Results
+    are ranked by the vault's frecency scores (bumped on every copy or
+    reveal), with labels that start with the query breaking ties, and the
+    top ``limit`` are taken with a heap: nothing is sorted per keystroke.
+
+    An empty query lists the most used items, so the favourite entry is
+    always one Enter away.
+    """
+
+    # Default number of results
+    DEFAULT_LIMIT = 10
+
+    def __init__(self, vault: VaultService, actions: Optional[Dict[str, str]] = None):
+        self.vault = vault
+        self.actions = dict(actions or {})
+        self._lock = threading.Lock()
+        self._trie: Optional[PrefixTrie] = None
+        self._unsubscribe = vault.subscribe(self._on_vault_change)
+
+    def _ensure_built(self) -> PrefixTrie:
+        """Index every entry and action on first use (caller holds the lock)."""
+        if self._trie is None:
+            trie = PrefixTrie()
+            for key, label in self.actions.items():
+                trie.add(key, label)
+            for entry in self.vault.snapshot():
+                trie.add(entry["id"], entry.get("service", ""))
+            self._trie = trie
+        return self._trie
+
+    def _on_vault_change(self, change: VaultChange):
+        with self._lock:
+            if self._trie is None:
+                return  # Built from the current state on first use
+            for entry_id in change.removed:
+                self._trie.remove(entry_id)
+            for entry in change.added + change.updated:
+                self._trie.add(entry["id"], entry.get("service", ""))
+
+    # ===== Queries =====
+
+    def query(self, text: str, limit: int = DEFAULT_LIMIT) -> List[PaletteItem]:
+        """Best ``limit`` items whose words start with the words of ``text``."""
+        with self._lock:
+            snapshot = self.vault.snapshot()
+            trie = self._ensure_built()
+            if words(text):
+                candidates = trie.search(text)
+            else:
+                used = (k for k in self.vault.used_keys() if k in trie)
+                candidates = set(itertools.chain(used, self.actions))
+
+            now = time.time()
+            prefix = text.strip().lower()
+            score = self.vault.usage_score
+            labels = {k: trie.label(k) for k in candidates}
+
+        def rank(key):
+            label = labels[key]
+            return (score(key, now), label.lower().startswith(prefix), -len(label))
+
+        keys = heapq.nlargest(limit, candidates, key=rank)
+
+        # Nothing used yet: fill up with entries in vault order
+        if len(keys) < limit and not words(text):
+            chosen = set(keys)
+            fill = (i for i in snapshot.ids() if i not in chosen)
+            keys.extend(itertools.islice(fill, limit - len(keys)))
+
+        items = (self._item(key, labels.get(key), snapshot) for key in keys)
+        return [item for item in items if item is not None]
+
+    async def query_async(
+        self, text: str, limit: int = DEFAULT_LIMIT
+    ) -> List[PaletteItem]:
+        """Coroutine version of ``query`` (the first call builds the trie)."""
+        return await to_thread(self.query, text, limit)
+
+    def _item(
+        self, key: Hashable, label: Optional[str], snapshot: VaultSnapshot
+    ) -> Optional[PaletteItem]:
+        if key in self.actions:
+            return PaletteItem(key, self.actions[key], "Action", None)
+        entry = snapshot.get(key)
+        if entry is None:
+            return None  # Deleted after the trie was last updated
+        detail = entry.get("username") or entry.get("email", "")
+        return PaletteItem(key, label or entry.get("service", ""), detail, entry)
+
+    def record_use(self, key: Hashable):
+        """Count one use of an entry or action towards its ranking."""
+        self.vault.record_use(key)
+
+    def close(self):
+        """Stop following the vault."""
+        self._unsubscribe()
+        with self._lock:
+            self._trie = None
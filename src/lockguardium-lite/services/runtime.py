@@ -0,0 +1,223 @@
+"""
+LockGuardium Lite - Service Runtime
+Background asyncio loop for service coroutines and a bridge back to Tk
+"""
+
+import asyncio
+import concurrent.futures
+import functools
+import queue
+import threading
+from typing import Any, Callable, Coroutine, List, Optional, Set, Tuple
+
+
+class ServiceRuntime:
+    """
+    Runs an asyncio event loop on a daemon thread.
+    Service coroutines are submitted here so KDF, disk and crypto work never
+    runs on the Tk thread.
+    """
+
+    def __init__(self, name: str = "lockguardium-services"):
+        self.name = name
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """The running loop, starting the background thread on first use."""
+        self.start()
+        return self._loop
+
+    def start(self):
+        """Start the loop thread if it is not running yet."""
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+
+            self._loop = asyncio.new_event_loop()
+            ready = threading.Event()
+            self._thread = threading.Thread(
+                target=self._run, args=(ready,), name=self.name, daemon=True
+            )
+            self._thread.start()
+            ready.wait()
+
+    def _run(self, ready: threading.Event):
+        asyncio.set_event_loop(self._loop)
+        self._loop.call_soon(ready.set)
+        self._loop.run_forever()
+
+    def stop(self):
+        """Cancel outstanding tasks and stop the loop thread."""
+        with self._lock:
+            if self._thread is None:
+                return
+            loop, thread = self._loop, self._thread
+            self._thread = None
+
+        def _shutdown():
+            tasks = asyncio.all_tasks(loop)
+            if not tasks:
+                loop.stop()
+                return
+            for task in tasks:
+                task.cancel()
+            # Stop once the cancellations have run, so waiting futures resolve
+            done = asyncio.gather(*tasks, return_exceptions=True)
+            done.add_done_callback(lambda _: loop.stop())
+
+        loop.call_soon_threadsafe(_shutdown)
+        thread.join(timeout=5)
+
+    def in_loop_thread(self) -> bool:
+        return self._thread is not None and threading.current_thread() is self._thread
+
+    def submit(self, coro: Coroutine) -> concurrent.futures.Future:
+        """Schedule a coroutine on the loop; cancelling the future cancels it."""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def run(self, coro: Coroutine, timeout: Optional[float] = None) -> Any:
+        """
+        Synchronous facade: run a coroutine on the loop and wait for it.
+        Intended for the CLI, scripts and tests - never call from the loop.
+        """
+        if self.in_loop_thread():
+            coro.close()
+            raise RuntimeError("ServiceRuntime.run() called from the loop thread")
+        return self.submit(coro).result(timeout)
+
+
+async def to_thread(func: Callable, *args, **kwargs) -> Any:
+    """Run blocking ``func`` in the loop's default executor."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, functools.partial(func, *args, **kwargs))
+
+
+_default_runtime: Optional[ServiceRuntime] = None
+_default_lock = threading.Lock()
+
+
+def get_runtime() -> ServiceRuntime:
+    """Return the process-wide service runtime."""
+    global _default_runtime
+    with _default_lock:
+        if _default_runtime is None:
+            _default_runtime = ServiceRuntime()
+        return _default_runtime
+
+
+class TkBridge:
+    """
+    Runs service coroutines from Tk code and delivers their results on the
+    Tk thread.
+
+    Completions are queued by the loop thread and drained with ``after`` so
+    Tk is only ever touched from its own thread. Polling only happens while
+    calls are pending.
+
+    Calls made with ``cancellable=False`` (vault writes) are left running
+    by ``cancel_all``; ``uncancellable`` returns them so a caller can wait
+    for them to land.
+    """
+
+    POLL_INTERVAL_MS = 15
+
+    def __init__(self, widget, runtime: Optional[ServiceRuntime] = None):
+        self.widget = widget
+        self.runtime = runtime or get_runtime()
+        self._done: "queue.SimpleQueue[Tuple]" = queue.SimpleQueue()
+        self._pending: List[concurrent.futures.Future] = []
+        self._uncancellable: Set[concurrent.futures.Future] = set()
+        self._poll_id = None
+
+    def call(
+        self,
+        coro: Coroutine,
+        on_success: Optional[Callable[[Any], None]] = None,
+        on_error: Optional[Callable[[BaseException], None]] = None,
+        cancellable: bool = True,
+    ) -> concurrent.futures.Future:
+        """
+        Run ``coro`` on the service loop.
+
+        Args:
+            coro: Coroutine to run
+            on_success: Called on the Tk thread with the result
+            on_error: Called on the Tk thread with the exception
+                (reported like a Tk callback error if not given)
+            cancellable: False to keep the call running through ``cancel_all``
+
+        Returns:
+            Future that can be cancelled; cancelled calls get no callback
+        """
+        future = self.runtime.submit(coro)
+        self._pending.append(future)
+        if not cancellable:
+            self._uncancellable.add(future)
+        future.add_done_callback(lambda f: self._done.put((f, on_success, on_error)))
+        self._schedule_poll()
+        return future
+
+    def cancel(self, future: concurrent.futures.Future):
+        """Cancel a single pending call."""
+        future.cancel()
+
+    def cancel_all(self):
+        """Cancel every cancellable call; stop polling if none are left."""
+        for future in self._pending:
+            if future not in self._uncancellable:
+                future.cancel()
+        self._pending = [f for f in self._pending if f in self._uncancellable]
+        if not self._pending and self._poll_id is not None:
+            try:
+                self.widget.after_cancel(self._poll_id)
+            except Exception:
+                pass
+            self._poll_id = None
+
+    def uncancellable(self) -> List[concurrent.futures.Future]:
+        """Pending calls made with ``cancellable=False``."""
+        return [f for f in self._pending if f in self._uncancellable]
+
+    @property
+    def pending_count(self) -> int:
+        return len(self._pending)
+
+    def _schedule_poll(self):
+        if self._poll_id is None:
+            self._poll_id = self.widget.after(self.POLL_INTERVAL_MS, self._poll)
+
+    def _poll(self):
+        """Dispatch finished calls on the Tk thread."""
+        self._poll_id = None
+
+        # A raising callback propagates to Tk; the rest wait for the next poll
+        try:
+            while True:
+                try:
+                    future, on_success, on_error = self._done.get_nowait()
+                except queue.Empty:
+                    break
+
+                if future in self._pending:
+                    self._pending.remove(future)
+                self._uncancellable.discard(future)
+                if future.cancelled():
+                    continue
+
+                error = future.exception()
+                if error is not None:
+                    if on_error:
+                        on_error(error)
+                    else:
+                        # Only the Tk root has report_callback_exception
+                        self.widget._root().report_callback_exception(
+                            type(error), error, error.__traceback__
+                        )
+                elif on_success:
+                    on_success(future.result())
+        finally:
+            if self._pending:
+                self._schedule_poll()
@@ -0,0 +1,264 @@
+"""
+LockGuardium Lite - Search Service
+Keeps the search indexes in step with the vault
+"""
+
+import threading
+from datetime import date
+from typing import Dict, List, Optional, Tuple, Union
+
+from core.models import VaultChange
+from core.query import QueryPlanner, parse_query
+from core.search import (
+    ExactIndex,
+    FuzzyIndex,
+    NGramIndex,
+    QueryCache,
+    RecencyIndex,
+    normalize_query,
+)
+from services.index_store import SearchIndexStore
+from services.runtime import to_thread
+from services.vault_service import VaultService
+
+SearchIndex = Union[NGramIndex, FuzzyIndex, ExactIndex, RecencyIndex]
+
+
+class SearchService:
+    """
+    Answers free-text queries over a VaultService.
+
+    Each index is built from a vault snapshot the first time it is needed
+    and then maintained incrementally from the vault's change events, so a
+    query never rescans every entry. Change events arrive on the committing
+    thread, so the indexes are guarded by their own lock.
+
+    For a vault on disk the trigram index - the slowest to build - is also
+    persisted, encrypted, by a SearchIndexStore. It is loaded (instead of
+    rebuilt) the first time search is used after unlocking, and every
+    commit is journaled, off the committing thread, so the copy on disk
+    stays current. Persistence is best effort: any I/O problem just means
+    building in memory.
+
+    Recent results are kept in a QueryCache tied to the index generation.
+    Typing one more character refines the cached result of the shorter
+    query instead of searching the whole vault again, and backspacing hits
+    the cache directly.
+    """
+
+    # Default number of ranked results
+    DEFAULT_LIMIT = 50
+
+    def __init__(self, vault: VaultService, store: Optional[SearchIndexStore] = None):
+        self.vault = vault
+        self.store = store if store is not None else SearchIndexStore.for_vault(vault)
+        self._lock = threading.Lock()
+        self._indexes: Dict[type, SearchIndex] = {}
+        self._generations: Dict[type, int] = {}
+        self._cache = QueryCache()
+        self._unsubscribe = vault.subscribe(self._on_vault_change)
+
+    def _index(self, kind: type) -> SearchIndex:
+        """Return the index of type ``kind``, building it on first use."""
+        index = self._indexes.get(kind)
+        if index is None:
+            snapshot = self.vault.snapshot()
+            persisted = kind is NGramIndex and self.store is not None
+            index = self.store.load(snapshot) if persisted else None
+            stale = index is None or (persisted and self.store.needs_compaction)
+            if index is None:
+                index = kind()
+                index.build(snapshot)
+            if persisted and stale:
+                # A rebuilt index, or one loaded across a journal gap
+                self._persist(index, snapshot.generation)
+            self._indexes[kind] = index
+            self._generations[kind] = snapshot.generation
+        return index
+
+    def _persist(self, index: NGramIndex, generation: int):
+        try:
+            self.store.save(index, generation)
+        except OSError:
+            pass  # Search keeps working from memory
+
+    def _on_vault_change(self, change: VaultChange):
+        with self._lock:
+            if self.store is not None:
+                self.store.record(change)  # Written off this thread
+
+            for kind, index in self._indexes.items():
+                if change.generation <= self._generations[kind]:
+                    continue  # Already covered by the snapshot it was built from
+
+                for entry_id in change.removed:
+                    index.remove(entry_id)
+                for entry in change.updated:
+                    index.update(entry)
+                for entry in change.added:
+                    index.add(entry)
+                self._generations[kind] = change.generation
+
+            ngrams = self._indexes.get(NGramIndex)
+            if (
+                ngrams is not None
+                and self.store is not None
+                and self.store.needs_compaction
+            ):
+                self.store.save_later(ngrams, self._generations[NGramIndex])
+
+    def search(self, query: str) -> List[int]:
+        """
+        Ids of entries whose service, email or username contain ``query``.
+
+        Returns:
+            Matching ids in insertion order
+        """
+        with self._lock:
+            return self._search(query)
+
+    def _search(self, query: str) -> List[int]:
+        """``search`` for a caller holding the lock."""
+        query = query.strip().lower()
+        index = self._index(NGramIndex)
+        generation = self._generations[NGramIndex]
+
+        result = self._cache.get("substring", query, generation)
+        if result is None:
+            # Any match for the longer query also matched its prefix
+            previous = self._cache.get_prefix("substring", query, generation)
+            candidates = set(previous) if previous is not None else None
+            result = index.search(query, candidates)
+            self._cache.put("substring", query, generation, result)
+        return list(result)
+
+    def rank(self, query: str, limit: int = DEFAULT_LIMIT) -> List[int]:
+        """
+        Ids of the best fuzzy matches for ``query``, best first.
+
+        Args:
+            query: Characters to match in order ("gthb" finds "GitHub")
+            limit: Maximum number of results
+        """
+        with self._lock:
+            return self._rank(query, limit)[0]
+
+    def _rank(self, query: str, limit: int) -> Tuple[List[int], int]:
+        """
+        ``rank`` and the number of entries that match at all, for a caller
+        holding the lock.
+        """
+        query = normalize_query(query)
+        index = self._index(FuzzyIndex)
+        if not query:
+            return [i for i, _ in index.first(limit)], len(index)
+        generation = self._generations[FuzzyIndex]
+
+        hits = self._cache.get("fuzzy", query, generation)
+        if hits is None:
+            # Only values matching a prefix can match the longer query
+            previous = self._cache.get_prefix("fuzzy", query, generation)
+            hits = index.matches(query, within=previous)
+            self._cache.put("fuzzy", query, generation, hits)
+        return [i for i, _ in index.select(hits, limit)], index.count(hits)
+
+    def find(self, query: str, limit: int = DEFAULT_LIMIT) -> Tuple[List[int], int]:
+        """
+        Ids of every entry containing ``query``, plus the best fuzzy matches.
+
+        The ``limit`` best fuzzy matches come first, best first, followed by
+        the remaining substring matches in insertion order. Only entries
+        that merely contain the query's characters in order are capped, so
+        nothing a plain substring search finds is ever left out.
+
+        Returns:
+            (ids, number of entries matching at all) - the ids are
+            truncated when the second is larger
+        """
+        # One lock hold, so both halves see the same vault generation
+        with self._lock:
+            ranked, total = self._rank(query, limit)
+            matches = self._search(query)
+        seen = set(ranked)
+        ids = ranked + [i for i in matches if i not in seen]
+        return ids, max(total, len(ids))
+
+    def query(self, text: str) -> List[int]:
+        """
+        Ids of entries matching a structured query (see ``core.query``),
+        in insertion order.
+
+        Raises:
+            QueryError: If the query is malformed
+        """
+        # Relative ages ("modified:<30d") move with the date; cache per day
+        today = date.today()
+        node = parse_query(text, today)
+        with self._lock:
+            snapshot = self.vault.snapshot()
+            planner = QueryPlanner(
+                self._index(NGramIndex),
+                self._index(ExactIndex),
+                self._index(RecencyIndex),
+                all_ids=snapshot.ids,
+            )
+            generation = self._generations[NGramIndex]
+            key = f"{today.isoformat()} {text.strip()}"
+
+            result = self._cache.get("query", key, generation)
+            if result is None:
+                result = planner.execute(node, snapshot.get)
+                self._cache.put("query", key, generation, result)
+            return list(result)
+
+    async def query_async(self, text: str) -> List[dict]:
+        """Coroutine version of ``query`` returning snapshot entries."""
+
+        def run():
+            ids = self.query(text)
+            snapshot = self.vault.snapshot()
+            return [entry for entry in map(snapshot.get, ids) if entry is not None]
+
+        return await to_thread(run)
+
+    async def rank_async(self, query: str, limit: int = DEFAULT_LIMIT) -> List[dict]:
+        """
+        Coroutine version of ``rank`` for search-as-you-type.
+
+        Runs off the Tk thread and resolves the ranked ids against the
+        current vault snapshot, so callers get entries that are consistent
+        with each other even while the vault is being edited.
+        """
+
+        def run():
+            ids = self.rank(query, limit)
+            snapshot = self.vault.snapshot()
+            return [entry for entry in map(snapshot.get, ids) if entry is not None]
+
+        return await to_thread(run)
+
+    async def find_async(
+        self, query: str, limit: int = DEFAULT_LIMIT
+    ) -> Tuple[List[dict], int]:
+        """Coroutine version of ``find`` returning snapshot entries."""
+
+        def run():
+            ids, total = self.find(query, limit)
+            snapshot = self.vault.snapshot()
+            entries = [entry for entry in map(snapshot.get, ids) if entry is not None]
+            return entries, total
+
+        return await to_thread(run)
+
+    def close(self):
+        """Stop following the vault, finish journaling and drop the indexes."""
+        self._unsubscribe()
+        with self._lock:
+            if self.store is not None:
+                try:
+                    self.store.flush()
+                except OSError:
+                    pass  # The next load will see the gap and rebuild
+            self._indexes.clear()
+            self._generations.clear()
+            self._cache.clear()
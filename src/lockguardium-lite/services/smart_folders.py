@@ -0,0 +1,131 @@
+"""
+LockGuardium Lite - Smart Folders
+Saved searches materialized as incrementally maintained views
+"""
+
+import threading
+from datetime import date
+from typing import Dict, List, Optional, Tuple
+
+from core.models import VaultChange
+from core.views import MaterializedView
+from services.runtime import to_thread
+from services.search_service import SearchService
+from services.vault_service import VaultService
+
+
+class SmartFolderService:
+    """
+    Keeps one MaterializedView per saved search.
+
+    Each view is computed once through the search planner and afterwards
+    only folds in committed vault changes, so folder counts are always
+    current without rescanning and opening a folder costs O(result size).
+    Saved searches themselves live (encrypted) in the vault payload;
+    adding or removing one is a vault commit like any other.
+
+    Views are computed on first use, which needs the search indexes, so
+    callers on the Tk thread should go through the ``*_async`` methods.
+    """
+
+    def __init__(self, vault: VaultService, search: SearchService):
+        self.vault = vault
+        self.search = search
+        self._lock = threading.Lock()
+        self._views: Dict[str, MaterializedView] = {}
+        self._loaded = False
+        self._unsubscribe = vault.subscribe(self._on_vault_change)
+
+    def _ensure_loaded(self):
+        """Materialize every saved search once (caller holds the lock)."""
+        if not self._loaded:
+            self._sync_definitions()
+            self._loaded = True
+
+    def _materialize(self, name: str, query: str) -> MaterializedView:
+        view = MaterializedView(name, query)
+        view.reset(self.search.query(query))
+        return view
+
+    def _sync_definitions(self):
+        """Create, replace or drop views to match the vault's saved searches."""
+        views = {}
+        for saved in self.vault.saved_searches():
+            name, query = saved["name"], saved["query"]
+            view = self._views.get(name)
+            if view is None or view.query != query:
+                view = self._materialize(name, query)
+            views[name] = view
+        self._views = views
+
+    def _on_vault_change(self, change: VaultChange):
+        with self._lock:
+            if not self._loaded:
+                return  # Views will be computed from the current state
+            if "saved_searches" in change.metadata:
+                self._sync_definitions()
+            if change.added or change.updated or change.removed:
+                for view in self._views.values():
+                    view.apply(change)
+
+    def _current(self, view: MaterializedView) -> MaterializedView:
+        """Recompute a view whose relative dates moved on (caller holds lock)."""
+        today = date.today()
+        if not view.is_current(today):
+            view.reset(self.search.query(view.query), today)
+        return view
+
+    # ===== Queries =====
+
+    def folders(self) -> List[Tuple[str, int]]:
+        """(name, entry count) for every smart folder, in creation order."""
+        with self._lock:
+            self._ensure_loaded()
+            return [(n, len(self._current(v))) for n, v in self._views.items()]
+
+    async def folders_async(self) -> List[Tuple[str, int]]:
+        """Coroutine version of ``folders``."""
+        return await to_thread(self.folders)
+
+    def query_of(self, name: str) -> Optional[str]:
+        view = self._views.get(name)
+        return view.query if view is not None else None
+
+    def ids(self, name: str) -> List[int]:
+        """Ids in a smart folder, in insertion order."""
+        with self._lock:
+            self._ensure_loaded()
+            view = self._views.get(name)
+            return self._current(view).sorted_ids() if view is not None else []
+
+    def entries(self, name: str) -> List[dict]:
+        """Entries in a smart folder, resolved against the current snapshot."""
+        snapshot = self.vault.snapshot()
+        return [e for e in map(snapshot.get, self.ids(name)) if e is not None]
+
+    async def entries_async(self, name: str) -> List[dict]:
+        """Coroutine version of ``entries``."""
+        return await to_thread(self.entries, name)
+
+    # ===== Mutations =====
+
+    async def add_async(self, name: str, query: str) -> VaultChange:
+        """
+        Save ``query`` as smart folder ``name`` (replacing one of that name).
+
+        Raises:
+            QueryError: If the query is malformed
+        """
+        MaterializedView(name, query)  # Validate before committing
+        return await self.vault.batch_async(lambda v: v.save_search(name, query))
+
+    async def remove_async(self, name: str) -> VaultChange:
+        """Delete smart folder ``name``."""
+        return await self.vault.batch_async(lambda v: v.delete_saved_search(name))
+
+    def close(self):
+        """Stop following the vault."""
+        self._unsubscribe()
+        with self._lock:
+            self._views.clear()
+            self._loaded = False
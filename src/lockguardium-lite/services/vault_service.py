@@ -0,0 +1,544 @@
+"""
+LockGuardium Lite - Vault Service
+CRUD operations on an unlocked vault with encrypted persistence
+"""
+
+import json
+import sys
+import threading
+from collections import deque
+from contextlib import contextmanager
+from datetime import datetime
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Hashable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from cryptography.fernet import Fernet
+
+from core.metadata import Filter, MetadataIndex
+from core.models import VaultChange, VaultSession, VaultSnapshot
+from core.palette import Frecency
+from core.persistent import PersistentMap
+from core.storage import VaultHeader, VaultStorage
+from services.runtime import to_thread
+
+# Fields a caller may set on an entry; id and timestamps are managed here
+ENTRY_FIELDS = ("service", "email", "username", "password")
+
+# Fields that must be non-empty on every committed entry
+REQUIRED_FIELDS = ("service", "password")
+
+
+class VaultError(Exception):
+    """Raised for invalid vault operations (locked vault, unknown entry...)."""
+
+
+def encode_payload(
+    key: bytes,
+    entries: List[dict],
+    next_id: int,
+    saved_searches: Optional[List[dict]] = None,
+    usage: Optional[List[list]] = None,
+) -> bytes:
+    """Encrypt the vault entries into a single Fernet token."""
+    data = {"next_id": next_id, "entries": entries}
+    if saved_searches:
+        data["saved_searches"] = saved_searches
+    if usage:
+        data["usage"] = usage
+    return Fernet(key).encrypt(json.dumps(data).encode("utf-8"))
+
+
+def decode_payload(key: bytes, payload: bytes) -> dict:
+    """Decrypt a payload written by ``encode_payload``."""
+    if not payload:
+        # create_vault always writes one, so a missing payload means truncation
+        raise ValueError("Vault payload is missing")
+    return json.loads(Fernet(key).decrypt(payload).decode("utf-8"))
+
+
+class VaultBatch:
+    """
+    Mutations collected by ``VaultService.batch()``.
+    Tracks the net effect per entry id so the commit emits one coalesced
+    VaultChange, and keeps the starting state so a failed batch rolls back.
+    """
+
+    def __init__(
+        self, entries: PersistentMap, next_id: int, saved_searches: List[dict]
+    ):
+        self._saved = (entries, next_id, saved_searches)
+        self._ops: Dict[int, str] = {}
+        self.metadata: List[str] = []
+        self.change: Optional[VaultChange] = None
+
+    @property
+    def touched(self) -> Dict[int, str]:
+        """Net operation per entry id."""
+        return self._ops
+
+    def record(self, entry_id: int, op: str):
+        """Fold ``op`` ("added", "updated" or "removed") into the net effect."""
+        previous = self._ops.get(entry_id)
+
+        if previous == "added" and op == "removed":
+            del self._ops[entry_id]
+        elif previous == "added":
+            pass  # Still a new entry, just with newer values
+        elif previous == "removed" and op == "added":
+            self._ops[entry_id] = "updated"
+        else:
+            self._ops[entry_id] = op
+
+    def record_metadata(self, name: str):
+        """Note that vault-level data ``name`` changed."""
+        if name not in self.metadata:
+            self.metadata.append(name)
+
+    def restore(self, session: VaultSession) -> PersistentMap:
+        """Reset ``session`` to the starting state and return the entry map."""
+        entries, session.next_id, session.saved_searches = self._saved
+        return entries
+
+    def build_change(self, entries: PersistentMap, generation: int) -> VaultChange:
+        """Build the coalesced change from the final entry state."""
+        change = VaultChange(generation=generation, metadata=list(self.metadata))
+        for entry_id, op in self._ops.items():
+            if op == "removed":
+                change.removed.append(entry_id)
+            elif op == "added":
+                change.added.append(entries[entry_id])
+            else:
+                change.updated.append(entries[entry_id])
+        return change
+
+
+class VaultService:
+    """
+    Owns an unlocked VaultSession.
+    Every mutation is written back to storage; the in-memory entry list is
+    the source of truth for the UI.
+
+    Mutations happen inside a batch (single calls get an implicit batch of
+    one). A batch is validated and written in one storage transaction, then
+    listeners receive one coalesced VaultChange:
+
+        with vault.batch():
+            for entry in entries:
+                vault.update(entry["id"], {"password": new_password()})
+
+    Mutations are serialized by a lock so the ``*_async`` coroutines (run on
+    the service runtime) and the synchronous methods can be mixed safely.
+    Listeners are called after the lock is released, in commit order, on
+    a thread that committed; one that raises is reported and skipped, since
+    the batch is already on disk.
+
+    Entries live in a PersistentMap keyed by id. Each commit publishes a new
+    VaultSnapshot, so ``snapshot()`` is O(1) and lock-free for background
+    readers (audits, exports, indexing) while the UI keeps editing.
+
+    Sorting, filtering and grouping on the non-secret fields go through a
+    MetadataIndex (in-memory SQLite), built off the Tk thread while
+    unlocking (see ``build_metadata_index``; otherwise on first use) and
+    updated with each commit. It has its own lock, so these queries don't wait for a
+    write in progress, and is dropped when the vault is locked.
+    """
+
+    def __init__(self, session: VaultSession, storage: Optional[VaultStorage] = None):
+        self.session = session
+        self.storage = storage
+        self._lock = threading.RLock()
+        self._batch: Optional[VaultBatch] = None
+        self._listeners: List[Callable[[VaultChange], None]] = []
+
+        # Committed changes waiting for delivery; queued under _lock, so in
+        # commit order, and delivered under _emit_lock so they stay in it
+        self._pending: Deque[VaultChange] = deque()
+        self._emit_lock = threading.RLock()
+
+        # Entries now live in the persistent map, not the session list
+        self._entries = PersistentMap.from_items((e["id"], e) for e in session.entries)
+        session.entries = []
+        self._snapshot: Optional[VaultSnapshot] = VaultSnapshot(
+            self._entries, session.header.generation
+        )
+
+        # Use counts for the command palette, written with the next commit
+        self._usage = Frecency(session.usage)
+        self._usage_dirty = False
+        session.usage = []
+
+        # Guards the metadata index and publishing snapshots, so a query
+        # always resolves ids against the state it was answered from
+        self._metadata_lock = threading.Lock()
+        self._metadata: Optional[MetadataIndex] = None
+
+    @classmethod
+    def in_memory(cls, entries: List[dict]) -> "VaultService":
+        """Create an unpersisted vault (standalone UI runs and demos)."""
+        session = VaultSession(
+            key=None,
+            header=VaultHeader(salt=b""),
+            entries=[dict(e) for e in entries],
+            next_id=max((e.get("id", 0) for e in entries), default=0) + 1,
+        )
+        return cls(session)
+
+    @property
+    def is_locked(self) -> bool:
+        return self.session is None
+
+    # ===== Change Events =====
+
+    def subscribe(self, listener: Callable[[VaultChange], None]) -> Callable:
+        """
+        Register a listener for committed changes.
+
+        Returns:
+            Function that removes the listener
+        """
+        self._listeners.append(listener)
+        return lambda: self._listeners.remove(listener)
+
+    def _emit(self):
+        """Deliver queued changes; called after releasing ``_lock``."""
+        with self._emit_lock:
+            while self._pending:
+                change = self._pending.popleft()
+                for listener in list(self._listeners):
+                    try:
+                        listener(change)
+                    except Exception:
+                        # The commit stands; don't fail it or starve the rest
+                        sys.excepthook(*sys.exc_info())
+
+    # ===== Queries =====
+
+    def snapshot(self) -> VaultSnapshot:
+        """
+        Return the last committed state in O(1) without taking the lock.
+        Note that entries referenced by a snapshot stay in memory until the
+        holder drops it, even after the vault is locked.
+        """
+        snapshot = self._snapshot
+        if snapshot is None:
+            raise VaultError("Vault is locked")
+        return snapshot
+
+    def get_all(self) -> List[dict]:
+        """Return all entries in insertion order."""
+        self._session()
+        return list(self._entries.values())
+
+    def get(self, entry_id: int) -> Optional[dict]:
+        """Return a single entry by id."""
+        self._session()
+        return self._entries.get(entry_id)
+
+    def count(self, where: Optional[Sequence[Filter]] = None) -> int:
+        """Number of entries (matching ``where``, see ``select``)."""
+        self._session()
+        if not where:
+            return len(self._entries)
+        with self._metadata_lock:
+            return self._metadata_index().count(where)
+
+    def select(
+        self,
+        where: Optional[Sequence[Filter]] = None,
+        order_by: str = "service",
+        descending: bool = False,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> List[dict]:
+        """
+        Entries filtered and sorted on their metadata with SQL.
+
+        Args:
+            where: (column, operator, value) filters that must all hold, e.g.
+                [("domain", "=", "company.com"), ("modified_at", "<", "2024-01-01")]
+            order_by: Column to sort on (see core.metadata.METADATA_COLUMNS)
+            descending: Sort from highest to lowest
+            limit: Maximum number of entries (all if None)
+            offset: Number of leading entries to skip
+
+        Raises:
+            ValueError: For an unknown column or operator
+        """
+        with self._metadata_lock:
+            ids = self._metadata_index().select(
+                where, order_by, descending, limit, offset
+            )
+            snapshot = self._snapshot
+        return [snapshot.get(i) for i in ids]
+
+    def group_counts(
+        self, column: str, where: Optional[Sequence[Filter]] = None
+    ) -> List[Tuple[str, int]]:
+        """(value, count) per distinct value of ``column``, largest first."""
+        with self._metadata_lock:
+            return self._metadata_index().group_counts(column, where)
+
+    async def select_async(self, *args, **kwargs) -> List[dict]:
+        """Coroutine version of ``select``."""
+        return await to_thread(self.select, *args, **kwargs)
+
+    def build_metadata_index(self):
+        """Build the metadata index now rather than on the first query."""
+        with self._metadata_lock:
+            self._metadata_index()
+
+    def _metadata_index(self) -> MetadataIndex:
+        """Build the metadata index on first use (caller holds the lock)."""
+        if self._snapshot is None:
+            raise VaultError("Vault is locked")
+        if self._metadata is None:
+            index = MetadataIndex()
+            index.load(self._snapshot)
+            self._metadata = index
+        return self._metadata
+
+    # ===== Mutations =====
+
+    @contextmanager
+    def batch(self) -> Iterator[VaultBatch]:
+        """
+        Group mutations into one transaction.
+        Nested batches join the outermost one. If the block raises, or
+        validation or the storage write fails, every change is rolled back.
+        """
+        with self._lock:
+            if self._batch is not None:
+                yield self._batch
+                return
+
+            session = self._session()
+            batch = VaultBatch(self._entries, session.next_id, session.saved_searches)
+            self._batch = batch
+            try:
+                yield batch
+                self._validate(batch)
+                if batch.touched or batch.metadata:
+                    self._write()
+            except BaseException:
+                if self.session is not None:
+                    self._entries = batch.restore(self.session)
+                raise
+            finally:
+                self._batch = None
+
+            generation = self.session.header.generation
+            batch.change = batch.build_change(self._entries, generation)
+            if not batch.change:
+                return
+            for entry_id in batch.change.removed:
+                self._usage.remove(entry_id)  # Already left out of the write
+            with self._metadata_lock:
+                if self._metadata is not None:
+                    self._metadata.apply(batch.change)
+                self._snapshot = VaultSnapshot(self._entries, generation)
+            self._pending.append(batch.change)
+
+        self._emit()
+
+    def add(self, data: dict) -> dict:
+        """Add a new entry and persist the vault."""
+        with self.batch() as batch:
+            session = self.session
+            today = datetime.now().strftime("%Y-%m-%d")
+
+            entry = {
+                "id": session.next_id,
+                **{k: data.get(k, "") for k in ENTRY_FIELDS},
+                "created_at": today,
+                "modified_at": today,
+            }
+            session.next_id += 1
+            self._entries = self._entries.set(entry["id"], entry)
+            batch.record(entry["id"], "added")
+            return entry
+
+    def update(self, entry_id: int, data: dict) -> dict:
+        """Update the editable fields of an entry and persist the vault."""
+        with self.batch() as batch:
+            old = self._entries.get(entry_id)
+            if old is None:
+                raise VaultError(f"No entry with id {entry_id}")
+
+            entry = {
+                **old,
+                **{k: data[k] for k in ENTRY_FIELDS if k in data},
+                "modified_at": datetime.now().strftime("%Y-%m-%d"),
+            }
+            self._entries = self._entries.set(entry_id, entry)
+            batch.record(entry_id, "updated")
+            return entry
+
+    def delete(self, entry_id: int):
+        """Delete an entry and persist the vault."""
+        with self.batch() as batch:
+            if entry_id not in self._entries:
+                raise VaultError(f"No entry with id {entry_id}")
+
+            self._entries = self._entries.delete(entry_id)
+            batch.record(entry_id, "removed")
+
+    def saved_searches(self) -> List[dict]:
+        """Saved searches ({"name", "query"}) in creation order."""
+        return [dict(s) for s in self._session().saved_searches]
+
+    def save_search(self, name: str, query: str):
+        """Save (or replace) a named search and persist the vault."""
+        name, query = name.strip(), query.strip()
+        if not name or not query:
+            raise VaultError("A saved search needs a name and a query")
+
+        with self.batch() as batch:
+            session = self.session
+            searches = [s for s in session.saved_searches if s["name"] != name]
+            searches.append({"name": name, "query": query})
+            session.saved_searches = searches
+            batch.record_metadata("saved_searches")
+
+    def delete_saved_search(self, name: str):
+        """Remove a named search and persist the vault."""
+        with self.batch() as batch:
+            session = self.session
+            searches = [s for s in session.saved_searches if s["name"] != name]
+            if len(searches) == len(session.saved_searches):
+                raise VaultError(f"No saved search named {name!r}")
+            session.saved_searches = searches
+            batch.record_metadata("saved_searches")
+
+    # ===== Usage =====
+
+    def record_use(self, key: Hashable):
+        """
+        Note one use of an entry id (copy, reveal) or palette action.
+        Kept in memory and persisted with the next write (see ``flush_usage``);
+        does not wait for a commit in progress, so it is cheap on the Tk thread.
+        """
+        self._session()
+        self._usage.bump(key)
+        self._usage_dirty = True
+
+    def usage_score(self, key: Hashable, now: Optional[float] = None) -> float:
+        """Current frecency score of ``key``."""
+        return self._usage.score(key, now)
+
+    def used_keys(self) -> List[Hashable]:
+        """Every key with a recorded use."""
+        return list(self._usage.keys())
+
+    def flush_usage(self):
+        """Persist usage recorded since the last write (a metadata-only commit)."""
+        with self.batch() as batch:
+            if self._usage_dirty:
+                batch.record_metadata("usage")
+
+    async def add_async(self, data: dict) -> dict:
+        """Coroutine version of ``add``; encryption and I/O run off-thread."""
+        return await to_thread(self.add, data)
+
+    async def update_async(self, entry_id: int, data: dict) -> dict:
+        """Coroutine version of ``update``."""
+        return await to_thread(self.update, entry_id, data)
+
+    async def delete_async(self, entry_id: int):
+        """Coroutine version of ``delete``."""
+        await to_thread(self.delete, entry_id)
+
+    async def batch_async(
+        self, operations: Callable[["VaultService"], Any]
+    ) -> VaultChange:
+        """
+        Run ``operations(vault)`` inside one batch, off the Tk thread.
+
+        Returns:
+            The committed (coalesced) VaultChange
+        """
+
+        def run():
+            with self.batch() as batch:
+                operations(self)
+            return batch.change
+
+        return await to_thread(run)
+
+    def _validate(self, batch: VaultBatch):
+        """Check every entry touched by the batch before it is written."""
+        for entry_id, op in batch.touched.items():
+            if op == "removed":
+                continue
+            entry = self._entries[entry_id]
+            missing = [f for f in REQUIRED_FIELDS if not entry.get(f)]
+            if missing:
+                raise VaultError(
+                    f"Entry {entry_id} is missing required field(s): "
+                    + ", ".join(missing)
+                )
+
+    # ===== Persistence =====
+
+    def save(self):
+        """Encrypt and write the vault, bumping its generation."""
+        with self._lock:
+            self._session()
+            self._write()
+
+    async def save_async(self):
+        """Coroutine version of ``save``."""
+        await to_thread(self.save)
+
+    def _write(self):
+        """Write the whole vault as one transaction (atomic file replace)."""
+        session = self.session
+        session.header.generation += 1
+        if self.storage is None or session.key is None:
+            return
+
+        entries = list(self._entries.values())
+
+        # Usage of deleted entries is dropped from memory once this commits
+        usage = [
+            row
+            for row in self._usage.dump()
+            if not isinstance(row[0], int) or row[0] in self._entries
+        ]
+        payload = encode_payload(
+            session.key, entries, session.next_id, session.saved_searches, usage
+        )
+        try:
+            self.storage.write(session.header, payload)
+        except BaseException:
+            session.header.generation -= 1
+            raise
+        self._usage_dirty = False
+
+    def lock(self):
+        """Wipe the key and decrypted entries from memory."""
+        with self._lock:
+            if self.session is not None:
+                self.session.wipe()
+            self.session = None
+            self._entries = PersistentMap()
+            self._usage = Frecency()
+            with self._metadata_lock:
+                self._snapshot = None
+                if self._metadata is not None:
+                    self._metadata.close()
+                    self._metadata = None
+
+    def _session(self) -> VaultSession:
+        if self.session is None:
+            raise VaultError("Vault is locked")
+        return self.session
@@ -0,0 +1,102 @@
+"""
+LockGuardium Lite - Table Renderer Benchmark
+Compares the widget-per-row and canvas vault tables (needs a display)
+
+Run from anywhere:
+    python src/lockguardium-lite/tools/benchmarks/table_renderers.py
+"""
+
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+from typing import Dict, List, Optional
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if APP_DIR not in sys.path:
+    sys.path.insert(0, APP_DIR)
+
+import customtkinter as ctk
+
+from ui.components.vault_page import VaultPage
+
+
+def benchmark_renderers(count: int = 20000, frames: int = 300) -> Dict[str, dict]:
+    """
+    Compare the widget-per-row and canvas vault tables.
+
+    For each renderer a VaultPage is built over ``count`` generated
+    entries and measured for first paint (construction until the first
+    idle redraw finishes), scroll rate (frames per second over ``frames``
+    one-row-per-frame scroll steps, each flushed to the screen) and
+    memory (Python allocations during construction and the number of Tk
+    widgets created).
+    """
+    passwords = [
+        {
+            "id": i,
+            "service": f"Service {i:05d}",
+            "email": f"user{i}@example{i % 50}.com",
+            "username": f"user_{i}",
+            "password": f"pw-{i:08d}",
+            "created_at": "2024-01-01T00:00:00",
+            "modified_at": "2024-01-01T00:00:00",
+        }
+        for i in range(count)
+    ]
+
+    def widget_count(widget) -> int:
+        return 1 + sum(widget_count(child) for child in widget.winfo_children())
+
+    root = ctk.CTk()
+    root.geometry("1100x750")
+    results = {}
+    for renderer in ("widgets", "canvas"):
+        tracemalloc.start()
+        start = time.perf_counter()
+        page = VaultPage(root, passwords=list(passwords), renderer=renderer)
+        page.pack(fill="both", expand=True)
+        root.update()
+        first_paint = time.perf_counter() - start
+        allocated = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        widgets = widget_count(page)
+
+        table = page.password_list
+        start = time.perf_counter()
+        for frame in range(frames):
+            table._scroll_to((frame + 1) * table.row_height)
+            root.update_idletasks()
+        fps = frames / (time.perf_counter() - start)
+
+        results[renderer] = {
+            "first_paint_ms": first_paint * 1000,
+            "scroll_fps": fps,
+            "allocated_kb": allocated / 1024,
+            "widgets": widgets,
+        }
+        page.destroy()
+
+    root.destroy()
+    return results
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[1])
+    parser.add_argument("--count", type=int, default=20000)
+    parser.add_argument("--frames", type=int, default=300)
+    args = parser.parse_args(argv)
+
+    for name, result in benchmark_renderers(args.count, args.frames).items():
+        print(
+            f"{name:8} first paint {result['first_paint_ms']:7.1f} ms   "
+            f"scroll {result['scroll_fps']:6.1f} fps   "
+            f"peak alloc {result['allocated_kb']:8.1f} KiB   "
+            f"widgets {result['widgets']}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,11 +1,20 @@
 """
 LockGuardium Lite - UI Package
 User interface components for the password vault application
+
+The windows are imported on first access so that importing any ``ui``
+module (the theme, the login view) doesn't load every page.
 """
 
+import importlib
+
 from ui.theme import Colors, Fonts, Dimensions, Styles, Animation
-from ui.login_window import LoginWindow
-from ui.main_window import MainWindow
+
+# Lazily exported name -> module that defines it
+_LAZY_EXPORTS = {
+    "LoginWindow": "ui.login_window",
+    "MainWindow": "ui.main_window",
+}
 
 __all__ = [
     "Colors",
@@ -16,3 +25,15 @@ __all__ = [
     "LoginWindow",
     "MainWindow",
 ]
+
+
+def __getattr__(name: str):
+    if name not in _LAZY_EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY_EXPORTS[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,98 @@
+"""
+LockGuardium Lite - Clipboard Service
+Copies secrets to the clipboard and clears them again after a timeout
+"""
+
+import hashlib
+import secrets
+from tkinter import TclError
+from typing import Optional
+import os
+import sys
+
+# Add parent directories to path for imports when run as a script
+if not __package__:
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ui.scheduler import scheduler_for
+from ui.theme import PLACEHOLDER_SETTINGS
+
+
+class ClipboardService:
+    """
+    The application's clipboard, with auto-clear for copied secrets.
+
+    There is at most one pending clear: every ``copy`` replaces the value
+    and restarts the countdown from ``clear_seconds``. When it runs out
+    the clipboard is emptied only if it still holds what we copied, so
+    something the user copied elsewhere in the meantime survives. Only a
+    keyed digest of the copied value is kept for that check, never the
+    value itself.
+
+    The countdown runs on the root's scheduler, so it keeps going while
+    the window is hidden or iconified and across lock and unlock; call
+    ``clear`` on lock and before the root is destroyed.
+    """
+
+    def __init__(self, widget, clear_seconds: Optional[int] = None):
+        self.widget = widget
+        self.scheduler = scheduler_for(widget)
+        self.clear_seconds = (
+            PLACEHOLDER_SETTINGS["clipboard_clear_seconds"]
+            if clear_seconds is None
+            else clear_seconds
+        )
+
+        # Per-process key, so the stored digest can't be checked offline
+        self._key = secrets.token_bytes(16)
+        self._digest: Optional[bytes] = None
+
+    def copy(self, value: str):
+        """Put ``value`` on the clipboard and (re)start the clear countdown."""
+        self.widget.clipboard_clear()
+        self.widget.clipboard_append(value)
+        self._digest = self._hash(value)
+
+        if self.clear_seconds > 0:
+            self.scheduler.after(
+                self.clear_seconds * 1000, self.clear, key=(self, "clear")
+            )
+
+    @property
+    def pending(self) -> bool:
+        """True while a copied value is waiting to be cleared."""
+        return self._digest is not None
+
+    def clear(self) -> bool:
+        """
+        Empty the clipboard now if it still holds the last copied value.
+
+        Returns:
+            True if the clipboard was cleared
+        """
+        self.scheduler.cancel((self, "clear"))
+        digest, self._digest = self._digest, None
+        if digest is None:
+            return False
+
+        try:
+            current = self.widget.clipboard_get()
+        except TclError:
+            return False  # Empty, or holds something other than text
+        if not secrets.compare_digest(self._hash(current), digest):
+            return False
+
+        self.widget.clipboard_clear()
+        return True
+
+    def _hash(self, value: str) -> bytes:
+        return hashlib.blake2b(value.encode("utf-8"), key=self._key).digest()
+
+
+def clipboard_for(widget) -> ClipboardService:
+    """The clipboard service shared by every widget under ``widget``'s Tk root."""
+    root = widget._root()
+    service = getattr(root, "_lockguardium_clipboard", None)
+    if service is None:
+        service = root._lockguardium_clipboard = ClipboardService(root)
+    return service
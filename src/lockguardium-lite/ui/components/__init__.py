@@ -1,25 +1,40 @@
 """
 LockGuardium Lite - UI Components Package
+
+Components are imported on first access (``ui.components.VaultPage``) so
+importing one component module doesn't load all the others.
 """
 
-from ui.components.sidebar import Sidebar
-from ui.components.dashboard import DashboardPage
-from ui.components.vault_page import VaultPage
-from ui.components.generator_page import GeneratorPage
-from ui.components.settings_page import SettingsPage
-from ui.components.dialogs import (
-    AddPasswordDialog,
-    EditPasswordDialog,
-    DeleteConfirmDialog,
-)
-
-__all__ = [
-    "Sidebar",
-    "DashboardPage",
-    "VaultPage",
-    "GeneratorPage",
-    "SettingsPage",
-    "AddPasswordDialog",
-    "EditPasswordDialog",
-    "DeleteConfirmDialog",
-]
+import importlib
+
+# Exported name -> module that defines it
+_EXPORTS = {
+    "Sidebar": "ui.components.sidebar",
+    "DashboardPage": "ui.components.dashboard",
+    "VaultPage": "ui.components.vault_page",
+    "GeneratorPage": "ui.components.generator_page",
+    "SettingsPage": "ui.components.settings_page",
+    "CommandPalette": "ui.components.command_palette",
+    "VirtualList": "ui.components.virtual_list",
+    "CanvasTable": "ui.components.canvas_table",
+    "AddPasswordDialog": "ui.components.dialogs",
+    "EditPasswordDialog": "ui.components.dialogs",
+    "DeleteConfirmDialog": "ui.components.dialogs",
+    "SaveSearchDialog": "ui.components.dialogs",
+    "BulkConfirmDialog": "ui.components.dialogs",
+    "BulkEditDialog": "ui.components.dialogs",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_EXPORTS[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,468 @@
+"""
+LockGuardium Lite - Canvas Table Component
+Vault table drawn as text and shapes on a single canvas
+"""
+
+import customtkinter as ctk
+import tkinter as tk
+import tkinter.font as tkfont
+from typing import Any, Callable, Dict, Hashable, List, Optional, Sequence, Set
+import os
+import sys
+
+# Add parent directories to path for imports when run as a script
+if not __package__:
+    sys.path.insert(
+        0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    )
+
+from ui.theme import Colors, Fonts
+from ui.components.virtual_list import ScrolledViewport, selection_mode
+from ui.clipboard import clipboard_for
+from ui.scheduler import scheduler_for
+
+MASK = "••••••••"
+
+
+class _Slot:
+    """Canvas items drawing one row, reused for whichever entry is on screen."""
+
+    __slots__ = ("tag", "rect", "texts", "reveal", "copy", "item", "y")
+
+    def __init__(self, tag: str, rect: int, texts: List[int], reveal: int, copy: int):
+        self.tag = tag
+        self.rect = rect
+        self.texts = texts  # service, email, username, password
+        self.reveal = reveal
+        self.copy = copy
+        self.item: Any = None
+        self.y: Optional[float] = None
+
+
+class CanvasTable(ScrolledViewport):
+    """
+    Vault table rendered on one ``tk.Canvas`` instead of a widget per row.
+
+    Each visible row is a rectangle, four text items and two icon items.
+    Like VirtualList, the canvas items of a row stay with the entry (by
+    ``key``) while it is on screen: scrolling moves them with a single
+    ``move`` per row, and only rows for entries that scrolled in have
+    their text replaced. Clicks are hit-tested arithmetically from the
+    scroll offset and column layout, so no per-row bindings exist.
+
+    ``on_select(item, mode)`` receives the ``selection_mode`` of the click
+    or key. Keyboard: Up/Down/Page Up/Page Down/Home/End move the
+    selection (extending it with Shift), Space reveals the focused
+    password and Ctrl+C copies it.
+    """
+
+    # Space left between rows, in logical pixels
+    ROW_GAP = 6
+
+    # Column weights (service, email, username, password) and the
+    # fixed actions area on the right, matching the widget table
+    COLUMN_WEIGHTS = (2, 3, 2, 2)
+    ACTIONS_WIDTH = 90
+    PADDING = 15
+
+    # How long the copy icon shows a check mark
+    COPIED_MS = 1500
+
+    def __init__(
+        self,
+        parent,
+        row_height: int,
+        key: Callable[[Any], Hashable] = id,
+        is_selected: Optional[Callable[[Any], bool]] = None,
+        on_select: Optional[Callable[[Any, str], None]] = None,
+        on_reveal: Optional[Callable[[Any, bool], None]] = None,
+        on_copy: Optional[Callable[[Any], None]] = None,
+        empty_text: str = "No items",
+        **kwargs,
+    ):
+        self.key = key
+        self.is_selected = is_selected or (lambda item: False)
+        self.on_select = on_select
+        self.on_reveal = on_reveal
+        self.on_copy = on_copy
+        self.empty_text = empty_text
+
+        # Slots on screen by item key, and spares for rows scrolling in
+        self._slots: Dict[Hashable, _Slot] = {}
+        self._spare: List[_Slot] = []
+        self._slot_count = 0
+        self._revealed: Set[Hashable] = set()
+        self._copied: Set[Hashable] = set()
+        self._positions: Optional[Dict[Hashable, int]] = None
+        self._cursor: Optional[Hashable] = None
+
+        # Geometry in real pixels; recomputed when width or scaling changes
+        self._width = 0
+        self._scale = 1.0
+        self._columns: List[tuple] = []
+        self._fit_cache: Dict[tuple, str] = {}
+
+        super().__init__(parent, row_height, **kwargs)
+
+        self._scale = self._get_widget_scaling()
+        self.font = tkfont.Font(
+            family=Fonts.FAMILY_MONO[0], size=-round(Fonts.SIZE_BODY * self._scale)
+        )
+        self.icon_font = tkfont.Font(
+            family=Fonts.FAMILY_MONO[0], size=-round(14 * self._scale)
+        )
+        self._empty = self.viewport.create_text(
+            0,
+            50 * self._scale,
+            text=empty_text,
+            anchor="n",
+            font=self.font,
+            fill=Colors.TEXT_MUTED,
+            state="hidden",
+        )
+
+        canvas = self.viewport
+        canvas.bind("<Button-1>", self._on_click)
+        for sequence, step in (
+            ("<Up>", -1),
+            ("<Down>", 1),
+            ("<Prior>", "page-up"),
+            ("<Next>", "page-down"),
+            ("<Home>", "home"),
+            ("<End>", "end"),
+        ):
+            canvas.bind(sequence, lambda e, s=step: self._move_cursor(s, e))
+            canvas.bind(
+                sequence.replace("<", "<Shift-"),
+                lambda e, s=step: self._move_cursor(s, e),
+            )
+        canvas.bind("<space>", lambda e: self._reveal_cursor())
+        canvas.bind("<Control-c>", lambda e: self._copy_cursor())
+
+    def _create_viewport(self):
+        return tk.Canvas(
+            self,
+            bg=Colors.BG_SECONDARY,
+            highlightthickness=0,
+            borderwidth=0,
+            takefocus=1,
+        )
+
+    # ===== Public API =====
+
+    def set_items(self, items: Sequence, reset_scroll: bool = False):
+        self._positions = None
+        super().set_items(items, reset_scroll)
+
+    def refresh(self):
+        """Redraw every visible row."""
+        for slot in self._slots.values():
+            slot.item = None
+        self._layout()
+
+    def set_selected(self, key: Hashable, selected: bool):
+        """Recolour the row of ``key`` (if on screen) for its selection state."""
+        slot = self._slots.get(key)
+        if slot is not None:
+            self.viewport.itemconfigure(
+                slot.rect, fill=Colors.GREEN_DARK if selected else Colors.BG_TERTIARY
+            )
+
+    def index_of(self, key: Hashable) -> Optional[int]:
+        """Position of the item with ``key`` in ``items``, if present."""
+        if self._positions is None:
+            self._positions = {self.key(item): i for i, item in enumerate(self.items)}
+        return self._positions.get(key)
+
+    # ===== Geometry =====
+
+    def _on_resize(self, event):
+        width_changed = event.width != self._width
+        if width_changed:
+            self._width = event.width
+            self._fit_cache.clear()
+            self._compute_columns()
+            self.viewport.coords(self._empty, event.width / 2, 50 * self._scale)
+            for slot in self._slots.values():
+                slot.item = None  # Re-fit text to the new column widths
+        super()._on_resize(event)
+        if width_changed:
+            self._layout()
+
+    def _compute_columns(self):
+        """(x, width) of each text column in real pixels."""
+        scale = self._scale
+        pad = self.PADDING * scale
+        actions = self.ACTIONS_WIDTH * scale
+        usable = max(self._width - 2 * pad - actions, 0)
+        total = sum(self.COLUMN_WEIGHTS)
+
+        self._columns = []
+        x = pad
+        for weight in self.COLUMN_WEIGHTS:
+            width = usable * weight / total
+            self._columns.append((x, width - 10 * scale))
+            x += width
+
+    def _actions_x(self) -> float:
+        """Left edge of the actions area in real pixels."""
+        return self._width - (self.PADDING + self.ACTIONS_WIDTH) * self._scale
+
+    def _fit(self, text: str, width: float) -> str:
+        """``text`` truncated with an ellipsis to fit ``width`` pixels."""
+        cache_key = (text, width)
+        fitted = self._fit_cache.get(cache_key)
+        if fitted is not None:
+            return fitted
+
+        measure = self.font.measure
+        if width <= 0:
+            fitted = ""
+        elif measure(text) <= width:
+            fitted = text
+        else:
+            low, high = 0, len(text)
+            while low < high:
+                mid = (low + high + 1) // 2
+                if measure(text[:mid] + "…") <= width:
+                    low = mid
+                else:
+                    high = mid - 1
+            fitted = text[:low] + "…"
+
+        if len(self._fit_cache) > 4096:
+            self._fit_cache.clear()
+        self._fit_cache[cache_key] = fitted
+        return fitted
+
+    # ===== Rendering =====
+
+    def _take_slot(self) -> _Slot:
+        """A spare slot, or new canvas items if there is none."""
+        if self._spare:
+            slot = self._spare.pop()
+            self.viewport.itemconfigure(slot.tag, state="normal")
+            return slot
+
+        canvas = self.viewport
+        self._slot_count += 1
+        tag = f"row{self._slot_count}"
+        rect = canvas.create_rectangle(
+            0, 0, 0, 0, outline="", fill=Colors.BG_TERTIARY, tags=(tag,)
+        )
+        texts = [
+            canvas.create_text(
+                0,
+                0,
+                anchor="w",
+                font=self.font,
+                fill=Colors.GREEN_PRIMARY,
+                tags=(tag,),
+            )
+            for _ in self.COLUMN_WEIGHTS
+        ]
+        icons = [
+            canvas.create_text(
+                0,
+                0,
+                anchor="center",
+                text=text,
+                font=self.icon_font,
+                fill=Colors.GREEN_PRIMARY,
+                tags=(tag,),
+            )
+            for text in ("👁", "📋")
+        ]
+        return _Slot(tag, rect, texts, *icons)
+
+    def _draw(self, slot: _Slot, item: Any, key: Hashable, y: float):
+        """Draw ``item`` into ``slot`` with its row top at ``y`` (real pixels)."""
+        canvas = self.viewport
+        scale = self._scale
+        bottom = y + (self.row_height - self.ROW_GAP) * scale
+        middle = (y + bottom) / 2
+
+        canvas.coords(slot.rect, 2 * scale, y, self._width - 2 * scale, bottom)
+        canvas.itemconfigure(
+            slot.rect,
+            fill=Colors.GREEN_DARK if self.is_selected(item) else Colors.BG_TERTIARY,
+        )
+
+        revealed = key in self._revealed
+        values = (
+            item.get("service", ""),
+            item.get("email", ""),
+            item.get("username", ""),
+            item.get("password", "") if revealed else MASK,
+        )
+        for text_id, (x, width), value in zip(slot.texts, self._columns, values):
+            canvas.coords(text_id, x, middle)
+            canvas.itemconfigure(text_id, text=self._fit(value, width))
+
+        actions_x = self._actions_x()
+        canvas.coords(slot.reveal, actions_x + 25 * scale, middle)
+        canvas.itemconfigure(slot.reveal, text="🙈" if revealed else "👁")
+        canvas.coords(slot.copy, actions_x + 65 * scale, middle)
+        canvas.itemconfigure(slot.copy, text="✓" if key in self._copied else "📋")
+
+        slot.item, slot.y = item, y
+
+    def _layout(self):
+        """Reconcile the drawn rows with the items visible at ``offset``."""
+        if not self._width:
+            return
+
+        first, visible, shift = self._visible_range()
+        window = self.items[first : first + visible]
+        keys = [self.key(item) for item in window]
+        canvas = self.viewport
+
+        # Rows whose item left the screen are hidden and masked again
+        wanted = set(keys)
+        for key in [k for k in self._slots if k not in wanted]:
+            slot = self._slots.pop(key)
+            canvas.itemconfigure(slot.tag, state="hidden")
+            slot.item = slot.y = None
+            self._revealed.discard(key)
+            self._spare.append(slot)
+
+        pitch = self.row_height * self._scale
+        top = -shift * self._scale
+        for position, (key, item) in enumerate(zip(keys, window)):
+            y = top + position * pitch
+            slot = self._slots.get(key)
+            if slot is None:
+                slot = self._slots[key] = self._take_slot()
+
+            if slot.item is not item:
+                self._draw(slot, item, key, y)
+            elif slot.y != y:
+                canvas.move(slot.tag, 0, y - slot.y)
+                slot.y = y
+
+        canvas.itemconfigure(self._empty, state="hidden" if self.items else "normal")
+        self._update_scrollbar()
+
+    # ===== Hit Testing =====
+
+    def _hit(self, x: float, y: float):
+        """(item, part) under canvas point (x, y); part is select/reveal/copy."""
+        scale = self._scale
+        logical_y = y / scale + self.offset
+        index, within = divmod(int(logical_y), self.row_height)
+        if within >= self.row_height - self.ROW_GAP or not (
+            0 <= index < len(self.items)
+        ):
+            return None, None
+
+        item = self.items[index]
+        actions_x = self._actions_x()
+        if x >= actions_x + 45 * scale:
+            return item, "copy"
+        if x >= actions_x + 5 * scale:
+            return item, "reveal"
+        return item, "select"
+
+    def _on_click(self, event):
+        self.viewport.focus_set()
+        item, part = self._hit(event.x, event.y)
+        if item is None:
+            return
+        if part == "reveal":
+            self._toggle_reveal(item)
+        elif part == "copy":
+            self._copy(item)
+        else:
+            self._select(item, selection_mode(event))
+
+    def _select(self, item: Any, mode: str):
+        """Report a selection and keep it as the keyboard cursor."""
+        self._cursor = self.key(item)
+        if self.on_select:
+            self.on_select(item, mode)
+
+    def _toggle_reveal(self, item: Any):
+        key = self.key(item)
+        revealed = key not in self._revealed
+        if revealed:
+            self._revealed.add(key)
+        else:
+            self._revealed.discard(key)
+
+        slot = self._slots.get(key)
+        if slot is not None:
+            self._draw(slot, item, key, slot.y)
+        if self.on_reveal:
+            self.on_reveal(item, revealed)
+
+    def _copy(self, item: Any):
+        key = self.key(item)
+        clipboard_for(self).copy(item.get("password", ""))
+
+        # Visual feedback; a later copy of the same row restarts the timer
+        self._copied.add(key)
+        scheduler_for(self).after(
+            self.COPIED_MS, self._end_copied, key, key=(self, "copied", key)
+        )
+        slot = self._slots.get(key)
+        if slot is not None:
+            self.viewport.itemconfigure(slot.copy, text="✓")
+
+        if self.on_copy:
+            self.on_copy(item)
+
+    def _end_copied(self, key: Hashable):
+        self._copied.discard(key)
+        slot = self._slots.get(key)
+        if slot is not None:
+            self.viewport.itemconfigure(slot.copy, text="📋")
+
+    # ===== Keyboard =====
+
+    def _cursor_item(self) -> Any:
+        index = self.index_of(self._cursor) if self._cursor is not None else None
+        return None if index is None else self.items[index]
+
+    def _move_cursor(self, step, event=None) -> str:
+        if not self.items:
+            return "break"
+
+        index = self.index_of(self._cursor) if self._cursor is not None else None
+        page = max(self._viewport_height // self.row_height - 1, 1)
+        last = len(self.items) - 1
+        if step == "home":
+            index = 0
+        elif step == "end":
+            index = last
+        elif index is None:
+            index = 0 if step in (1, "page-down") else last
+        elif step == "page-up":
+            index = max(index - page, 0)
+        elif step == "page-down":
+            index = min(index + page, last)
+        else:
+            index = min(max(index + step, 0), last)
+
+        self.scroll_to_index(index)
+        mode = "extend" if selection_mode(event) == "extend" else "replace"
+        self._select(self.items[index], mode)
+        return "break"
+
+    def _reveal_cursor(self) -> str:
+        item = self._cursor_item()
+        if item is not None:
+            self._toggle_reveal(item)
+        return "break"
+
+    def _copy_cursor(self) -> str:
+        item = self._cursor_item()
+        if item is not None:
+            self._copy(item)
+        return "break"
+
+    def destroy(self):
+        scheduler = scheduler_for(self)
+        for key in self._copied:
+            scheduler.cancel((self, "copied", key))
+        self._copied.clear()
+        super().destroy()
@@ -0,0 +1,225 @@
+"""
+LockGuardium Lite - Command Palette
+Ctrl+K quick switcher over vault entries and actions
+"""
+
+import customtkinter as ctk
+from typing import Callable, List, Optional
+import os
+import sys
+
+# Add parent directories to path for imports when run as a script
+if not __package__:
+    sys.path.insert(
+        0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    )
+
+from ui.theme import Colors, Fonts, Dimensions, Styles
+from services.palette_service import PaletteItem, PaletteService
+from services.runtime import TkBridge
+
+
+class CommandPalette(ctk.CTkToplevel):
+    """
+    Quick switcher window.
+
+    Opens with the most used items listed, so Ctrl+K then Enter copies the
+    favourite password. Typing narrows the list, Up/Down move the highlight,
+    Enter runs the highlighted item and Escape closes. The window is created
+    once and hidden between uses.
+    """
+
+    WIDTH = 520
+    ROW_HEIGHT = 34
+
+    def __init__(
+        self,
+        parent,
+        palette_service: PaletteService,
+        on_choose: Optional[Callable[[PaletteItem], None]] = None,
+        **kwargs,
+    ):
+        super().__init__(parent, **kwargs)
+
+        self.parent = parent
+        self.palette_service = palette_service
+        self.on_choose = on_choose
+
+        self.items: List[PaletteItem] = []
+        self.index = 0
+
+        # Queries run on the service loop; Enter before results waits for them
+        self.bridge = TkBridge(self)
+        self._future = None
+        self._text: Optional[str] = None
+        self._submit_when_ready = False
+
+        self.title("Quick Switch")
+        self.resizable(False, False)
+        self.configure(fg_color=Colors.BG_PRIMARY)
+        self.transient(parent)
+        self.protocol("WM_DELETE_WINDOW", self.hide)
+
+        self._create_widgets()
+        self.withdraw()
+
+    def _create_widgets(self):
+        """Create the query entry and the (reused) result rows."""
+        content = ctk.CTkFrame(self, fg_color=Colors.TRANSPARENT)
+        content.pack(fill="both", expand=True, padx=12, pady=12)
+
+        self.query_entry = ctk.CTkEntry(
+            content,
+            placeholder_text="Jump to an entry or action...",
+            height=40,
+            **Styles.ENTRY,
+        )
+        self.query_entry.pack(fill="x", pady=(0, 8))
+        self.query_entry.bind("<KeyRelease>", self._on_type)
+        self.query_entry.bind("<Up>", lambda e: self._move(-1))
+        self.query_entry.bind("<Down>", lambda e: self._move(1))
+        self.query_entry.bind("<Return>", self._submit)
+        self.query_entry.bind("<Escape>", lambda e: self.hide())
+
+        self.rows: List[ctk.CTkLabel] = []
+        for i in range(PaletteService.DEFAULT_LIMIT):
+            row = ctk.CTkLabel(
+                content,
+                text="",
+                height=self.ROW_HEIGHT,
+                anchor="w",
+                font=Fonts.body(),
+                text_color=Colors.GREEN_PRIMARY,
+                corner_radius=Dimensions.RADIUS_SMALL,
+            )
+            row.bind("<Button-1>", lambda e, i=i: self._choose(i))
+            self.rows.append(row)
+
+        self.empty_label = ctk.CTkLabel(
+            content,
+            text="No matches",
+            font=Fonts.small(),
+            text_color=Colors.TEXT_MUTED,
+        )
+
+    # ===== Open / Close =====
+
+    def open(self):
+        """Show the palette over the parent window with an empty query."""
+        self.query_entry.delete(0, "end")
+        self._submit_when_ready = False
+
+        height = 76 + self.ROW_HEIGHT * PaletteService.DEFAULT_LIMIT
+        x = self.parent.winfo_rootx() + (self.parent.winfo_width() - self.WIDTH) // 2
+        y = self.parent.winfo_rooty() + 80
+        self.geometry(f"{self.WIDTH}x{height}+{x}+{y}")
+
+        self.deiconify()
+        self.lift()
+        self.query_entry.focus_set()
+        self._query("")
+
+    def hide(self):
+        """Hide the palette and drop any query in flight."""
+        if self._future is not None:
+            self.bridge.cancel(self._future)
+            self._future = None
+        self._submit_when_ready = False
+        self.withdraw()
+        self.parent.focus_set()
+
+    def clear(self):
+        """Hide the palette and forget its results (e.g. when the vault locks)."""
+        self.hide()
+        self.query_entry.delete(0, "end")
+        self._text = None
+        self.items = []
+        self._render()
+
+    def destroy(self):
+        self.bridge.cancel_all()
+        super().destroy()
+
+    # ===== Querying =====
+
+    def _on_type(self, event=None):
+        text = self.query_entry.get()
+        if text != self._text:
+            self._query(text)
+
+    def _query(self, text: str):
+        """Ask the service for results; only the newest query is shown."""
+        self._text = text
+        if self._future is not None:
+            self.bridge.cancel(self._future)
+        self._future = self.bridge.call(
+            self.palette_service.query_async(text),
+            on_success=self._show,
+            on_error=self._on_error,
+        )
+
+    def _show(self, items: List[PaletteItem]):
+        self._future = None
+        self.items = items
+        self.index = 0
+        self.empty_label.configure(text="No matches", text_color=Colors.TEXT_MUTED)
+        self._render()
+
+        if self._submit_when_ready:
+            self._submit_when_ready = False
+            self._submit()
+
+    def _on_error(self, error: BaseException):
+        """Show the failure in place of results; typing again retries."""
+        self._future = None
+        self._submit_when_ready = False
+        self._text = None
+        self.items = []
+        self.index = 0
+        self.empty_label.configure(
+            text=f"Search failed: {error}", text_color=Colors.ERROR
+        )
+        self._render()
+        self._root().report_callback_exception(type(error), error, error.__traceback__)
+
+    def _render(self):
+        """Fill the reused rows with the current items."""
+        for i, row in enumerate(self.rows):
+            if i >= len(self.items):
+                row.pack_forget()
+                continue
+            item = self.items[i]
+            icon = "⚡" if item.is_action else "🔑"
+            detail = f"   {item.detail}" if item.detail else ""
+            row.configure(
+                text=f"  {icon}  {item.label}{detail}",
+                fg_color=Colors.GREEN_DARK if i == self.index else Colors.TRANSPARENT,
+            )
+            row.pack(fill="x", pady=1)
+
+        if self.items:
+            self.empty_label.pack_forget()
+        else:
+            self.empty_label.pack(pady=20)
+
+    def _move(self, step: int):
+        if self.items:
+            self.index = (self.index + step) % len(self.items)
+            self._render()
+        return "break"
+
+    # ===== Choosing =====
+
+    def _submit(self, event=None):
+        """Run the highlighted item (or the first result once it arrives)."""
+        if self._future is not None:
+            self._submit_when_ready = True
+        elif self.items:
+            self._choose(self.index)
+        return "break"
+
+    def _choose(self, index: int):
+        item = self.items[index]
+        self.hide()
+        if self.on_choose:
+            self.on_choose(item)
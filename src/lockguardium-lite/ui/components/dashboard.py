@@ -4,16 +4,19 @@ Overview dashboard showing password statistics
 """
 
 import customtkinter as ctk
-from typing import Optional
+from datetime import datetime
+from typing import Optional, List
 import os
 import sys
 
-# Add parent directories to path for imports
-sys.path.insert(
-    0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-)
+# Add parent directories to path for imports when run as a script
+if not __package__:
+    sys.path.insert(
+        0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    )
 
 from ui.theme import Colors, Fonts, Dimensions, Styles, PLACEHOLDER_PASSWORDS
+from services.vault_service import VaultService
 
 
 class StatCard(ctk.CTkFrame):
@@ -85,13 +88,24 @@ class DashboardPage(ctk.CTkFrame):
     Dashboard page showing password statistics and recent activity.
     """
 
-    def __init__(self, parent, **kwargs):
+    # Entries listed under Recent Activity
+    ACTIVITY_LIMIT = 5
+
+    def __init__(
+        self,
+        parent,
+        passwords: Optional[List[dict]] = None,
+        vault_service: Optional[VaultService] = None,
+        **kwargs,
+    ):
         super().__init__(parent, **kwargs)
 
         self.configure(fg_color=Colors.BG_PRIMARY)
 
-        # Load placeholder data
-        self.passwords = PLACEHOLDER_PASSWORDS
+        # Statistics are queried from the vault (placeholder data when run standalone)
+        self.vault_service = vault_service or VaultService.in_memory(
+            passwords if passwords is not None else PLACEHOLDER_PASSWORDS
+        )
 
         # Create widgets
         self._create_widgets()
@@ -118,7 +132,7 @@ class DashboardPage(ctk.CTkFrame):
         cards_frame.grid_columnconfigure((0, 1, 2), weight=1, uniform="cards")
 
         # Total passwords card
-        total_count = len(self.passwords)
+        total_count = self.vault_service.count()
         self.total_card = StatCard(
             cards_frame,
             icon="🔐",
@@ -203,20 +217,34 @@ class DashboardPage(ctk.CTkFrame):
         activity_title.pack(side="left")
 
         # Activity list
-        activity_list = ctk.CTkFrame(activity_frame, fg_color=Colors.TRANSPARENT)
-        activity_list.pack(fill="both", expand=True, padx=20, pady=(0, 20))
+        self.activity_list = ctk.CTkFrame(activity_frame, fg_color=Colors.TRANSPARENT)
+        self.activity_list.pack(fill="both", expand=True, padx=20, pady=(0, 20))
+
+        self._render_activity()
 
-        # Show recent activities (placeholder)
+    def _render_activity(self):
+        """List the most recently changed entries."""
+        for child in self.activity_list.winfo_children():
+            child.destroy()
+
+        recent = self.vault_service.select(
+            order_by="modified_at", descending=True, limit=self.ACTIVITY_LIMIT
+        )
         activities = [
-            ("Twitter/X password was modified", "Jan 22, 2025"),
-            ("Google password was modified", "Jan 20, 2025"),
-            ("Netflix password was modified", "Jan 18, 2025"),
-            ("Google password was added", "Jan 15, 2025"),
-            ("GitHub password was added", "Jan 10, 2025"),
+            (
+                f"{entry.get('service', 'Unknown')} password was "
+                + (
+                    "added"
+                    if entry.get("created_at") == entry.get("modified_at")
+                    else "modified"
+                ),
+                self._format_date(entry.get("modified_at", "")),
+            )
+            for entry in recent
         ]
 
         for activity, date in activities:
-            row = ctk.CTkFrame(activity_list, fg_color=Colors.TRANSPARENT)
+            row = ctk.CTkFrame(self.activity_list, fg_color=Colors.TRANSPARENT)
             row.pack(fill="x", pady=5)
 
             bullet = ctk.CTkLabel(
@@ -236,14 +264,13 @@ class DashboardPage(ctk.CTkFrame):
 
     def _get_last_added(self) -> dict:
         """Get the most recently added password."""
-        if not self.passwords:
+        latest = self.vault_service.select(
+            order_by="created_at", descending=True, limit=1
+        )
+        if not latest:
             return {"service": "None", "date": "-"}
 
-        # Sort by created_at (descending)
-        sorted_passwords = sorted(
-            self.passwords, key=lambda x: x.get("created_at", ""), reverse=True
-        )
-        latest = sorted_passwords[0]
+        latest = latest[0]
         return {
             "service": latest.get("service", "Unknown"),
             "date": latest.get("created_at", "-"),
@@ -251,14 +278,13 @@ class DashboardPage(ctk.CTkFrame):
 
     def _get_last_modified(self) -> dict:
         """Get the most recently modified password."""
-        if not self.passwords:
+        latest = self.vault_service.select(
+            order_by="modified_at", descending=True, limit=1
+        )
+        if not latest:
             return {"service": "None", "date": "-"}
 
-        # Sort by modified_at (descending)
-        sorted_passwords = sorted(
-            self.passwords, key=lambda x: x.get("modified_at", ""), reverse=True
-        )
-        latest = sorted_passwords[0]
+        latest = latest[0]
         return {
             "service": latest.get("service", "Unknown"),
             "date": latest.get("modified_at", "-"),
@@ -279,7 +305,25 @@ class DashboardPage(ctk.CTkFrame):
         # This would navigate to vault page with search focus
         print("Search vault clicked")
 
+    @staticmethod
+    def _format_date(value: str) -> str:
+        """Show a stored YYYY-MM-DD date as e.g. "Jan 22, 2025"."""
+        try:
+            return datetime.strptime(value, "%Y-%m-%d").strftime("%b %d, %Y")
+        except ValueError:
+            return value or "-"
+
     def refresh(self):
         """Refresh the dashboard with updated data."""
-        # In a real implementation, this would reload data from the vault service
-        pass
+        if self.vault_service.is_locked:
+            return
+
+        self.total_card.update_value(str(self.vault_service.count()))
+
+        last_added = self._get_last_added()
+        self.added_card.update_value(last_added["service"], last_added["date"])
+
+        last_modified = self._get_last_modified()
+        self.modified_card.update_value(last_modified["service"], last_modified["date"])
+
+        self._render_activity()
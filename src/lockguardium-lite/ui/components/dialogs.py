@@ -1,17 +1,18 @@
 """
 LockGuardium Lite - Dialog Components
-Modal dialogs for Add, Edit, and Delete operations
+Modal dialogs for Add, Edit, Delete and bulk operations
 """
 
 import customtkinter as ctk
-from typing import Optional, Callable, Dict
+from typing import Optional, Callable, Dict, List
 import os
 import sys
 
-# Add parent directories to path for imports
-sys.path.insert(
-    0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-)
+# Add parent directories to path for imports when run as a script
+if not __package__:
+    sys.path.insert(
+        0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    )
 
 from ui.theme import Colors, Fonts, Dimensions, Styles
 
@@ -517,3 +518,292 @@ class MessageDialog(BaseDialog):
         """Close dialog."""
         self.result = True
         self.destroy()
+
+
+class SaveSearchDialog(BaseDialog):
+    """Dialog for naming the current search as a smart folder."""
+
+    def __init__(self, parent, query: str, **kwargs):
+        super().__init__(parent, title="Save Search", width=400, height=260, **kwargs)
+
+        self.query = query
+
+        self._create_widgets()
+
+    def _create_widgets(self):
+        """Create dialog widgets."""
+        # Main content frame
+        content = ctk.CTkFrame(self, fg_color=Colors.TRANSPARENT)
+        content.pack(fill="both", expand=True, padx=30, pady=20)
+
+        # Query being saved
+        query_label = ctk.CTkLabel(
+            content,
+            text=self.query,
+            font=Fonts.small(),
+            text_color=Colors.TEXT_MUTED,
+            wraplength=330,
+        )
+        query_label.pack(pady=(0, 10))
+
+        # Name field
+        name_label = ctk.CTkLabel(
+            content,
+            text="Folder name *",
+            font=Fonts.body(),
+            text_color=Colors.GREEN_PRIMARY,
+            anchor="w",
+        )
+        name_label.pack(fill="x", pady=(0, 5))
+
+        self.name_entry = ctk.CTkEntry(
+            content,
+            placeholder_text="e.g. Work accounts",
+            height=40,
+            **Styles.ENTRY,
+        )
+        self.name_entry.pack(fill="x", pady=(0, 20))
+        self.name_entry.bind("<Return>", lambda e: self._on_submit())
+        self.name_entry.focus_set()
+
+        # Buttons
+        buttons_frame = ctk.CTkFrame(content, fg_color=Colors.TRANSPARENT)
+        buttons_frame.pack(fill="x")
+
+        cancel_btn = ctk.CTkButton(
+            buttons_frame,
+            text="Cancel",
+            command=self._on_cancel,
+            width=120,
+            height=40,
+            **Styles.BUTTON_SECONDARY,
+        )
+        cancel_btn.pack(side="left", expand=True, padx=(0, 10))
+
+        save_btn = ctk.CTkButton(
+            buttons_frame,
+            text="Save",
+            command=self._on_submit,
+            width=120,
+            height=40,
+            **Styles.BUTTON_PRIMARY,
+        )
+        save_btn.pack(side="right", expand=True, padx=(10, 0))
+
+    def _on_submit(self):
+        """Return the folder name if one was entered."""
+        name = self.name_entry.get().strip()
+        if not name:
+            self.name_entry.configure(border_color=Colors.ERROR)
+            return
+
+        self.result = name
+        self.destroy()
+
+
+def _describe(entries: List[dict], limit: int = 3) -> str:
+    """Entry names for a confirmation message, e.g. 'A', 'B', 'C' and 4 more."""
+    names = [f"'{e.get('service', 'Unknown')}'" for e in entries[:limit]]
+    more = len(entries) - len(names)
+    return ", ".join(names) + (f" and {more} more" if more else "")
+
+
+class BulkConfirmDialog(BaseDialog):
+    """Single confirmation for an operation on several selected entries."""
+
+    def __init__(
+        self,
+        parent,
+        entries: List[dict],
+        title: str,
+        action: str,
+        warning: str,
+        confirm_text: str,
+        confirm_style: Optional[Dict] = None,
+        **kwargs,
+    ):
+        super().__init__(parent, title=title, width=420, height=280, **kwargs)
+
+        self.entries = entries
+        self.action = action
+        self.warning = warning
+        self.confirm_text = confirm_text
+        self.confirm_style = confirm_style or Styles.BUTTON_DANGER
+
+        self._create_widgets()
+
+    def _create_widgets(self):
+        """Create dialog widgets."""
+        # Main content frame
+        content = ctk.CTkFrame(self, fg_color=Colors.TRANSPARENT)
+        content.pack(fill="both", expand=True, padx=30, pady=20)
+
+        # Warning icon
+        warning_icon = ctk.CTkLabel(
+            content,
+            text="⚠️",
+            font=(Fonts.FAMILY_MONO[0], 48),
+            text_color=Colors.WARNING,
+        )
+        warning_icon.pack(pady=(10, 15))
+
+        # Message
+        count = len(self.entries)
+        noun = "password" if count == 1 else "passwords"
+        message = ctk.CTkLabel(
+            content,
+            text=f"{self.action} {count} {noun}?\n{_describe(self.entries)}",
+            font=Fonts.body(),
+            text_color=Colors.GREEN_PRIMARY,
+            justify="center",
+            wraplength=360,
+        )
+        message.pack(pady=(0, 10))
+
+        # Warning text
+        warning = ctk.CTkLabel(
+            content,
+            text=self.warning,
+            font=Fonts.small(),
+            text_color=Colors.ERROR,
+        )
+        warning.pack(pady=(0, 20))
+
+        # Buttons
+        buttons_frame = ctk.CTkFrame(content, fg_color=Colors.TRANSPARENT)
+        buttons_frame.pack(fill="x")
+
+        cancel_btn = ctk.CTkButton(
+            buttons_frame,
+            text="Cancel",
+            command=self._on_cancel,
+            width=120,
+            height=40,
+            **Styles.BUTTON_SECONDARY,
+        )
+        cancel_btn.pack(side="left", expand=True, padx=(0, 10))
+
+        confirm_btn = ctk.CTkButton(
+            buttons_frame,
+            text=self.confirm_text,
+            command=self._on_submit,
+            width=120,
+            height=40,
+            **self.confirm_style,
+        )
+        confirm_btn.pack(side="right", expand=True, padx=(10, 0))
+
+    def _on_submit(self):
+        """Confirm the operation."""
+        self.result = True
+        self.destroy()
+
+
+class BulkEditDialog(BaseDialog):
+    """Dialog for setting one field to the same value on several entries."""
+
+    FIELDS = {"Email": "email", "Username": "username", "Service": "service"}
+
+    def __init__(self, parent, entries: List[dict], **kwargs):
+        super().__init__(parent, title="Edit Selected", width=420, height=340, **kwargs)
+
+        self.entries = entries
+
+        self._create_widgets()
+
+    def _create_widgets(self):
+        """Create dialog widgets."""
+        # Main content frame
+        content = ctk.CTkFrame(self, fg_color=Colors.TRANSPARENT)
+        content.pack(fill="both", expand=True, padx=30, pady=20)
+
+        # Header
+        header = ctk.CTkLabel(
+            content,
+            text=f"✏️ Edit {len(self.entries)} Passwords",
+            font=Fonts.heading(),
+            text_color=Colors.GREEN_PRIMARY,
+        )
+        header.pack(anchor="w", pady=(0, 5))
+
+        entries_label = ctk.CTkLabel(
+            content,
+            text=_describe(self.entries),
+            font=Fonts.small(),
+            text_color=Colors.TEXT_MUTED,
+            wraplength=360,
+            justify="left",
+        )
+        entries_label.pack(anchor="w", pady=(0, 15))
+
+        # Field to change
+        field_frame = ctk.CTkFrame(content, fg_color=Colors.TRANSPARENT)
+        field_frame.pack(fill="x", pady=(0, 10))
+
+        field_label = ctk.CTkLabel(
+            field_frame,
+            text="Field:",
+            font=Fonts.body(),
+            text_color=Colors.GREEN_PRIMARY,
+        )
+        field_label.pack(side="left")
+
+        self.field_dropdown = ctk.CTkOptionMenu(
+            field_frame,
+            values=list(self.FIELDS),
+            fg_color=Colors.BG_TERTIARY,
+            button_color=Colors.GREEN_DARK,
+            button_hover_color=Colors.GREEN_SECONDARY,
+            dropdown_fg_color=Colors.BG_SECONDARY,
+            dropdown_hover_color=Colors.GREEN_DARK,
+            text_color=Colors.GREEN_PRIMARY,
+            font=Fonts.body(),
+            width=150,
+        )
+        self.field_dropdown.pack(side="right")
+
+        # New value
+        self.value_entry = ctk.CTkEntry(
+            content,
+            placeholder_text="New value for every selected entry",
+            height=40,
+            **Styles.ENTRY,
+        )
+        self.value_entry.pack(fill="x", pady=(0, 20))
+        self.value_entry.bind("<Return>", lambda e: self._on_submit())
+        self.value_entry.focus_set()
+
+        # Buttons
+        buttons_frame = ctk.CTkFrame(content, fg_color=Colors.TRANSPARENT)
+        buttons_frame.pack(fill="x")
+
+        cancel_btn = ctk.CTkButton(
+            buttons_frame,
+            text="Cancel",
+            command=self._on_cancel,
+            width=120,
+            height=40,
+            **Styles.BUTTON_SECONDARY,
+        )
+        cancel_btn.pack(side="left", expand=True, padx=(0, 10))
+
+        apply_btn = ctk.CTkButton(
+            buttons_frame,
+            text="Apply",
+            command=self._on_submit,
+            width=120,
+            height=40,
+            **Styles.BUTTON_PRIMARY,
+        )
+        apply_btn.pack(side="right", expand=True, padx=(10, 0))
+
+    def _on_submit(self):
+        """Return (field, value); the service name may not be blank."""
+        field = self.FIELDS[self.field_dropdown.get()]
+        value = self.value_entry.get().strip()
+        if field == "service" and not value:
+            self.value_entry.configure(border_color=Colors.ERROR)
+            return
+
+        self.result = (field, value)
+        self.destroy()
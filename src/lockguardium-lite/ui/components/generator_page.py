@@ -10,12 +10,15 @@ import string
 import os
 import sys
 
-# Add parent directories to path for imports
-sys.path.insert(
-    0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-)
+# Add parent directories to path for imports when run as a script
+if not __package__:
+    sys.path.insert(
+        0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    )
 
 from ui.theme import Colors, Fonts, Dimensions, Styles
+from ui.clipboard import clipboard_for
+from ui.scheduler import scheduler_for
 
 
 def generate_password(
@@ -286,13 +289,18 @@ class PasswordGeneratorCard(ctk.CTkFrame):
     def _copy(self):
         """Copy password to clipboard."""
         if self.generated_password:
-            self.clipboard_clear()
-            self.clipboard_append(self.generated_password)
+            clipboard_for(self).copy(self.generated_password)
 
             # Visual feedback
-            original_text = self.copy_btn.cget("text")
+            scheduler = scheduler_for(self)
             self.copy_btn.configure(text="✓ Copied!")
-            self.after(1500, lambda: self.copy_btn.configure(text=original_text))
+            scheduler.after(
+                1500,
+                scheduler.configure,
+                self.copy_btn,
+                text="📋 Copy",
+                key=(self, "copied"),
+            )
 
     def _save(self):
         """Save password to vault."""
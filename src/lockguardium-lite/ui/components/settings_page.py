@@ -8,10 +8,11 @@ from typing import Optional, Callable
 import os
 import sys
 
-# Add parent directories to path for imports
-sys.path.insert(
-    0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-)
+# Add parent directories to path for imports when run as a script
+if not __package__:
+    sys.path.insert(
+        0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    )
 
 from ui.theme import Colors, Fonts, Dimensions, Styles, PLACEHOLDER_SETTINGS
 
@@ -51,6 +52,7 @@ class SettingsPage(ctk.CTkFrame):
     def __init__(
         self,
         parent,
+        settings: Optional[dict] = None,
         on_export: Optional[Callable] = None,
         on_import: Optional[Callable] = None,
         on_settings_change: Optional[Callable[[dict], None]] = None,
@@ -64,8 +66,8 @@ class SettingsPage(ctk.CTkFrame):
 
         self.configure(fg_color=Colors.BG_PRIMARY)
 
-        # Load placeholder settings
-        self.settings = PLACEHOLDER_SETTINGS.copy()
+        # Current settings (placeholder defaults when run standalone)
+        self.settings = {**PLACEHOLDER_SETTINGS, **(settings or {})}
 
         self._create_widgets()
 
@@ -225,6 +227,44 @@ class SettingsPage(ctk.CTkFrame):
         self.theme_dropdown.pack(side="right")
         self.theme_dropdown.set(self.settings["theme"].capitalize())
 
+        # Vault table renderer
+        table_frame = ctk.CTkFrame(
+            appearance_section.content, fg_color=Colors.TRANSPARENT
+        )
+        table_frame.pack(fill="x", pady=5)
+
+        table_label = ctk.CTkLabel(
+            table_frame,
+            text="Vault table:",
+            font=Fonts.body(),
+            text_color=Colors.GREEN_PRIMARY,
+        )
+        table_label.pack(side="left")
+
+        self.table_dropdown = ctk.CTkOptionMenu(
+            table_frame,
+            values=["Widgets", "Canvas"],
+            command=self._on_table_renderer_change,
+            fg_color=Colors.BG_TERTIARY,
+            button_color=Colors.GREEN_DARK,
+            button_hover_color=Colors.GREEN_SECONDARY,
+            dropdown_fg_color=Colors.BG_SECONDARY,
+            dropdown_hover_color=Colors.GREEN_DARK,
+            text_color=Colors.GREEN_PRIMARY,
+            font=Fonts.body(),
+            width=150,
+        )
+        self.table_dropdown.pack(side="right")
+        self.table_dropdown.set(self.settings["table_renderer"].capitalize())
+
+        table_hint = ctk.CTkLabel(
+            appearance_section.content,
+            text="Canvas draws the whole table at once; faster for very large vaults",
+            font=Fonts.small(),
+            text_color=Colors.TEXT_MUTED,
+        )
+        table_hint.pack(anchor="w")
+
         # ===== Data Section =====
         data_section = SettingsSection(content_scroll, "Data Management", "💾")
         data_section.pack(fill="x", pady=15)
@@ -319,6 +359,11 @@ class SettingsPage(ctk.CTkFrame):
         ctk.set_appearance_mode(theme)
         self._notify_change()
 
+    def _on_table_renderer_change(self, value: str):
+        """Handle vault table renderer change."""
+        self.settings["table_renderer"] = value.lower()
+        self._notify_change()
+
     def _handle_export(self):
         """Handle export button click."""
         if self.on_export:
@@ -4,14 +4,15 @@ Navigation sidebar with toggle functionality
 """
 
 import customtkinter as ctk
-from typing import Callable, Optional
+from typing import Callable, List, Optional, Tuple
 import os
 import sys
 
-# Add parent directories to path for imports
-sys.path.insert(
-    0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-)
+# Add parent directories to path for imports when run as a script
+if not __package__:
+    sys.path.insert(
+        0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    )
 
 from ui.theme import Colors, Fonts, Dimensions, Styles
 
@@ -27,6 +28,8 @@ class Sidebar(ctk.CTkFrame):
         on_page_change: Optional[Callable[[str], None]] = None,
         on_lock: Optional[Callable] = None,
         on_theme_change: Optional[Callable[[str], None]] = None,
+        on_folder_select: Optional[Callable[[str], None]] = None,
+        on_folder_remove: Optional[Callable[[str], None]] = None,
         **kwargs,
     ):
         super().__init__(parent, **kwargs)
@@ -34,6 +37,8 @@ class Sidebar(ctk.CTkFrame):
         self.on_page_change = on_page_change
         self.on_lock = on_lock
         self.on_theme_change = on_theme_change
+        self.on_folder_select = on_folder_select
+        self.on_folder_remove = on_folder_remove
 
         self.is_expanded = True
         self.current_page = "dashboard"
@@ -47,6 +52,8 @@ class Sidebar(ctk.CTkFrame):
 
         # Navigation buttons
         self.nav_buttons = {}
+        self.folder_buttons = {}
+        self.folders: List[Tuple[str, int]] = []
 
         # Create widgets
         self._create_widgets()
@@ -114,6 +121,25 @@ class Sidebar(ctk.CTkFrame):
             btn.pack(fill="x")
             self.nav_buttons[page_id] = {"button": btn, "icon": icon, "label": label}
 
+        # ===== Smart Folders =====
+        self.folders_frame = ctk.CTkFrame(self, fg_color=Colors.TRANSPARENT)
+        self.folders_frame.pack(fill="x", padx=10, pady=(15, 0))
+
+        self.folders_label = ctk.CTkLabel(
+            self.folders_frame,
+            text="Smart Folders",
+            font=Fonts.small(),
+            text_color=Colors.TEXT_MUTED,
+            anchor="w",
+        )
+        self.folders_label.pack(fill="x", padx=5)
+
+        self.folders_list = ctk.CTkFrame(
+            self.folders_frame, fg_color=Colors.TRANSPARENT
+        )
+        self.folders_list.pack(fill="x")
+        self._render_folders()
+
         # ===== Spacer =====
         spacer = ctk.CTkFrame(self, fg_color=Colors.TRANSPARENT)
         spacer.pack(fill="both", expand=True)
@@ -166,6 +192,56 @@ class Sidebar(ctk.CTkFrame):
         )
         self.lock_btn.pack(fill="x", pady=(10, 0))
 
+    def set_smart_folders(self, folders: List[Tuple[str, int]]):
+        """Show saved searches as (name, count) pairs."""
+        if folders != self.folders:
+            self.folders = list(folders)
+            self._render_folders()
+
+    def _render_folders(self):
+        """Rebuild the smart folder buttons."""
+        for btn in self.folder_buttons.values():
+            btn.destroy()
+        self.folder_buttons.clear()
+
+        for name, count in self.folders:
+            btn = ctk.CTkButton(
+                self.folders_list,
+                text=self._folder_text(name, count),
+                anchor="w" if self.is_expanded else "center",
+                height=34,
+                command=lambda n=name: self._open_folder(n),
+                fg_color=Colors.TRANSPARENT,
+                hover_color=Colors.GREEN_DARK,
+                text_color=Colors.GREEN_SECONDARY,
+                font=Fonts.small(),
+            )
+            btn.pack(fill="x", pady=1)
+            # Right-click removes the folder
+            btn.bind("<Button-3>", lambda e, n=name: self._remove_folder(n))
+            self.folder_buttons[name] = btn
+
+        if self.folders:
+            self.folders_frame.pack(
+                fill="x", padx=10, pady=(15, 0), after=self.nav_frame
+            )
+        else:
+            self.folders_frame.pack_forget()
+
+    def _folder_text(self, name: str, count: int) -> str:
+        return f"📁  {name}  ({count})" if self.is_expanded else "📁"
+
+    def _open_folder(self, name: str):
+        """Open a smart folder (shown on the vault page)."""
+        self.current_page = "vault"
+        self._set_active_button("vault")
+        if self.on_folder_select:
+            self.on_folder_select(name)
+
+    def _remove_folder(self, name: str):
+        if self.on_folder_remove:
+            self.on_folder_remove(name)
+
     def _toggle_sidebar(self):
         """Toggle sidebar between expanded and collapsed states."""
         self.is_expanded = not self.is_expanded
@@ -175,6 +251,7 @@ class Sidebar(ctk.CTkFrame):
             self.menu_label.pack(side="left", padx=(10, 0))
             self.theme_dropdown.pack(side="left", fill="x", expand=True)
             self.lock_btn.configure(text="🔒  Lock")
+            self.folders_label.pack(fill="x", padx=5, before=self.folders_list)
 
             # Update nav buttons
             for page_id, data in self.nav_buttons.items():
@@ -186,11 +263,23 @@ class Sidebar(ctk.CTkFrame):
             self.menu_label.pack_forget()
             self.theme_dropdown.pack_forget()
             self.lock_btn.configure(text="🔒")
+            self.folders_label.pack_forget()
 
             # Update nav buttons
             for page_id, data in self.nav_buttons.items():
                 data["button"].configure(text=data["icon"], anchor="center")
 
+        # Update smart folder buttons
+        for name, count in self.folders:
+            self.folder_buttons[name].configure(
+                text=self._folder_text(name, count),
+                anchor="w" if self.is_expanded else "center",
+            )
+
+    def select_page(self, page_id: str):
+        """Navigate as if the page's button had been clicked."""
+        self._navigate_to(page_id)
+
     def _navigate_to(self, page_id: str):
         """Navigate to a specific page."""
         self.current_page = page_id
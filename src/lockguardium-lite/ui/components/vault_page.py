@@ -4,25 +4,37 @@ Password list view with CRUD operations
 """
 
 import customtkinter as ctk
-from typing import Optional, Callable, Dict, List
+from typing import Optional, Callable, Dict, List, Set, Tuple
 import os
 import sys
 
-# Add parent directories to path for imports
-sys.path.insert(
-    0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-)
+# Add parent directories to path for imports when run as a script
+if not __package__:
+    sys.path.insert(
+        0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    )
 
 from ui.theme import Colors, Fonts, Dimensions, Styles, PLACEHOLDER_PASSWORDS
+from ui.components.virtual_list import VirtualList, selection_mode
+from ui.components.canvas_table import CanvasTable
+from ui.clipboard import clipboard_for
+from ui.scheduler import scheduler_for
+from core.query import QueryError, is_structured, parse_query
+from core.sorting import SORT_FIELDS, SortIndex
+from services.runtime import TkBridge
 
 
 class PasswordRow(ctk.CTkFrame):
-    """A single password entry row in the vault table."""
+    """
+    A password entry row in the vault table.
+    Rows are recycled by the virtual list: ``set_data`` points a row at
+    another entry.
+    """
 
     def __init__(
         self,
         parent,
-        password_data: dict,
+        password_data: Optional[dict] = None,
         on_reveal: Optional[Callable] = None,
         on_copy: Optional[Callable] = None,
         on_select: Optional[Callable] = None,
@@ -31,7 +43,7 @@ class PasswordRow(ctk.CTkFrame):
     ):
         super().__init__(parent, **kwargs)
 
-        self.password_data = password_data
+        self.password_data = password_data or {}
         self.on_reveal = on_reveal
         self.on_copy = on_copy
         self.on_select = on_select
@@ -59,37 +71,37 @@ class PasswordRow(ctk.CTkFrame):
         self.grid_columnconfigure(4, weight=0)  # Actions
 
         # Service
-        service_label = ctk.CTkLabel(
+        self.service_label = ctk.CTkLabel(
             self,
             text=self.password_data.get("service", ""),
             font=Fonts.body(),
             text_color=Colors.GREEN_PRIMARY,
             anchor="w",
         )
-        service_label.grid(row=0, column=0, padx=(15, 10), pady=12, sticky="w")
-        service_label.bind("<Button-1>", self._handle_click)
+        self.service_label.grid(row=0, column=0, padx=(15, 10), pady=12, sticky="w")
+        self.service_label.bind("<Button-1>", self._handle_click)
 
         # Email
-        email_label = ctk.CTkLabel(
+        self.email_label = ctk.CTkLabel(
             self,
             text=self.password_data.get("email", ""),
             font=Fonts.body(),
             text_color=Colors.GREEN_PRIMARY,
             anchor="w",
         )
-        email_label.grid(row=0, column=1, padx=10, pady=12, sticky="w")
-        email_label.bind("<Button-1>", self._handle_click)
+        self.email_label.grid(row=0, column=1, padx=10, pady=12, sticky="w")
+        self.email_label.bind("<Button-1>", self._handle_click)
 
         # Username
-        username_label = ctk.CTkLabel(
+        self.username_label = ctk.CTkLabel(
             self,
             text=self.password_data.get("username", ""),
             font=Fonts.body(),
             text_color=Colors.GREEN_PRIMARY,
             anchor="w",
         )
-        username_label.grid(row=0, column=2, padx=10, pady=12, sticky="w")
-        username_label.bind("<Button-1>", self._handle_click)
+        self.username_label.grid(row=0, column=2, padx=10, pady=12, sticky="w")
+        self.username_label.bind("<Button-1>", self._handle_click)
 
         # Password (masked)
         password_frame = ctk.CTkFrame(self, fg_color=Colors.TRANSPARENT)
@@ -152,40 +164,89 @@ class PasswordRow(ctk.CTkFrame):
 
     def _handle_copy(self):
         """Copy password to clipboard."""
-        password = self.password_data.get("password", "")
-        self.clipboard_clear()
-        self.clipboard_append(password)
+        clipboard_for(self).copy(self.password_data.get("password", ""))
 
         # Visual feedback
-        original_text = self.copy_btn.cget("text")
+        scheduler = scheduler_for(self)
         self.copy_btn.configure(text="✓")
-        self.after(1500, lambda: self.copy_btn.configure(text=original_text))
+        scheduler.after(
+            1500, scheduler.configure, self.copy_btn, text="📋", key=(self, "copied")
+        )
 
         if self.on_copy:
             self.on_copy(self.password_data)
 
     def _handle_click(self, event=None):
-        """Handle row click for selection."""
+        """Handle row click for selection (Shift/Ctrl for multi-select)."""
         if self.on_select:
-            self.on_select(self.password_data)
+            self.on_select(self.password_data, selection_mode(event))
 
     def set_selected(self, selected: bool):
         """Update the selection state."""
         self.is_selected = selected
         self.configure(fg_color=Colors.GREEN_DARK if selected else Colors.BG_TERTIARY)
 
+    def set_data(self, password_data: dict, is_selected: bool = False):
+        """
+        Show ``password_data`` in this row, reconfiguring only the labels
+        whose text changed. Moving to another entry masks the password again.
+        """
+        same_entry = self.password_data.get("id") == password_data.get("id")
+        self.password_data = password_data
+
+        for label, field in (
+            (self.service_label, "service"),
+            (self.email_label, "email"),
+            (self.username_label, "username"),
+        ):
+            text = password_data.get(field, "")
+            if label.cget("text") != text:
+                label.configure(text=text)
+
+        if not same_entry and self.is_revealed:
+            self.is_revealed = False
+            self.password_label.configure(text="••••••••")
+            self.reveal_btn.configure(text="👁")
+        elif self.is_revealed:
+            password = password_data.get("password", "")
+            if self.password_label.cget("text") != password:
+                self.password_label.configure(text=password)
+
+        if is_selected != self.is_selected:
+            self.set_selected(is_selected)
+
 
 class VaultPage(ctk.CTkFrame):
     """
     Vault page showing all saved passwords with search and CRUD operations.
     """
 
+    # Fuzzy matches ranked ahead of (and shown besides) the substring matches
+    SEARCH_LIMIT = 100
+
+    # Wait this long after the last keystroke before searching
+    SEARCH_DEBOUNCE_MS = 150
+
+    # Row pitch in the virtual list (a row is about 52px tall, plus a 6px gap)
+    ROW_HEIGHT = 58
+
+    # Table renderers: a widget per visible row, or one drawn canvas
+    RENDERERS = ("widgets", "canvas")
+
     def __init__(
         self,
         parent,
         on_add: Optional[Callable] = None,
         on_edit: Optional[Callable] = None,
         on_delete: Optional[Callable] = None,
+        on_bulk_edit: Optional[Callable[[List[dict]], None]] = None,
+        on_bulk_delete: Optional[Callable[[List[dict]], None]] = None,
+        on_regenerate: Optional[Callable[[List[dict]], None]] = None,
+        passwords: Optional[List[dict]] = None,
+        search_service=None,
+        on_save_search: Optional[Callable[[str], None]] = None,
+        on_entry_used: Optional[Callable[[dict], None]] = None,
+        renderer: str = "widgets",
         **kwargs,
     ):
         super().__init__(parent, **kwargs)
@@ -193,14 +254,44 @@ class VaultPage(ctk.CTkFrame):
         self.on_add = on_add
         self.on_edit = on_edit
         self.on_delete = on_delete
+        self.on_bulk_edit = on_bulk_edit
+        self.on_bulk_delete = on_bulk_delete
+        self.on_regenerate = on_regenerate
+        self.on_save_search = on_save_search
+        self.on_entry_used = on_entry_used
+
+        self.search_service = search_service
+        self.renderer = renderer if renderer in self.RENDERERS else "widgets"
 
         self.configure(fg_color=Colors.BG_PRIMARY)
 
-        # Load placeholder data
-        self.passwords = PLACEHOLDER_PASSWORDS.copy()
+        # Load vault entries (placeholder data when run standalone)
+        self.passwords = list(
+            passwords if passwords is not None else PLACEHOLDER_PASSWORDS
+        )
+        self._by_id = {p.get("id"): p for p in self.passwords}
         self.filtered_passwords = self.passwords.copy()
+
+        # Column sort; orders are kept up to date as entries change
+        self.sort_index = SortIndex(SORT_FIELDS)
+        self.sort_index.build(self.passwords)
+        self.sort_column: Optional[str] = None
+        self.sort_descending = False
+        self.header_labels: Dict[str, ctk.CTkLabel] = {}
+
+        # Selection by entry id; ``selected_password`` is the focused entry
+        # and the anchor is where Shift ranges start
+        self.selected_ids: Set[int] = set()
         self.selected_password = None
-        self.password_rows: List[PasswordRow] = []
+        self._anchor_id = None
+        self._positions: Optional[Dict[int, int]] = None
+
+        # Search runs on the service loop; only the newest query is rendered
+        self.bridge = TkBridge(self)
+        self.scheduler = scheduler_for(self)
+        self._search_future = None
+        self._last_query: Optional[str] = None
+        self._reset_scroll = False
 
         # Create widgets
         self._create_widgets()
@@ -220,6 +311,14 @@ class VaultPage(ctk.CTkFrame):
         )
         title_label.pack(side="left")
 
+        self.selection_label = ctk.CTkLabel(
+            header_frame,
+            text="",
+            font=Fonts.small(),
+            text_color=Colors.TEXT_MUTED,
+        )
+        self.selection_label.pack(side="left", padx=15)
+
         # Actions (right side)
         actions_frame = ctk.CTkFrame(header_frame, fg_color=Colors.TRANSPARENT)
         actions_frame.pack(side="right")
@@ -244,6 +343,16 @@ class VaultPage(ctk.CTkFrame):
         )
         self.edit_btn.pack(side="left", padx=5)
 
+        self.regenerate_btn = ctk.CTkButton(
+            actions_frame,
+            text="🔄 Rotate",
+            width=100,
+            height=38,
+            command=self._handle_regenerate,
+            **Styles.BUTTON_SECONDARY,
+        )
+        self.regenerate_btn.pack(side="left", padx=5)
+
         self.delete_btn = ctk.CTkButton(
             actions_frame,
             text="🗑️ Delete",
@@ -268,15 +377,34 @@ class VaultPage(ctk.CTkFrame):
 
         self.search_entry = ctk.CTkEntry(
             search_frame,
-            placeholder_text="Search passwords...",
+            placeholder_text="Search passwords... (e.g. service:github modified:<30d)",
             height=40,
             **Styles.ENTRY,
         )
         self.search_entry.pack(side="left", fill="x", expand=True)
         self.search_entry.bind("<KeyRelease>", self._on_search)
 
+        self.save_search_btn = ctk.CTkButton(
+            search_frame,
+            text="💾 Save",
+            width=90,
+            height=40,
+            command=self._handle_save_search,
+            **Styles.BUTTON_SECONDARY,
+        )
+        self.save_search_btn.pack(side="left", padx=(10, 0))
+
+        # Shown under the search bar only while there is something to say
+        self.search_status = ctk.CTkLabel(
+            self,
+            text="",
+            font=Fonts.small(),
+            text_color=Colors.TEXT_MUTED,
+            anchor="w",
+        )
+
         # ===== Table Container =====
-        table_container = ctk.CTkFrame(
+        self.table_container = table_container = ctk.CTkFrame(
             self,
             fg_color=Colors.BG_SECONDARY,
             border_width=1,
@@ -311,50 +439,173 @@ class VaultPage(ctk.CTkFrame):
             )
             label.grid(row=0, column=i, padx=padx, pady=12, sticky="w")
 
-        # Scrollable password list
-        self.password_list = ctk.CTkScrollableFrame(
-            table_container, fg_color=Colors.TRANSPARENT, corner_radius=0
-        )
-        self.password_list.pack(fill="both", expand=True, padx=2, pady=(5, 2))
+            # Sortable columns toggle ascending / descending / unsorted
+            field = header.lower()
+            if field in SORT_FIELDS:
+                label.configure(cursor="hand2")
+                label.bind("<Button-1>", lambda e, f=field: self._on_sort(f))
+                self.header_labels[field] = label
+
+        # Virtualized password list: only the rows on screen are rendered
+        self.password_list = self._create_table()
 
         # Populate password rows
         self._populate_password_list()
 
-    def _populate_password_list(self):
-        """Populate the password list with rows."""
-        # Clear existing rows
-        for row in self.password_rows:
-            row.destroy()
-        self.password_rows.clear()
-
-        # Create rows for each password
-        for password_data in self.filtered_passwords:
-            row = PasswordRow(
-                self.password_list,
-                password_data=password_data,
+    def _create_table(self):
+        """Create the password list for the current renderer."""
+        key = self._entry_id
+        if self.renderer == "canvas":
+            table = CanvasTable(
+                self.table_container,
+                row_height=self.ROW_HEIGHT,
+                key=key,
+                is_selected=self._is_selected,
+                on_select=self._on_select,
                 on_reveal=self._on_reveal,
                 on_copy=self._on_copy,
-                on_select=self._on_select,
-                is_selected=(password_data == self.selected_password),
+                empty_text="No passwords found",
+                fg_color=Colors.TRANSPARENT,
+                corner_radius=0,
             )
-            row.pack(fill="x", pady=3)
-            self.password_rows.append(row)
-
-        # Show empty state if no passwords
-        if not self.filtered_passwords:
-            empty_label = ctk.CTkLabel(
-                self.password_list,
-                text="No passwords found",
-                font=Fonts.body(),
-                text_color=Colors.TEXT_MUTED,
+        else:
+            table = VirtualList(
+                self.table_container,
+                row_factory=self._create_row,
+                bind_row=self._bind_row,
+                row_height=self.ROW_HEIGHT,
+                key=key,
+                empty_text="No passwords found",
+                fg_color=Colors.TRANSPARENT,
+                corner_radius=0,
             )
-            empty_label.pack(pady=50)
+        table.pack(fill="both", expand=True, padx=2, pady=(5, 2))
+        return table
+
+    @staticmethod
+    def _entry_id(password_data: dict):
+        return password_data.get("id")
+
+    def set_renderer(self, renderer: str):
+        """Switch the table between the widget and canvas renderers."""
+        if renderer not in self.RENDERERS or renderer == self.renderer:
+            return
+        self.renderer = renderer
+        self.password_list.destroy()
+        self.password_list = self._create_table()
+        self._reset_scroll = True
+        self._populate_password_list()
+
+    def _populate_password_list(self):
+        """Show the filtered passwords (only visible rows have widgets)."""
+        if self.sort_column is not None:
+            self.filtered_passwords = self._sorted(self.filtered_passwords)
+
+        # Entries no longer listed drop out of the selection
+        self._positions = None
+        if self.selected_ids:
+            self.selected_ids.intersection_update(self._positions_by_id())
+            self.selected_password = self._focused(self.selected_password)
+            self._update_selection_label()
+
+        # Results for a new query start at the top; edits keep the position
+        self.password_list.set_items(self.filtered_passwords, self._reset_scroll)
+        self._reset_scroll = False
+
+    def _create_row(self, parent) -> PasswordRow:
+        """Create a pooled row for the virtual list."""
+        return PasswordRow(
+            parent,
+            on_reveal=self._on_reveal,
+            on_copy=self._on_copy,
+            on_select=self._on_select,
+        )
+
+    def _bind_row(self, row: PasswordRow, password_data: dict):
+        """Point a pooled row at ``password_data``."""
+        row.set_data(password_data, is_selected=self._is_selected(password_data))
+
+    def _is_selected(self, password_data: dict) -> bool:
+        return password_data.get("id") in self.selected_ids
+
+    def _positions_by_id(self) -> Dict[int, int]:
+        """Index of each listed entry by id (rebuilt after the list changes)."""
+        if self._positions is None:
+            self._positions = {
+                p.get("id"): i for i, p in enumerate(self.filtered_passwords)
+            }
+        return self._positions
+
+    def _on_sort(self, field: str):
+        """Sort by ``field``; clicking again reverses, a third time unsorts."""
+        if self.sort_column != field:
+            self.sort_column, self.sort_descending = field, False
+        elif not self.sort_descending:
+            self.sort_descending = True
+        else:
+            self.sort_column, self.sort_descending = None, False
+
+        for name, label in self.header_labels.items():
+            arrow = ""
+            if name == self.sort_column:
+                arrow = " ▼" if self.sort_descending else " ▲"
+            label.configure(text=name.capitalize() + arrow)
+
+        if self.sort_column is None:
+            self._run_search()  # Back to relevance / insertion order
+        else:
+            self._populate_password_list()
+
+    def _sorted(self, passwords: List[dict]) -> List[dict]:
+        """``passwords`` in the current column order."""
+        ids = self.sort_index.arrange(
+            [p.get("id") for p in passwords], self.sort_column, self.sort_descending
+        )
+        by_id = self._by_id
+        return [by_id[i] for i in ids]
 
     def _on_search(self, event=None):
-        """Filter passwords based on search query."""
-        query = self.search_entry.get().lower()
+        """Debounce keystrokes in the search box."""
+        self.scheduler.after(
+            self.SEARCH_DEBOUNCE_MS, self._run_search, False, key=(self, "search")
+        )
 
-        if query:
+    def _run_search(self, force: bool = True):
+        """Filter passwords based on search query."""
+        self.scheduler.cancel((self, "search"))
+        text = self.search_entry.get().strip()
+        if not force and text == self._last_query:
+            return
+        self._reset_scroll = text != self._last_query
+        self._last_query = text
+
+        # A newer query supersedes any search still in flight
+        if self._search_future is not None:
+            self.bridge.cancel(self._search_future)
+            self._search_future = None
+
+        structured = is_structured(text)
+        if text and self.search_service is not None:
+            if structured:
+                search = self.search_service.query_async(text)
+                on_success = self._show_search_results
+            else:
+                search = self.search_service.find_async(text, self.SEARCH_LIMIT)
+                on_success = self._show_found
+            self._search_future = self.bridge.call(
+                search, on_success=on_success, on_error=self._on_search_error
+            )
+            return
+
+        if structured:
+            try:
+                node = parse_query(text)
+                self.filtered_passwords = [p for p in self.passwords if node.matches(p)]
+            except QueryError as error:
+                self._on_search_error(error)
+                return
+        elif text:
+            query = text.lower()
             self.filtered_passwords = [
                 p
                 for p in self.passwords
@@ -365,67 +616,232 @@ class VaultPage(ctk.CTkFrame):
         else:
             self.filtered_passwords = self.passwords.copy()
 
+        self._set_search_status("")
+        self._populate_password_list()
+
+    def _on_search_error(self, error: BaseException):
+        """Show no results and say why; unexpected errors are also reported."""
+        self._search_future = None
+        if isinstance(error, QueryError):
+            self._set_search_status(f"Invalid query: {error}", Colors.WARNING)
+        else:
+            self._set_search_status(f"Search failed: {error}", Colors.ERROR)
+            self._root().report_callback_exception(
+                type(error), error, error.__traceback__
+            )
+        self.filtered_passwords = []
         self._populate_password_list()
 
-    def _on_select(self, password_data: dict):
-        """Handle password row selection."""
-        self.selected_password = password_data
+    def _set_search_status(self, text: str, color: str = Colors.TEXT_MUTED):
+        """Show ``text`` under the search bar, or hide the line when empty."""
+        if not text:
+            if self.search_status.winfo_manager():
+                self.search_status.pack_forget()
+            return
+        self.search_status.configure(text=text, text_color=color)
+        if not self.search_status.winfo_manager():
+            self.search_status.pack(
+                fill="x", padx=30, pady=(0, 10), before=self.table_container
+            )
 
-        # Update row selection states
-        for row in self.password_rows:
-            row.set_selected(row.password_data == password_data)
+    def _show_search_results(self, entries: List[dict]):
+        """Render ranked results; entries the page doesn't hold yet are skipped."""
+        self._search_future = None
+        by_id = self._by_id
+        self.filtered_passwords = [
+            by_id[e["id"]] for e in entries if e.get("id") in by_id
+        ]
+        self._set_search_status("")
+        self._populate_password_list()
+
+    def _show_found(self, found: Tuple[List[dict], int]):
+        """Render plain-text results, saying so when weak matches were cut."""
+        entries, total = found
+        self._show_search_results(entries)
+        if total > len(entries):
+            self._set_search_status(
+                f"Showing the best {len(entries)} of {total} matches"
+                " - keep typing to narrow them down"
+            )
+
+    def show_smart_folder(self, query: str, entries: List[dict]):
+        """Show a smart folder's (already computed) entries under its query."""
+        self.scheduler.cancel((self, "search"))
+        if self._search_future is not None:
+            self.bridge.cancel(self._search_future)
+            self._search_future = None
+
+        self.search_entry.delete(0, "end")
+        self.search_entry.insert(0, query)
+        self._last_query = query
+        self._reset_scroll = True
+        self._show_search_results(entries)
+
+    def _on_select(self, password_data: dict, mode: str = "replace"):
+        """
+        Select a row: "replace" selects only it, "toggle" adds or removes
+        it, and "extend" selects the listed range from the anchor to it.
+        """
+        password_id = password_data.get("id")
+        selected = self.selected_ids
+
+        if mode == "toggle":
+            selected = set(selected)
+            selected.symmetric_difference_update((password_id,))
+            self._anchor_id = password_id
+        elif mode == "extend" and self._anchor_id in self._positions_by_id():
+            positions = self._positions_by_id()
+            start, end = sorted((positions[self._anchor_id], positions[password_id]))
+            selected = {p.get("id") for p in self.filtered_passwords[start : end + 1]}
+        else:
+            selected = {password_id}
+            self._anchor_id = password_id
+
+        self._set_selection(selected, password_data)
+
+    def _set_selection(self, selected_ids: Set[int], focused: Optional[dict]):
+        """Replace the selection, repainting only rows whose state changed."""
+        previous = self.selected_ids
+        self.selected_ids = selected_ids
+        self.selected_password = self._focused(focused)
+
+        for password_id in previous - selected_ids:
+            self._paint_selected(password_id, False)
+        for password_id in selected_ids - previous:
+            self._paint_selected(password_id, True)
+        self._update_selection_label()
+
+    def _update_selection_label(self):
+        count = len(self.selected_ids)
+        text = f"{count} selected" if count > 1 else ""
+        if self.selection_label.cget("text") != text:
+            self.selection_label.configure(text=text)
+
+    def _focused(self, candidate: Optional[dict]) -> Optional[dict]:
+        """``candidate`` (current version) if selected, else any selected entry."""
+        if candidate is not None and candidate.get("id") in self.selected_ids:
+            return self._by_id.get(candidate.get("id"))
+        if self.selected_ids:
+            return self._by_id.get(next(iter(self.selected_ids)))
+        return None
+
+    @property
+    def selected_passwords(self) -> List[dict]:
+        """Selected entries in list order."""
+        if not self.selected_ids:
+            return []
+        return [p for p in self.filtered_passwords if p.get("id") in self.selected_ids]
+
+    def _paint_selected(self, password_id: int, selected: bool):
+        """Show the selection state of one row in either renderer."""
+        if isinstance(self.password_list, CanvasTable):
+            self.password_list.set_selected(password_id, selected)
+            return
+        row = self.password_list.row_for(password_id)
+        if row is not None:
+            row.set_selected(selected)
 
     def _on_reveal(self, password_data: dict, is_revealed: bool):
         """Handle password reveal."""
-        pass  # Could log or track reveals
+        if is_revealed and self.on_entry_used:
+            self.on_entry_used(password_data)
 
     def _on_copy(self, password_data: dict):
         """Handle password copy."""
-        pass  # Could log or clear clipboard after timeout
+        if self.on_entry_used:
+            self.on_entry_used(password_data)
 
     def _handle_add(self):
         """Handle add password button click."""
         if self.on_add:
             self.on_add()
 
+    def _handle_save_search(self):
+        """Save the current search as a smart folder."""
+        query = self.search_entry.get().strip()
+        if query and self.on_save_search:
+            self.on_save_search(query)
+
     def _handle_edit(self):
-        """Handle edit password button click."""
-        if self.selected_password and self.on_edit:
+        """Handle edit password button click (bulk edit for several rows)."""
+        if len(self.selected_ids) > 1 and self.on_bulk_edit:
+            self.on_bulk_edit(self.selected_passwords)
+        elif self.selected_password and self.on_edit:
             self.on_edit(self.selected_password)
         elif not self.selected_password:
             # Show selection required message
             pass
 
     def _handle_delete(self):
-        """Handle delete password button click."""
-        if self.selected_password and self.on_delete:
+        """Handle delete password button click (bulk delete for several rows)."""
+        if len(self.selected_ids) > 1 and self.on_bulk_delete:
+            self.on_bulk_delete(self.selected_passwords)
+        elif self.selected_password and self.on_delete:
             self.on_delete(self.selected_password)
         elif not self.selected_password:
             # Show selection required message
             pass
 
+    def _handle_regenerate(self):
+        """Generate new passwords for the selected rows."""
+        if self.selected_ids and self.on_regenerate:
+            self.on_regenerate(self.selected_passwords)
+
     def add_password(self, password_data: dict):
         """Add a new password to the list."""
         self.passwords.append(password_data)
-        self.filtered_passwords = self.passwords.copy()
-        self._populate_password_list()
+        self._by_id[password_data.get("id")] = password_data
+        self.sort_index.add(password_data)
+        self._run_search()  # Re-apply search filter
 
     def update_password(self, password_id: int, updated_data: dict):
         """Update an existing password."""
         for i, p in enumerate(self.passwords):
             if p.get("id") == password_id:
                 self.passwords[i] = {**p, **updated_data}
+                self._by_id[password_id] = self.passwords[i]
+                self.sort_index.update(self.passwords[i])
                 break
-
-        self.filtered_passwords = self.passwords.copy()
-        self._on_search()  # Re-apply search filter
+        self.selected_password = self._focused(self.selected_password)
+        self._run_search()  # Re-apply search filter
 
     def delete_password(self, password_id: int):
         """Delete a password from the list."""
         self.passwords = [p for p in self.passwords if p.get("id") != password_id]
-        self.filtered_passwords = self.passwords.copy()
-        self.selected_password = None
-        self._on_search()  # Re-apply search filter
+        self._by_id.pop(password_id, None)
+        self.sort_index.remove(password_id)
+        self.selected_ids.discard(password_id)
+        self.selected_password = self._focused(self.selected_password)
+        self._run_search()  # Re-apply search filter
+
+    def apply_change(self, change):
+        """Apply a committed VaultChange and re-render the list once."""
+        removed = set(change.removed)
+        updated = {p["id"]: p for p in change.updated}
+
+        self.passwords = [
+            updated.get(p.get("id"), p)
+            for p in self.passwords
+            if p.get("id") not in removed
+        ]
+        self.passwords.extend(change.added)
+        self._by_id = {p.get("id"): p for p in self.passwords}
+
+        for password_id in change.removed:
+            self.sort_index.remove(password_id)
+        for password_data in change.updated + change.added:
+            self.sort_index.update(password_data)
+
+        self.selected_ids.difference_update(removed)
+        self.selected_password = self._focused(self.selected_password)
+
+        self._run_search()  # Re-apply search filter and repopulate
+
+    def destroy(self):
+        """Cancel pending searches."""
+        self.bridge.cancel_all()
+        self.scheduler.cancel((self, "search"))
+        super().destroy()
 
     def refresh(self):
         """Refresh the password list."""
@@ -0,0 +1,279 @@
+"""
+LockGuardium Lite - Virtual List Component
+Scrollable list that only creates widgets for the rows on screen
+"""
+
+import customtkinter as ctk
+from typing import Any, Callable, Dict, Hashable, List, Optional, Sequence, Tuple
+import os
+import sys
+
+# Add parent directories to path for imports when run as a script
+if not __package__:
+    sys.path.insert(
+        0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    )
+
+from ui.theme import Colors, Fonts
+
+# Modifier bits in Tk event.state
+_SHIFT = 0x0001
+_CONTROL = 0x0004
+_COMMAND = 0x0008  # Mod1: Command on macOS (Alt elsewhere)
+
+
+def selection_mode(event=None) -> str:
+    """
+    How a click or key press changes a multi-selection: "extend" (Shift,
+    a range from the anchor), "toggle" (Ctrl, or Command on macOS) or
+    "replace".
+    """
+    state = getattr(event, "state", 0)
+    if not isinstance(state, int):
+        return "replace"
+    if state & _SHIFT:
+        return "extend"
+    toggle = _CONTROL | (_COMMAND if sys.platform == "darwin" else 0)
+    if state & toggle:
+        return "toggle"
+    return "replace"
+
+
+class ScrolledViewport(ctk.CTkFrame):
+    """
+    Scroll model shared by the vault table renderers.
+
+    Items are laid out at a fixed pitch (``row_height``) and scrolled by a
+    pixel offset kept here rather than by a scrolling canvas, so the
+    viewport only ever renders what is on screen. The scrollbar and the
+    mouse wheel drive ``offset``; subclasses provide the viewport widget
+    and ``_layout``, which renders the items visible at ``offset``.
+    Positions are in unscaled (logical) pixels, like widget sizes.
+    """
+
+    # Rows scrolled per mouse wheel notch
+    WHEEL_ROWS = 2
+
+    def __init__(self, parent, row_height: int, **kwargs):
+        super().__init__(parent, **kwargs)
+
+        self.row_height = row_height
+        self.items: Sequence = []
+        self.offset = 0
+        self._viewport_height = 0
+
+        # Wheel events from the viewport and everything inside it
+        self._wheel_tag = f"ScrolledViewportWheel{id(self)}"
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.bind_class(self._wheel_tag, sequence, self._on_wheel)
+
+        self.scrollbar = ctk.CTkScrollbar(self, command=self._on_scrollbar)
+        self.scrollbar.pack(side="right", fill="y")
+
+        self.viewport = self._create_viewport()
+        self.viewport.pack(side="left", fill="both", expand=True)
+        self.viewport.bind("<Configure>", self._on_resize)
+        self._add_wheel_tag(self.viewport)
+
+    def _create_viewport(self):
+        raise NotImplementedError
+
+    def _layout(self):
+        raise NotImplementedError
+
+    # ===== Public API =====
+
+    def set_items(self, items: Sequence, reset_scroll: bool = False):
+        """Show ``items``, keeping the scroll position unless asked not to."""
+        self.items = items
+        max_offset = max(self.content_height - self._viewport_height, 0)
+        self.offset = 0 if reset_scroll else min(self.offset, max_offset)
+        self._layout()
+
+    def scroll_to_index(self, index: int):
+        """Scroll just enough to bring item ``index`` into view."""
+        top = index * self.row_height
+        if top < self.offset:
+            self._scroll_to(top)
+        elif top + self.row_height > self.offset + self._viewport_height:
+            self._scroll_to(top + self.row_height - self._viewport_height)
+
+    # ===== Scroll Model =====
+
+    @property
+    def content_height(self) -> int:
+        return len(self.items) * self.row_height
+
+    def _visible_range(self) -> Tuple[int, int, int]:
+        """(first index, rows that fit, pixels the first row is scrolled by)."""
+        first, shift = divmod(self.offset, self.row_height)
+        visible = -(-self._viewport_height // self.row_height) + 1
+        return first, visible, shift
+
+    def _scroll_to(self, offset: float):
+        max_offset = max(self.content_height - self._viewport_height, 0)
+        offset = int(min(max(offset, 0), max_offset))
+        if offset != self.offset:
+            self.offset = offset
+            self._layout()
+
+    def _on_scrollbar(self, action: str, value: str, unit: str = ""):
+        """Scrollbar callback ("moveto" fraction / "scroll" n units|pages)."""
+        if action == "moveto":
+            self._scroll_to(float(value) * self.content_height)
+        elif action == "scroll":
+            step = self._viewport_height if unit == "pages" else self.row_height
+            self._scroll_to(self.offset + int(value) * step)
+
+    def _on_wheel(self, event):
+        if event.num == 4:
+            notches = -1
+        elif event.num == 5:
+            notches = 1
+        elif abs(event.delta) >= 120:
+            notches = -event.delta // 120  # Windows
+        else:
+            notches = -1 if event.delta > 0 else 1  # macOS
+        self._scroll_to(self.offset + notches * self.WHEEL_ROWS * self.row_height)
+        return "break"
+
+    def _on_resize(self, event):
+        height = int(event.height / self._get_widget_scaling())
+        if height != self._viewport_height:
+            self._viewport_height = height
+            max_offset = max(self.content_height - self._viewport_height, 0)
+            self.offset = min(self.offset, max_offset)
+            self._layout()
+
+    def _add_wheel_tag(self, widget):
+        widget.bindtags((self._wheel_tag,) + widget.bindtags())
+        for child in widget.winfo_children():
+            self._add_wheel_tag(child)
+
+    def _update_scrollbar(self):
+        """Size the scrollbar thumb to the visible fraction of the content."""
+        total = self.content_height
+        if total > self._viewport_height > 0:
+            first_fraction = self.offset / total
+            last_fraction = (self.offset + self._viewport_height) / total
+            self.scrollbar.set(first_fraction, min(last_fraction, 1.0))
+        else:
+            self.scrollbar.set(0.0, 1.0)
+
+
+class VirtualList(ScrolledViewport):
+    """
+    Fixed-height widget rows over an arbitrarily long item sequence.
+
+    Only enough row widgets to fill the viewport (plus ``buffer``) are
+    ever created; scrolling re-places them and rebinds them to the items
+    now under them, so rendering cost and widget count don't depend on
+    the item count.
+
+    Rows come from ``row_factory(parent)`` and are pointed at an item with
+    ``bind_row(row, item)``. ``row_height`` is the pitch between rows; rows
+    size themselves and should be a little shorter to leave a gap.
+
+    Rows are reconciled by ``key(item)``: an item that stays on screen
+    keeps its row, which is only moved (and rebound if the item object
+    changed). Only rows for items that scrolled in or were replaced are
+    rebound, and rows are created or destroyed only for the difference
+    in how many are needed.
+    """
+
+    def __init__(
+        self,
+        parent,
+        row_factory: Callable[[Any], Any],
+        bind_row: Callable[[Any, Any], None],
+        row_height: int,
+        key: Callable[[Any], Hashable] = id,
+        buffer: int = 2,
+        empty_text: str = "No items",
+        **kwargs,
+    ):
+        self.row_factory = row_factory
+        self.bind_row = bind_row
+        self.key = key
+        self.buffer = buffer
+
+        # Rows on screen by item key, with the item and y they were given
+        self._rows: Dict[Hashable, Any] = {}
+        self._bound: Dict[Hashable, Tuple[Any, int]] = {}
+        self._spare: List[Any] = []
+
+        super().__init__(parent, row_height, **kwargs)
+
+        self.empty_label = ctk.CTkLabel(
+            self.viewport,
+            text=empty_text,
+            font=Fonts.body(),
+            text_color=Colors.TEXT_MUTED,
+        )
+
+    def _create_viewport(self):
+        return ctk.CTkFrame(self, fg_color=Colors.TRANSPARENT, corner_radius=0)
+
+    # ===== Public API =====
+
+    @property
+    def rows(self) -> List[Any]:
+        """Rows currently showing an item."""
+        return list(self._rows.values())
+
+    def row_for(self, key: Hashable) -> Optional[Any]:
+        """The row showing the item with ``key``, if it is on screen."""
+        return self._rows.get(key)
+
+    def refresh(self):
+        """Rebind every visible row (e.g. after selection changes)."""
+        self._bound.clear()
+        self._layout()
+
+    # ===== Rendering =====
+
+    def _take_row(self) -> Any:
+        """A spare row, or a new one if there is none."""
+        if self._spare:
+            return self._spare.pop()
+        row = self.row_factory(self.viewport)
+        self._add_wheel_tag(row)
+        return row
+
+    def _layout(self):
+        """Reconcile the rows with the items visible at ``offset``."""
+        first, visible, shift = self._visible_range()
+        window = self.items[first : first + visible + self.buffer]
+        keys = [self.key(item) for item in window]
+
+        # Rows whose item left the screen become spares
+        wanted = set(keys)
+        for key in [k for k in self._rows if k not in wanted]:
+            row = self._rows.pop(key)
+            self._bound.pop(key, None)
+            row.place_forget()
+            self._spare.append(row)
+
+        for slot, (key, item) in enumerate(zip(keys, window)):
+            y = slot * self.row_height - shift
+            row = self._rows.get(key)
+            if row is None:
+                row = self._rows[key] = self._take_row()
+
+            bound_item, bound_y = self._bound.get(key, (None, None))
+            if bound_item is not item:
+                self.bind_row(row, item)
+            if bound_y != y:
+                row.place(x=0, y=y, relwidth=1.0)
+            self._bound[key] = (item, y)
+
+        # Keep a few spares for scrolling; destroy the rest
+        while len(self._spare) > self.buffer:
+            self._spare.pop().destroy()
+
+        if self.items:
+            self.empty_label.place_forget()
+        else:
+            self.empty_label.place(relx=0.5, y=50, anchor="n")
+
+        self._update_scrollbar()
@@ -4,69 +4,86 @@ Secure login screen with typewriter animation effect
 """
 
 import customtkinter as ctk
-from typing import Callable, Optional
+from typing import TYPE_CHECKING, Callable, Optional
 import os
 import sys
 
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Add parent directory to path for imports when run as a script
+if not __package__:
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from ui.theme import (
-    Colors,
-    Fonts,
-    Dimensions,
-    Styles,
-    Animation,
-    IS_NEW_USER,
-    DEMO_MASTER_PASSWORD,
-)
+from ui.theme import Colors, Fonts, Dimensions, Styles, Animation
+from ui.scheduler import scheduler_for
+from core.paths import vault_exists
 
+if TYPE_CHECKING:
+    from services.auth_service import AuthService
+    from services.runtime import TkBridge
 
-class LoginWindow(ctk.CTk):
+
+class LoginView(ctk.CTkFrame):
     """
-    Login window with animated greeting and master password entry.
+    Login view with animated greeting and master password entry.
     Supports both new user setup and returning user authentication.
+    Shown in the application's root window; ``reset`` readies it for the
+    next unlock after the vault locks.
     """
 
     def __init__(
         self,
+        parent,
         on_login_success: Optional[Callable] = None,
-        is_new_user: bool = IS_NEW_USER,
+        is_new_user: Optional[bool] = None,
+        auth_service: Optional["AuthService"] = None,
+        **kwargs,
     ):
-        super().__init__()
+        super().__init__(parent, fg_color=Colors.BG_PRIMARY, corner_radius=0, **kwargs)
 
         self.on_login_success = on_login_success
+        self._auth_service = auth_service
+        if is_new_user is None:
+            is_new_user = not (
+                auth_service.vault_exists() if auth_service else vault_exists()
+            )
         self.is_new_user = is_new_user
         self.password_visible = False
         self.confirm_password_visible = False
 
-        # Configure window
-        self._configure_window()
+        # Unlock/KDF runs on the service loop; results come back via the bridge
+        self._bridge: Optional["TkBridge"] = None
+        self._auth_future = None
 
-        # Configure appearance
-        ctk.set_appearance_mode("dark")
+        # Animation frames and message timeouts run on the shared clock
+        self.scheduler = scheduler_for(self)
 
         # Create widgets
         self._create_widgets()
 
         # Start typewriter animation
-        self.after(500, self._start_typewriter_animation)
+        self.scheduler.after(
+            500, self._start_typewriter_animation, key=(self, "typewriter")
+        )
 
-    def _configure_window(self):
-        """Configure the login window properties."""
-        self.title("LockGuardium Lite")
-        self.geometry(f"{Dimensions.LOGIN_WIDTH}x{Dimensions.LOGIN_HEIGHT}")
-        self.resizable(False, False)
-        self.configure(fg_color=Colors.BG_PRIMARY)
+    @property
+    def auth_service(self) -> "AuthService":
+        """The auth service, imported on first use (it loads the crypto stack)."""
+        if self._auth_service is None:
+            from services.auth_service import AuthService
 
-        # Center window on screen
-        self.update_idletasks()
-        x = (self.winfo_screenwidth() - Dimensions.LOGIN_WIDTH) // 2
-        y = (self.winfo_screenheight() - Dimensions.LOGIN_HEIGHT) // 2
-        self.geometry(f"{Dimensions.LOGIN_WIDTH}x{Dimensions.LOGIN_HEIGHT}+{x}+{y}")
+            self._auth_service = AuthService()
+        return self._auth_service
+
+    @property
+    def bridge(self) -> "TkBridge":
+        """The service-loop bridge, created on the first unlock attempt."""
+        if self._bridge is None:
+            from services.runtime import TkBridge
+
+            self._bridge = TkBridge(self)
+        return self._bridge
 
     def _create_widgets(self):
-        """Create all login window widgets."""
+        """Create all login view widgets."""
         # Main container
         self.main_frame = ctk.CTkFrame(self, fg_color=Colors.BG_PRIMARY)
         self.main_frame.pack(fill="both", expand=True, padx=40, pady=30)
@@ -232,9 +249,12 @@ class LoginWindow(ctk.CTk):
         self._typewriter_effect(
             self.app_name_label,
             app_name,
-            callback=lambda: self.after(
+            callback=lambda: self.scheduler.after(
                 Animation.TYPEWRITER_PAUSE,
-                lambda: self._typewriter_effect(self.greeting_label, greeting),
+                self._typewriter_effect,
+                self.greeting_label,
+                greeting,
+                key=(self, "typewriter"),
             ),
         )
 
@@ -242,31 +262,36 @@ class LoginWindow(ctk.CTk):
         self,
         label: ctk.CTkLabel,
         text: str,
-        index: int = 0,
         callback: Optional[Callable] = None,
     ):
         """
-        Animate text appearing character by character.
+        Animate text appearing character by character, one per clock step.
 
         Args:
             label: CTkLabel to update
             text: Full text to display
-            index: Current character index
             callback: Function to call when complete
         """
-        if index <= len(text):
-            # Show text with cursor
-            display_text = text[:index] + ("_" if index < len(text) else "")
-            label.configure(text=display_text)
-            self.after(
-                Animation.TYPEWRITER_SPEED,
-                lambda: self._typewriter_effect(label, text, index + 1, callback),
-            )
-        else:
+        index = 0
+
+        def step() -> bool:
+            nonlocal index
+            if index < len(text):
+                # Show text with cursor
+                self.scheduler.configure(label, text=text[:index] + "_")
+                index += 1
+                return True
+
             # Animation complete, remove cursor
-            label.configure(text=text)
+            self.scheduler.configure(label, text=text)
             if callback:
                 callback()
+            return False
+
+        if step():
+            self.scheduler.animate(
+                (self, "typewriter"), Animation.TYPEWRITER_SPEED, step
+            )
 
     def _toggle_password_visibility(self):
         """Toggle master password visibility."""
@@ -286,12 +311,10 @@ class LoginWindow(ctk.CTk):
 
     def _handle_login(self):
         """Handle login/create vault action."""
-        password = self.password_entry.get()
+        if self._auth_future is not None:
+            return  # Unlock already in progress
 
-        # Validate password length
-        if len(password) < 8:
-            self._show_error("Password must be at least 8 characters")
-            return
+        password = self.password_entry.get()
 
         if self.is_new_user:
             confirm_password = self.confirm_password_entry.get()
@@ -301,36 +324,133 @@ class LoginWindow(ctk.CTk):
                 self._show_error("Passwords do not match")
                 return
 
-            # Create vault (placeholder - would call auth service)
-            self._login_success()
+            coro = self.auth_service.create_vault_async(password)
+            busy_text = "⏳ Creating..."
         else:
-            # Validate password (placeholder - would call auth service)
-            # For demo, accept the demo password or any 8+ char password
-            if password == DEMO_MASTER_PASSWORD or len(password) >= 8:
-                self._login_success()
-            else:
-                self._show_error("Invalid master password")
+            coro = self.auth_service.unlock_async(password)
+            busy_text = "⏳ Unlocking..."
+
+        self.action_button.configure(state="disabled", text=busy_text)
+        self._auth_future = self.bridge.call(
+            coro, on_success=self._on_auth_success, on_error=self._on_auth_error
+        )
+
+    def _on_auth_success(self, vault_service):
+        """Handle a completed unlock/create (runs on the Tk thread)."""
+        self._auth_future = None
+        self._login_success(vault_service)
+
+    def _on_auth_error(self, error: BaseException):
+        """Handle a failed unlock/create (runs on the Tk thread)."""
+        from services.auth_service import AuthError
+
+        self._auth_future = None
+        self.action_button.configure(
+            state="normal",
+            text="🔐 Create Vault" if self.is_new_user else "🔓 Unlock Vault",
+        )
+        if isinstance(error, AuthError):
+            self._show_error(str(error))
+        else:
+            self._show_error(f"Could not open vault: {error}")
 
     def _show_error(self, message: str):
         """Display an error message."""
         self.error_label.configure(text=message)
-        # Clear error after 3 seconds
-        self.after(3000, lambda: self.error_label.configure(text=""))
+        # Clear error after 3 seconds (a newer error restarts the wait)
+        self.scheduler.after(
+            3000,
+            self.scheduler.configure,
+            self.error_label,
+            text="",
+            key=(self, "error"),
+        )
 
-    def _login_success(self):
+    def reset(self):
+        """Clear the entered password(s) and re-arm the view for unlocking."""
+        if self._auth_future is not None:
+            self.bridge.cancel(self._auth_future)
+            self._auth_future = None
+
+        self.password_entry.delete(0, "end")
+        if self.is_new_user:
+            self.confirm_password_entry.delete(0, "end")
+        self.error_label.configure(text="")
+        self.action_button.configure(
+            state="normal",
+            text="🔐 Create Vault" if self.is_new_user else "🔓 Unlock Vault",
+        )
+        self.password_entry.focus_set()
+
+    def destroy(self):
+        """Cancel any in-flight unlock and timers before tearing down the view."""
+        if self._bridge is not None:
+            self._bridge.cancel_all()
+        self.scheduler.cancel((self, "typewriter"))
+        self.scheduler.cancel((self, "error"))
+        super().destroy()
+
+    def _login_success(self, vault_service):
         """Handle successful login."""
+        # The master password is no longer needed on screen
+        self.password_entry.delete(0, "end")
+        if self.is_new_user:
+            self.confirm_password_entry.delete(0, "end")
+
         if self.on_login_success:
-            self.on_login_success()
-        else:
-            # Default behavior: open main window
-            self.destroy()
-            from ui.main_window import MainWindow
+            self.on_login_success(vault_service)
 
-            main_window = MainWindow()
-            main_window.mainloop()
+
+class LoginWindow(ctk.CTk):
+    """Standalone window around a LoginView (the app hosts it in its own root)."""
+
+    def __init__(
+        self,
+        on_login_success: Optional[Callable] = None,
+        is_new_user: Optional[bool] = None,
+        auth_service: Optional["AuthService"] = None,
+    ):
+        super().__init__()
+
+        self._configure_window()
+        ctk.set_appearance_mode("dark")
+
+        self.view = LoginView(
+            self,
+            on_login_success=on_login_success or self._open_vault,
+            is_new_user=is_new_user,
+            auth_service=auth_service,
+        )
+        self.view.pack(fill="both", expand=True)
+
+    def _configure_window(self):
+        """Configure the login window properties."""
+        self.title("LockGuardium Lite")
+        self.geometry(f"{Dimensions.LOGIN_WIDTH}x{Dimensions.LOGIN_HEIGHT}")
+        self.resizable(False, False)
+        self.configure(fg_color=Colors.BG_PRIMARY)
+
+        # Center window on screen
+        self.update_idletasks()
+        x = (self.winfo_screenwidth() - Dimensions.LOGIN_WIDTH) // 2
+        y = (self.winfo_screenheight() - Dimensions.LOGIN_HEIGHT) // 2
+        self.geometry(f"{Dimensions.LOGIN_WIDTH}x{Dimensions.LOGIN_HEIGHT}+{x}+{y}")
+
+    def _open_vault(self, vault_service):
+        """Default behavior: replace the login view with the main view."""
+        from ui.main_window import MainView
+
+        self.view.destroy()
+        self.resizable(True, True)
+        self.geometry(
+            f"{Dimensions.MAIN_DEFAULT_WIDTH}x{Dimensions.MAIN_DEFAULT_HEIGHT}"
+        )
+        self.minsize(Dimensions.MAIN_MIN_WIDTH, Dimensions.MAIN_MIN_HEIGHT)
+        self.view = MainView(self, on_lock=self.destroy, vault_service=vault_service)
+        self.view.pack(fill="both", expand=True)
 
 
 # For testing the login window independently
 if __name__ == "__main__":
-    login = LoginWindow(is_new_user=False)
+    login = LoginWindow()
     login.mainloop()
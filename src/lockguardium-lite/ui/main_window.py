@@ -1,79 +1,208 @@
 """
 LockGuardium Lite - Main Vault Window
-Primary application window with navigation and page management
+Primary application view with navigation and page management
 """
 
 import customtkinter as ctk
-from typing import Optional, Callable
+import asyncio
+from contextlib import suppress
+from tkinter import TclError, Toplevel
+from typing import Optional, Callable, Iterable, List
 import os
 import sys
-from datetime import datetime
-
-# Add parent directories to path for imports
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
-from ui.theme import Colors, Fonts, Dimensions, Styles, PLACEHOLDER_PASSWORDS
+import time
+
+# Add parent directories to path for imports when run as a script
+if not __package__:
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ui.theme import (
+    Colors,
+    Fonts,
+    Dimensions,
+    Styles,
+    PLACEHOLDER_PASSWORDS,
+    PLACEHOLDER_SETTINGS,
+)
+from ui.page_manager import PageManager
+from ui.clipboard import clipboard_for
+from ui.scheduler import scheduler_for
 from ui.components.sidebar import Sidebar
 from ui.components.dashboard import DashboardPage
 from ui.components.vault_page import VaultPage
-from ui.components.generator_page import GeneratorPage
+from ui.components.generator_page import GeneratorPage, generate_password
 from ui.components.settings_page import SettingsPage
+from ui.components.command_palette import CommandPalette
 from ui.components.dialogs import (
     AddPasswordDialog,
     EditPasswordDialog,
     DeleteConfirmDialog,
     MessageDialog,
+    SaveSearchDialog,
+    BulkConfirmDialog,
+    BulkEditDialog,
 )
+from core.presence import screen_locked
+from core.query import QueryError
+from services.palette_service import PaletteItem, PaletteService
+from services.vault_service import VaultError, VaultService
+from services.search_service import SearchService
+from services.smart_folders import SmartFolderService
+from services.runtime import TkBridge, to_thread
 
+# Actions offered by the command palette (key -> label)
+PALETTE_ACTIONS = {
+    "page:dashboard": "Go to Dashboard",
+    "page:vault": "Go to Vault",
+    "page:generator": "Generate Password",
+    "page:settings": "Open Settings",
+    "add": "Add Password",
+    "lock": "Lock Vault",
+}
 
-class MainWindow(ctk.CTk):
+# Pages built during idle time after the first page paints
+PREBUILD_PAGES = ("vault",)
+
+# Pages holding decrypted data; destroyed when the vault locks
+SECRET_PAGES = ("dashboard", "vault")
+
+# How often idleness is checked; auto-lock may lag its timeout by this much
+ACTIVITY_CHECK_MS = 5000
+
+# How often the session's screen lock is asked about (it can spawn loginctl)
+SCREEN_LOCK_CHECK_MS = 30000
+
+# Longest wait between screen lock probes while the platform has no answer
+SCREEN_LOCK_MAX_CHECK_MS = 600000
+
+
+class MainView(ctk.CTkFrame):
     """
-    Main vault window with sidebar navigation and page container.
+    Main vault view with sidebar navigation and page container.
+
+    The view lives for the whole session of the application's single root
+    window. Locking detaches it from its vault: services are closed, the
+    pages holding decrypted data are destroyed and the vault is wiped,
+    while the sidebar, the other pages and the command palette stay
+    built. ``attach`` connects it to the next unlocked vault.
     """
 
-    def __init__(self, on_lock: Optional[Callable] = None):
-        super().__init__()
+    def __init__(
+        self,
+        parent,
+        on_lock: Optional[Callable] = None,
+        vault_service: Optional[VaultService] = None,
+        **kwargs,
+    ):
+        super().__init__(parent, fg_color=Colors.BG_PRIMARY, corner_radius=0, **kwargs)
 
         self.on_lock_callback = on_lock
+        self.root = self.winfo_toplevel()
+        self.vault_service: Optional[VaultService] = None
+        self.search_service: Optional[SearchService] = None
+        self.smart_folders: Optional[SmartFolderService] = None
+        self.palette_service: Optional[PaletteService] = None
+        self.command_palette: Optional[CommandPalette] = None
         self.current_page = "dashboard"
-        self.pages = {}
+        self.settings = PLACEHOLDER_SETTINGS.copy()
 
-        # Auto-lock timer
-        self.auto_lock_after_id = None
-        self.auto_lock_minutes = 5
+        # Copied passwords are cleared from the clipboard after a while
+        self.clipboard = clipboard_for(self)
+        self.clipboard.clear_seconds = self.settings["clipboard_clear_seconds"]
 
-        # Configure window
-        self._configure_window()
+        # Vault persistence runs on the service loop
+        self.bridge = TkBridge(self)
 
-        # Configure appearance
-        ctk.set_appearance_mode("dark")
+        # Auto-lock: input only stamps the time, a coarse check locks
+        self.scheduler = scheduler_for(self)
+        self.auto_lock_minutes = 5
+        self._last_activity = time.monotonic()
+        self._last_check = (time.monotonic(), time.time())
+        self._screen_lock_probe = None
+        self._screen_lock_interval_ms = SCREEN_LOCK_CHECK_MS
+        self._next_screen_lock_probe = 0.0
 
         # Create layout
         self._create_layout()
+        self._bind_activity_events()
+
+        if vault_service is not None:
+            self.attach(vault_service)
+
+    @property
+    def is_attached(self) -> bool:
+        return self.vault_service is not None
+
+    def attach(self, vault_service: VaultService):
+        """Show an unlocked vault, starting on the dashboard."""
+        self.vault_service = vault_service
+        self.search_service = SearchService(vault_service)
+        self.smart_folders = SmartFolderService(vault_service, self.search_service)
+        self.palette_service = PaletteService(vault_service, PALETTE_ACTIONS)
+        if self.command_palette is not None:
+            self.command_palette.palette_service = self.palette_service
 
         # Show initial page
-        self._show_page("dashboard")
+        self.sidebar.select_page("dashboard")
+        self._refresh_smart_folders()
 
         # Start activity tracking for auto-lock
         self._reset_auto_lock_timer()
-        self._bind_activity_events()
 
-    def _configure_window(self):
-        """Configure the main window properties."""
-        self.title("LockGuardium Lite")
-        self.geometry(
-            f"{Dimensions.MAIN_DEFAULT_WIDTH}x{Dimensions.MAIN_DEFAULT_HEIGHT}"
+    def _detach(self, on_done: Optional[Callable] = None):
+        """
+        Wipe decrypted data and close services, keeping the widgets.
+
+        Everything on screen is cleared at once. Vault writes still in
+        flight are allowed to land, then usage counts are saved and the
+        services closed and the vault wiped, all off the Tk thread;
+        ``on_done`` runs after that.
+        """
+        vault = self.vault_service
+        services = (self.palette_service, self.smart_folders, self.search_service)
+        self.vault_service = None
+        self.search_service = self.smart_folders = self.palette_service = None
+
+        self.bridge.cancel_all()  # Reads only; writes are uncancellable
+        self._screen_lock_probe = None
+        self.clipboard.clear()
+        self.pages.cancel_prebuild()
+        self.pages.hide_current()
+        for page_id in SECRET_PAGES:
+            self.pages.release(page_id)
+        self._close_dialogs()
+        if self.command_palette is not None:
+            self.command_palette.clear()
+        self.sidebar.set_smart_folders([])
+
+        def finished(error: Optional[BaseException] = None):
+            if error is not None:
+                self._on_vault_error(error)
+            if on_done:
+                on_done()
+
+        self.bridge.call(
+            self._end_session(vault, services, self.bridge.uncancellable()),
+            on_success=lambda _: finished(),
+            on_error=finished,
+            cancellable=False,
         )
-        self.minsize(Dimensions.MAIN_MIN_WIDTH, Dimensions.MAIN_MIN_HEIGHT)
-        self.configure(fg_color=Colors.BG_PRIMARY)
 
-        # Center window on screen
-        self.update_idletasks()
-        x = (self.winfo_screenwidth() - Dimensions.MAIN_DEFAULT_WIDTH) // 2
-        y = (self.winfo_screenheight() - Dimensions.MAIN_DEFAULT_HEIGHT) // 2
-        self.geometry(
-            f"{Dimensions.MAIN_DEFAULT_WIDTH}x{Dimensions.MAIN_DEFAULT_HEIGHT}+{x}+{y}"
-        )
+    @staticmethod
+    async def _end_session(vault: VaultService, services: Iterable, writes: List):
+        """Wait for ``writes``, save usage, then close ``services`` and wipe ``vault``."""
+        if writes:
+            # Failed writes are reported by their own callbacks
+            await asyncio.wait([asyncio.wrap_future(f) for f in writes])
+
+        # Usage counts are only written with commits; keep this session's
+        # (a re-encrypt and fsync, and it waits out any batch still running)
+        with suppress(VaultError, OSError):
+            await to_thread(vault.flush_usage)
+
+        for service in services:
+            await to_thread(service.close)  # Search finishes its journal
+        await to_thread(vault.lock)
 
     def _create_layout(self):
         """Create the main layout with sidebar and content area."""
@@ -88,6 +217,8 @@ class MainWindow(ctk.CTk):
             on_page_change=self._on_page_change,
             on_lock=self._on_lock,
             on_theme_change=self._on_theme_change,
+            on_folder_select=self._on_open_smart_folder,
+            on_folder_remove=self._on_remove_smart_folder,
         )
         self.sidebar.grid(row=0, column=0, sticky="nsew")
 
@@ -99,76 +230,104 @@ class MainWindow(ctk.CTk):
         self.content_frame.grid_columnconfigure(0, weight=1)
         self.content_frame.grid_rowconfigure(0, weight=1)
 
-        # ===== Create Pages =====
-        self._create_pages()
+        # ===== Pages (built on first visit) =====
+        self.pages = PageManager(self.content_frame)
+        self.pages.register("dashboard", self._create_dashboard_page)
+        self.pages.register("vault", self._create_vault_page, heavy=True)
+        self.pages.register("generator", self._create_generator_page)
+        self.pages.register("settings", self._create_settings_page)
+
+        # Minimizing frees hidden heavy pages (the vault rows)
+        self.root.bind("<Unmap>", self._on_unmap, add="+")
 
-    def _create_pages(self):
-        """Create all page components."""
-        # Dashboard page
-        self.pages["dashboard"] = DashboardPage(self.content_frame)
+    def _create_dashboard_page(self) -> DashboardPage:
+        return DashboardPage(self.content_frame, vault_service=self.vault_service)
 
-        # Vault page
-        self.pages["vault"] = VaultPage(
+    def _create_vault_page(self) -> VaultPage:
+        return VaultPage(
             self.content_frame,
+            passwords=self.vault_service.get_all(),
+            search_service=self.search_service,
             on_add=self._on_add_password,
             on_edit=self._on_edit_password,
             on_delete=self._on_delete_password,
+            on_bulk_edit=self._on_bulk_edit,
+            on_bulk_delete=self._on_bulk_delete,
+            on_regenerate=self._on_regenerate_passwords,
+            on_save_search=self._on_save_search,
+            on_entry_used=self._on_entry_used,
+            renderer=self.settings["table_renderer"],
         )
 
-        # Generator page
-        self.pages["generator"] = GeneratorPage(
+    def _create_generator_page(self) -> GeneratorPage:
+        return GeneratorPage(
             self.content_frame, on_save_password=self._on_save_from_generator
         )
 
-        # Settings page
-        self.pages["settings"] = SettingsPage(
+    def _create_settings_page(self) -> SettingsPage:
+        return SettingsPage(
             self.content_frame,
+            settings=self.settings,
             on_export=self._on_export,
             on_import=self._on_import,
             on_settings_change=self._on_settings_change,
         )
 
-        # Initially hide all pages
-        for page in self.pages.values():
-            page.grid_remove()
-
     def _show_page(self, page_id: str):
-        """Show a specific page and hide others."""
-        # Hide current page
-        if self.current_page in self.pages:
-            self.pages[self.current_page].grid_remove()
-
-        # Show new page
-        if page_id in self.pages:
-            self.pages[page_id].grid(row=0, column=0, sticky="nsew")
-            self.current_page = page_id
-
-        # Refresh page data if needed
-        if page_id == "dashboard":
-            self.pages["dashboard"].refresh()
-        elif page_id == "vault":
-            self.pages["vault"].refresh()
+        """Show a specific page (building it on first visit) and hide others."""
+        if page_id not in self.pages:
+            return
+
+        page, created = self.pages.show(page_id)
+        self.current_page = page_id
+
+        # A page that already existed may show stale data
+        if not created and page_id in ("dashboard", "vault"):
+            page.refresh()
+
+        self.pages.prebuild(PREBUILD_PAGES)
+
+    def _on_unmap(self, event=None):
+        """Release hidden heavy pages while the window is minimized."""
+        if event is not None and event.widget is self.root:
+            if self.root.state() == "iconic":
+                self.pages.release_hidden()
 
     def _on_page_change(self, page_id: str):
         """Handle page change from sidebar."""
         self._show_page(page_id)
         self._reset_auto_lock_timer()
 
-    def _on_lock(self):
-        """Handle lock action."""
+    def _close_dialogs(self):
+        """Destroy open dialogs; they may show decrypted data (the palette stays)."""
+        stack = self.winfo_children()
+        while stack:
+            widget = stack.pop()
+            if isinstance(widget, Toplevel) and widget is not self.command_palette:
+                widget.destroy()  # A blocked get_result() returns None
+            else:
+                stack.extend(widget.winfo_children())
+
+    def lock(self, on_done: Optional[Callable] = None) -> bool:
+        """
+        Lock the vault; ``on_done`` runs once it is saved and wiped.
+
+        Returns:
+            False if there was no unlocked vault (``on_done`` isn't called)
+        """
+        if not self.is_attached:
+            return False
+
         # Cancel auto-lock timer
-        if self.auto_lock_after_id:
-            self.after_cancel(self.auto_lock_after_id)
+        self.scheduler.cancel((self, "auto-lock"))
 
-        if self.on_lock_callback:
-            self.on_lock_callback()
-        else:
-            # Default: destroy main window and show login
-            self.destroy()
-            from ui.login_window import LoginWindow
+        # Wipe decrypted data (usage counts are saved on the way)
+        self._detach(on_done=on_done)
+        return True
 
-            login = LoginWindow()
-            login.mainloop()
+    def _on_lock(self):
+        """Handle lock action, then hand back to the login view."""
+        self.lock(on_done=self.on_lock_callback)
 
     def _on_theme_change(self, theme: str):
         """Handle theme change."""
@@ -178,96 +337,271 @@ class MainWindow(ctk.CTk):
 
     def _on_add_password(self):
         """Handle add password action."""
+        if not self.is_attached:
+            return
+
         dialog = AddPasswordDialog(self)
         result = dialog.get_result()
 
         if result:
-            # Add to placeholder data with new ID
-            new_id = max((p.get("id", 0) for p in PLACEHOLDER_PASSWORDS), default=0) + 1
-            today = datetime.now().strftime("%Y-%m-%d")
-
-            new_password = {
-                "id": new_id,
-                **result,
-                "created_at": today,
-                "modified_at": today,
-            }
-
-            PLACEHOLDER_PASSWORDS.append(new_password)
-            self.pages["vault"].add_password(new_password)
-
-            # Show success message
-            MessageDialog(self, "Success", "Password added successfully!", icon="✅")
+            self._run_vault_batch(
+                lambda vault: vault.add(result), "Password added successfully!"
+            )
 
         self._reset_auto_lock_timer()
 
     def _on_edit_password(self, password_data: dict):
         """Handle edit password action."""
+        if not self.is_attached:
+            return
+
         dialog = EditPasswordDialog(self, password_data)
         result = dialog.get_result()
 
         if result:
-            # Update placeholder data
-            today = datetime.now().strftime("%Y-%m-%d")
-            result["modified_at"] = today
-
-            for i, p in enumerate(PLACEHOLDER_PASSWORDS):
-                if p.get("id") == result.get("id"):
-                    PLACEHOLDER_PASSWORDS[i] = {**p, **result}
-                    break
-
-            self.pages["vault"].update_password(result.get("id"), result)
-
-            # Show success message
-            MessageDialog(self, "Success", "Password updated successfully!", icon="✅")
+            self._run_vault_batch(
+                lambda vault: vault.update(result.get("id"), result),
+                "Password updated successfully!",
+            )
 
         self._reset_auto_lock_timer()
 
     def _on_delete_password(self, password_data: dict):
         """Handle delete password action."""
+        if not self.is_attached:
+            return
+
         dialog = DeleteConfirmDialog(self, password_data)
         result = dialog.get_result()
 
         if result:
-            # Remove from placeholder data
             password_id = password_data.get("id")
-            for i, p in enumerate(PLACEHOLDER_PASSWORDS):
-                if p.get("id") == password_id:
-                    PLACEHOLDER_PASSWORDS.pop(i)
-                    break
+            self._run_vault_batch(
+                lambda vault: vault.delete(password_id),
+                "Password deleted successfully!",
+            )
+
+        self._reset_auto_lock_timer()
+
+    def _on_bulk_edit(self, entries: List[dict]):
+        """Set one field on every selected entry in a single batch."""
+        if not self.is_attached:
+            return
+
+        dialog = BulkEditDialog(self, entries)
+        result = dialog.get_result()
+
+        if result:
+            field, value = result
+            ids = [e.get("id") for e in entries]
 
-            self.pages["vault"].delete_password(password_id)
+            def update_all(vault: VaultService):
+                for entry_id in ids:
+                    vault.update(entry_id, {field: value})
 
-            # Show success message
-            MessageDialog(self, "Success", "Password deleted successfully!", icon="✅")
+            self._run_vault_batch(update_all, f"{len(ids)} passwords updated!")
+
+        self._reset_auto_lock_timer()
+
+    def _on_bulk_delete(self, entries: List[dict]):
+        """Delete every selected entry in a single batch."""
+        if not self.is_attached:
+            return
+
+        dialog = BulkConfirmDialog(
+            self,
+            entries,
+            title="Confirm Delete",
+            action="Delete",
+            warning="This action cannot be undone.",
+            confirm_text="Delete",
+        )
+
+        if dialog.get_result():
+            ids = [e.get("id") for e in entries]
+
+            def delete_all(vault: VaultService):
+                for entry_id in ids:
+                    vault.delete(entry_id)
+
+            self._run_vault_batch(delete_all, f"{len(ids)} passwords deleted!")
+
+        self._reset_auto_lock_timer()
+
+    def _on_regenerate_passwords(self, entries: List[dict]):
+        """Give every selected entry a new random password in a single batch."""
+        if not self.is_attached:
+            return
+
+        dialog = BulkConfirmDialog(
+            self,
+            entries,
+            title="Regenerate Passwords",
+            action="Regenerate",
+            warning="Old passwords are replaced and cannot be recovered.",
+            confirm_text="Regenerate",
+            confirm_style=Styles.BUTTON_PRIMARY,
+        )
+
+        if dialog.get_result():
+            ids = [e.get("id") for e in entries]
+            length = self.settings["default_password_length"]
+
+            def regenerate_all(vault: VaultService):
+                for entry_id in ids:
+                    vault.update(entry_id, {"password": generate_password(length)})
+
+            self._run_vault_batch(
+                regenerate_all,
+                f"{len(ids)} passwords regenerated!\n"
+                "Remember to change them on each service too.",
+            )
 
         self._reset_auto_lock_timer()
 
     def _on_save_from_generator(self, password: str):
         """Handle save password from generator."""
+        if not self.is_attached:
+            return
+
         dialog = AddPasswordDialog(self, prefilled_password=password)
         result = dialog.get_result()
 
         if result:
-            # Add to placeholder data with new ID
-            new_id = max((p.get("id", 0) for p in PLACEHOLDER_PASSWORDS), default=0) + 1
-            today = datetime.now().strftime("%Y-%m-%d")
+            self._run_vault_batch(
+                lambda vault: vault.add(result), "Password saved to vault!"
+            )
 
-            new_password = {
-                "id": new_id,
-                **result,
-                "created_at": today,
-                "modified_at": today,
-            }
+        self._reset_auto_lock_timer()
+
+    def _run_vault_batch(self, operations: Callable, message: str = ""):
+        """Commit ``operations`` as one vault batch off the Tk thread."""
+        if not self.is_attached:
+            return  # Locked while a dialog was open
+        self.bridge.call(
+            self.vault_service.batch_async(operations),
+            on_success=lambda change: self._on_vault_changed(change, message),
+            on_error=self._on_vault_error,
+            cancellable=False,  # A lock waits for it rather than dropping it
+        )
+
+    def _on_vault_changed(self, change, message: str = ""):
+        """Re-render once for a committed (coalesced) vault change."""
+        if not self.is_attached:
+            return
+        vault_page = self.pages.peek("vault")
+        if vault_page is not None:
+            vault_page.apply_change(change)  # Otherwise built fresh on first visit
+        self._refresh_smart_folders()
+
+        # Show success message
+        if message:
+            MessageDialog(self, "Success", message, icon="✅")
+
+    def _on_vault_error(self, error: BaseException):
+        """Report a failed vault operation."""
+        MessageDialog(self, "Error", f"Vault operation failed:\n{error}", icon="❌")
+
+    # ===== Command Palette =====
+
+    def _open_palette(self, event=None):
+        """Open the Ctrl+K quick switcher."""
+        if not self.is_attached:
+            return None
+        if self.command_palette is None:
+            self.command_palette = CommandPalette(
+                self, self.palette_service, on_choose=self._on_palette_choose
+            )
+        self.command_palette.open()
+        return "break"
+
+    def _on_palette_choose(self, item: PaletteItem):
+        """Copy the chosen entry's password, or run the chosen action."""
+        self.palette_service.record_use(item.key)
+        self._reset_auto_lock_timer()
+
+        if not item.is_action:
+            self.clipboard.copy(item.entry.get("password", ""))
+        elif item.key.startswith("page:"):
+            self.sidebar.select_page(item.key.split(":", 1)[1])
+        elif item.key == "add":
+            self._on_add_password()
+        elif item.key == "lock":
+            self._on_lock()
+
+    def _on_entry_used(self, password_data: dict):
+        """Count a copy or reveal towards the entry's palette ranking."""
+        self.palette_service.record_use(password_data.get("id"))
+
+    # ===== Smart Folders =====
+
+    def _refresh_smart_folders(self):
+        """Update the sidebar folder counts (computed off the Tk thread)."""
+        self.bridge.call(
+            self.smart_folders.folders_async(),
+            on_success=self.sidebar.set_smart_folders,
+            on_error=self._on_vault_error,
+        )
 
-            PLACEHOLDER_PASSWORDS.append(new_password)
-            self.pages["vault"].add_password(new_password)
+    def _on_open_smart_folder(self, name: str):
+        """Show a smart folder's entries on the vault page."""
+        if not self.is_attached:
+            return
+
+        query = self.smart_folders.query_of(name)
+        if query is None:
+            return
+
+        self._show_page("vault")
+        self.bridge.call(
+            self.smart_folders.entries_async(name),
+            on_success=lambda entries: self.pages.get("vault").show_smart_folder(
+                query, entries
+            ),
+            on_error=self._on_vault_error,
+        )
+        self._reset_auto_lock_timer()
+
+    def _on_save_search(self, query: str):
+        """Save the vault page's current search as a smart folder."""
+        if not self.is_attached:
+            return
+
+        dialog = SaveSearchDialog(self, query)
+        name = dialog.get_result()
+
+        if name and self.is_attached:
+            self.bridge.call(
+                self.smart_folders.add_async(name, query),
+                on_success=lambda change: self._on_vault_changed(
+                    change, f"Smart folder '{name}' saved!"
+                ),
+                on_error=self._on_smart_folder_error,
+                cancellable=False,
+            )
+
+        self._reset_auto_lock_timer()
 
-            # Show success message
-            MessageDialog(self, "Success", "Password saved to vault!", icon="✅")
+    def _on_remove_smart_folder(self, name: str):
+        """Remove a smart folder (its entries are untouched)."""
+        if not self.is_attached:
+            return
 
+        self.bridge.call(
+            self.smart_folders.remove_async(name),
+            on_success=self._on_vault_changed,
+            on_error=self._on_vault_error,
+            cancellable=False,
+        )
         self._reset_auto_lock_timer()
 
+    def _on_smart_folder_error(self, error: BaseException):
+        """Report an invalid saved search query."""
+        if isinstance(error, QueryError):
+            MessageDialog(self, "Invalid Search", str(error), icon="❌")
+        else:
+            self._on_vault_error(error)
+
     # ===== Settings Operations =====
 
     def _on_export(self):
@@ -294,32 +628,126 @@ class MainWindow(ctk.CTk):
 
     def _on_settings_change(self, settings: dict):
         """Handle settings change."""
-        # Update auto-lock timer if changed
-        if settings.get("auto_lock_minutes") != self.auto_lock_minutes:
-            self.auto_lock_minutes = settings.get("auto_lock_minutes", 5)
-            self._reset_auto_lock_timer()
+        self.settings = dict(settings)
+        self.clipboard.clear_seconds = settings.get("clipboard_clear_seconds", 30)
+
+        # The next idle check uses the new auto-lock timeout
+        self.auto_lock_minutes = settings.get("auto_lock_minutes", 5)
+        self._reset_auto_lock_timer()
+
+        # Vault table renderer (no-op if unchanged; a new page reads settings)
+        vault_page = self.pages.peek("vault")
+        if vault_page is not None:
+            vault_page.set_renderer(settings.get("table_renderer", "widgets"))
 
     # ===== Auto-lock Timer =====
 
     def _bind_activity_events(self):
-        """Bind events to track user activity."""
-        self.bind("<Key>", self._on_activity)
-        self.bind("<Motion>", self._on_activity)
-        self.bind("<Button>", self._on_activity)
+        """Bind events to track user activity (in every window, once)."""
+        for sequence in ("<Key>", "<Motion>", "<Button>"):
+            self.root.bind_all(sequence, self._on_activity, add="+")
+
+        # Quick switcher
+        self.root.bind("<Control-k>", self._open_palette, add="+")
+        self.root.bind("<Control-K>", self._open_palette, add="+")
 
     def _on_activity(self, event=None):
-        """Handle user activity - reset auto-lock timer."""
-        self._reset_auto_lock_timer()
+        """Record user activity; runs on every mouse move, so it only stamps time."""
+        self._last_activity = time.monotonic()
 
     def _reset_auto_lock_timer(self):
-        """Reset the auto-lock timer."""
-        # Cancel existing timer
-        if self.auto_lock_after_id:
-            self.after_cancel(self.auto_lock_after_id)
-
-        # Set new timer
-        timeout_ms = self.auto_lock_minutes * 60 * 1000
-        self.auto_lock_after_id = self.after(timeout_ms, self._on_lock)
+        """Count an action as activity and make sure the idle check is running."""
+        self._last_activity = time.monotonic()
+        if self.is_attached and (self, "auto-lock") not in self.scheduler:
+            self._last_check = (time.monotonic(), time.time())
+            self.scheduler.after(
+                ACTIVITY_CHECK_MS, self._check_activity, key=(self, "auto-lock")
+            )
+
+    def _check_activity(self):
+        """Lock once idle for the timeout; otherwise check again later."""
+        if not self.is_attached:
+            return
+
+        # The monotonic clock stops while the machine sleeps; sleep is idle time
+        now, wall = time.monotonic(), time.time()
+        last_now, last_wall = self._last_check
+        self._last_check = (now, wall)
+        slept = (wall - last_wall) - (now - last_now)
+        if slept > 1:
+            self._last_activity -= slept
+
+        timeout = self.auto_lock_minutes * 60
+        system_idle = self._system_idle_seconds()
+        if now - self._last_activity >= timeout or (
+            system_idle is not None and system_idle >= timeout
+        ):
+            self._on_lock()
+            return
+
+        self._probe_screen_lock()
+        self.scheduler.after(
+            ACTIVITY_CHECK_MS, self._check_activity, key=(self, "auto-lock")
+        )
+
+    def _system_idle_seconds(self) -> Optional[float]:
+        """Seconds since the last input anywhere on the display, if Tk knows."""
+        try:
+            idle_ms = int(self.tk.call("tk", "inactive"))
+        except (TclError, ValueError):
+            return None
+        return idle_ms / 1000 if idle_ms >= 0 else None
+
+    def _probe_screen_lock(self):
+        """Ask (off the Tk thread) whether the session's screen is locked."""
+        if self._screen_lock_probe is not None:
+            return
+        now = time.monotonic()
+        if now < self._next_screen_lock_probe:
+            return
+        self._next_screen_lock_probe = now + self._screen_lock_interval_ms / 1000
+        self._screen_lock_probe = self.bridge.call(
+            to_thread(screen_locked),
+            on_success=self._on_screen_lock_state,
+            on_error=lambda error: self._on_screen_lock_state(None),
+        )
+
+    def _on_screen_lock_state(self, locked: Optional[bool]):
+        """Lock the vault with the screen; ask less often while nobody can tell."""
+        self._screen_lock_probe = None
+        if locked is None:
+            # The session or loginctl may show up later, so back off, don't stop
+            interval = min(self._screen_lock_interval_ms * 2, SCREEN_LOCK_MAX_CHECK_MS)
+            self._screen_lock_interval_ms = interval
+            self._next_screen_lock_probe = time.monotonic() + interval / 1000
+            return
+
+        self._screen_lock_interval_ms = SCREEN_LOCK_CHECK_MS
+        if locked:
+            self._on_lock()
+
+
+class MainWindow(ctk.CTk):
+    """Standalone window around a MainView (the app hosts it in its own root)."""
+
+    def __init__(self, vault_service: Optional[VaultService] = None):
+        super().__init__()
+
+        self.title("LockGuardium Lite")
+        self.geometry(
+            f"{Dimensions.MAIN_DEFAULT_WIDTH}x{Dimensions.MAIN_DEFAULT_HEIGHT}"
+        )
+        self.minsize(Dimensions.MAIN_MIN_WIDTH, Dimensions.MAIN_MIN_HEIGHT)
+        self.configure(fg_color=Colors.BG_PRIMARY)
+        ctk.set_appearance_mode("dark")
+
+        self.view = MainView(
+            self,
+            on_lock=self.destroy,
+            vault_service=vault_service
+            or VaultService.in_memory(PLACEHOLDER_PASSWORDS),
+        )
+        self.view.pack(fill="both", expand=True)
 
 
 # For testing the main window independently
@@ -0,0 +1,162 @@
+"""
+LockGuardium Lite - Page Manager
+Builds pages on first visit, prebuilds likely ones when idle and frees hidden ones
+"""
+
+import customtkinter as ctk
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+import os
+import sys
+
+# Add parent directories to path for imports when run as a script
+if not __package__:
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+class PageManager:
+    """
+    Lifecycle of the pages shown in one grid cell of ``container``.
+
+    Pages are registered as factories and only constructed when first
+    shown (or prebuilt), so unlocking paints the first page without
+    building the others. ``prebuild`` queues pages to construct one at a
+    time when Tk is idle after the first paint. Pages registered as
+    ``heavy`` can be destroyed while hidden with ``release_hidden``; they
+    are rebuilt from their factory on the next visit.
+    """
+
+    # Wait this long after a page is shown before prebuilding others
+    PREBUILD_DELAY_MS = 300
+
+    def __init__(self, container: ctk.CTkFrame):
+        self.container = container
+        self.current: Optional[str] = None
+
+        self._factories: Dict[str, Callable[[], ctk.CTkFrame]] = {}
+        self._heavy: Set[str] = set()
+        self._pages: Dict[str, ctk.CTkFrame] = {}
+        self._prebuild_queue: List[str] = []
+        self._prebuild_after_id = None
+
+    def register(
+        self, page_id: str, factory: Callable[[], ctk.CTkFrame], heavy: bool = False
+    ):
+        """Add a page built by ``factory()`` on first use."""
+        self._factories[page_id] = factory
+        if heavy:
+            self._heavy.add(page_id)
+
+    # ===== Access =====
+
+    def __contains__(self, page_id: str) -> bool:
+        return page_id in self._factories
+
+    def peek(self, page_id: str) -> Optional[ctk.CTkFrame]:
+        """The page if it has been built, without building it."""
+        return self._pages.get(page_id)
+
+    def get(self, page_id: str) -> ctk.CTkFrame:
+        """The page, building it now if needed."""
+        page = self._pages.get(page_id)
+        if page is None:
+            page = self._build(page_id)
+        return page
+
+    def built(self) -> List[str]:
+        """Ids of the pages currently constructed."""
+        return list(self._pages)
+
+    def _build(self, page_id: str) -> ctk.CTkFrame:
+        page = self._factories[page_id]()
+        self._pages[page_id] = page
+        if page_id in self._prebuild_queue:
+            self._prebuild_queue.remove(page_id)
+        return page
+
+    # ===== Showing =====
+
+    def show(self, page_id: str) -> Tuple[ctk.CTkFrame, bool]:
+        """
+        Show ``page_id`` in place of the current page.
+
+        Returns:
+            (page, created) - created is True if the page was just built
+        """
+        created = page_id not in self._pages
+        page = self.get(page_id)
+
+        if self.current is not None and self.current != page_id:
+            previous = self._pages.get(self.current)
+            if previous is not None:
+                previous.grid_remove()
+
+        page.grid(row=0, column=0, sticky="nsew")
+        self.current = page_id
+        return page, created
+
+    def hide_current(self):
+        """Hide the current page, leaving no page shown."""
+        page = self._pages.get(self.current) if self.current else None
+        if page is not None:
+            page.grid_remove()
+        self.current = None
+
+    # ===== Prebuilding =====
+
+    def prebuild(self, page_ids: Iterable[str]):
+        """Build ``page_ids`` one per idle slot, after the current page paints."""
+        for page_id in page_ids:
+            if page_id not in self._pages and page_id not in self._prebuild_queue:
+                self._prebuild_queue.append(page_id)
+
+        if self._prebuild_queue and self._prebuild_after_id is None:
+            self._prebuild_after_id = self.container.after(
+                self.PREBUILD_DELAY_MS, self._schedule_prebuild
+            )
+
+    def _schedule_prebuild(self):
+        self._prebuild_after_id = self.container.after_idle(self._prebuild_next)
+
+    def _prebuild_next(self):
+        """Build one queued page (hidden), then yield to Tk before the next."""
+        self._prebuild_after_id = None
+        if not self._prebuild_queue:
+            return
+
+        page_id = self._prebuild_queue.pop(0)
+        if page_id not in self._pages:
+            self._build(page_id)  # Stays ungridded until shown
+
+        if self._prebuild_queue:
+            self._prebuild_after_id = self.container.after_idle(self._prebuild_next)
+
+    def cancel_prebuild(self):
+        """Drop any queued prebuilds."""
+        self._prebuild_queue.clear()
+        if self._prebuild_after_id is not None:
+            self.container.after_cancel(self._prebuild_after_id)
+            self._prebuild_after_id = None
+
+    # ===== Releasing =====
+
+    def release(self, page_id: str) -> bool:
+        """Destroy a built, hidden page. Returns True if it was released."""
+        page = self._pages.get(page_id)
+        if page is None or page_id == self.current:
+            return False
+        del self._pages[page_id]
+        page.destroy()
+        return True
+
+    def release_hidden(self, heavy_only: bool = True) -> List[str]:
+        """Destroy hidden pages (only heavy ones by default) to free memory."""
+        candidates = self._heavy if heavy_only else set(self._pages)
+        return [page_id for page_id in list(candidates) if self.release(page_id)]
+
+    def destroy_all(self):
+        """Destroy every built page and cancel prebuilding."""
+        self.cancel_prebuild()
+        for page in self._pages.values():
+            page.destroy()
+        self._pages.clear()
+        self.current = None
@@ -0,0 +1,245 @@
+"""
+LockGuardium Lite - UI Scheduler
+One timer wheel and frame clock driving every UI timer and animation
+"""
+
+import itertools
+import math
+import sys
+import time
+from tkinter import TclError
+from typing import Any, Callable, Dict, Hashable, List, Optional
+
+
+class _Timer:
+    """A pending callback; ``interval`` (in frames) is set for animations."""
+
+    __slots__ = ("key", "deadline", "seq", "callback", "args", "kwargs", "interval")
+
+    def __init__(self, key, deadline, seq, callback, args, kwargs, interval):
+        self.key = key
+        self.deadline = deadline
+        self.seq = seq
+        self.callback = callback
+        self.args = args
+        self.kwargs = kwargs
+        self.interval = interval
+
+
+class Scheduler:
+    """
+    UI timers and animations on a single Tk timer.
+
+    Time advances in fixed frames of ``FRAME_MS``; a timer fires on the
+    first frame at or after its deadline. Timers sit in a hashed wheel of
+    ``WHEEL_SLOTS`` buckets indexed by deadline frame, so adding and
+    cancelling are O(1) and a frame only looks at its own bucket. Every
+    timer has a key: scheduling an existing key replaces that timer and
+    ``cancel(key)`` drops it, so owners don't keep ``after`` ids around.
+
+    Animations run at a fixed rate measured from when they started, so a
+    late frame doesn't push back the ones after it (missed frames are
+    skipped, not replayed). ``configure`` calls queued here are merged per
+    widget and applied once, after the frame's callbacks have run.
+
+    The Tk timer is only armed while something is pending, and for the
+    frame of the earliest deadline rather than for every frame.
+    """
+
+    FRAME_MS = 20
+    WHEEL_SLOTS = 256
+
+    def __init__(self, widget):
+        self.widget = widget
+        self._origin = time.monotonic()
+        self._frame = 0  # Last frame processed
+        self._wheel: List[Dict[Hashable, _Timer]] = [
+            {} for _ in range(self.WHEEL_SLOTS)
+        ]
+        self._timers: Dict[Hashable, _Timer] = {}
+        self._configures: Dict[Any, dict] = {}
+        self._seq = itertools.count()
+        self._in_frame = False
+        self._after_id = None
+        self._armed_frame: Optional[int] = None
+
+    # ===== Public API =====
+
+    def after(
+        self,
+        delay_ms: int,
+        callback: Callable,
+        *args,
+        key: Optional[Hashable] = None,
+        **kwargs,
+    ) -> Hashable:
+        """
+        Call ``callback(*args, **kwargs)`` once, ``delay_ms`` from now.
+
+        Returns:
+            The timer's key (a new unique one if ``key`` is None)
+        """
+        return self._add(key, delay_ms, callback, args, kwargs, None)
+
+    def animate(
+        self, key: Hashable, interval_ms: int, step: Callable[[], Optional[bool]]
+    ) -> Hashable:
+        """Call ``step()`` every ``interval_ms`` until it returns False."""
+        frames = max(math.ceil(interval_ms / self.FRAME_MS), 1)
+        return self._add(key, interval_ms, step, (), {}, frames)
+
+    def cancel(self, key: Hashable) -> bool:
+        """Drop the timer or animation ``key``. Returns True if it was pending."""
+        timer = self._timers.pop(key, None)
+        if timer is None:
+            return False
+        del self._wheel[timer.deadline % self.WHEEL_SLOTS][key]
+        return True
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._timers
+
+    def configure(self, widget, **options):
+        """Queue ``widget.configure(**options)`` for the end of the frame."""
+        self._configures.setdefault(widget, {}).update(options)
+        if not self._in_frame:
+            self._arm(self._now_frame() + 1)
+
+    def pending(self) -> Dict[str, int]:
+        """Counts of pending timers, animations and queued configures."""
+        animations = sum(1 for t in self._timers.values() if t.interval is not None)
+        return {
+            "timers": len(self._timers) - animations,
+            "animations": animations,
+            "configures": len(self._configures),
+        }
+
+    def cancel_all(self):
+        """Drop everything pending and stop the Tk timer."""
+        for bucket in self._wheel:
+            bucket.clear()
+        self._timers.clear()
+        self._configures.clear()
+        if self._after_id is not None:
+            self.widget.after_cancel(self._after_id)
+            self._after_id = None
+            self._armed_frame = None
+
+    # ===== Clock =====
+
+    def _now_frame(self) -> int:
+        return int((time.monotonic() - self._origin) * 1000 // self.FRAME_MS)
+
+    def _add(self, key, delay_ms, callback, args, kwargs, interval) -> Hashable:
+        seq = next(self._seq)
+        if key is None:
+            key = ("timer", seq)
+        else:
+            self.cancel(key)
+
+        # Never earlier than delay_ms after now, nor in a processed frame
+        elapsed_ms = (time.monotonic() - self._origin) * 1000
+        deadline = math.ceil((elapsed_ms + delay_ms) / self.FRAME_MS)
+        deadline = max(deadline, self._frame + 1)
+
+        timer = _Timer(key, deadline, seq, callback, args, kwargs, interval)
+        self._timers[key] = timer
+        self._wheel[deadline % self.WHEEL_SLOTS][key] = timer
+        if not self._in_frame:
+            self._arm(deadline)
+        return key
+
+    def _arm(self, frame: int):
+        """Make sure the Tk timer fires no later than ``frame``."""
+        if self._armed_frame is not None and self._armed_frame <= frame:
+            return
+        if self._after_id is not None:
+            self.widget.after_cancel(self._after_id)
+
+        elapsed_ms = (time.monotonic() - self._origin) * 1000
+        delay = max(math.ceil(frame * self.FRAME_MS - elapsed_ms), 0)
+        self._after_id = self.widget.after(delay, self._tick)
+        self._armed_frame = frame
+
+    def _arm_next(self):
+        """Arm for the next frame with work, if any."""
+        if self._configures:
+            self._arm(self._frame + 1)
+        elif self._timers:
+            # Only on re-arm, and there are few timers; the wheel stays O(1)
+            self._arm(min(t.deadline for t in self._timers.values()))
+
+    # ===== Frames =====
+
+    def _due(self, frame: int) -> List[_Timer]:
+        """Timers due by ``frame``, visiting only the buckets passed since."""
+        passed = frame - self._frame
+        if passed >= self.WHEEL_SLOTS:
+            buckets = self._wheel
+        else:
+            buckets = [
+                self._wheel[f % self.WHEEL_SLOTS]
+                for f in range(self._frame + 1, frame + 1)
+            ]
+
+        due = [t for bucket in buckets for t in bucket.values() if t.deadline <= frame]
+        due.sort(key=lambda t: (t.deadline, t.seq))
+        return due
+
+    def _tick(self):
+        frame = max(self._now_frame(), self._armed_frame or 0)
+        self._after_id = None
+        self._armed_frame = None
+
+        due = self._due(frame)
+        self._frame = frame
+        self._in_frame = True
+        try:
+            for timer in due:
+                # An earlier callback may have cancelled or replaced it
+                if self._timers.get(timer.key) is not timer:
+                    continue
+                self.cancel(timer.key)
+                self._fire(timer)
+        finally:
+            self._in_frame = False
+
+        self._flush()
+        self._arm_next()
+
+    def _fire(self, timer: _Timer):
+        try:
+            result = timer.callback(*timer.args, **timer.kwargs)
+        except Exception:
+            self.widget.report_callback_exception(*sys.exc_info())
+            return
+
+        if timer.interval is None or result is False or timer.key in self._timers:
+            return
+
+        # Fixed rate: keep the animation's phase, skipping missed frames
+        deadline = timer.deadline + timer.interval
+        if deadline <= self._frame:
+            missed = (self._frame - deadline) // timer.interval + 1
+            deadline += missed * timer.interval
+        timer.deadline = deadline
+        self._timers[timer.key] = timer
+        self._wheel[deadline % self.WHEEL_SLOTS][timer.key] = timer
+
+    def _flush(self):
+        """Apply the queued configures, one call per widget."""
+        configures, self._configures = self._configures, {}
+        for widget, options in configures.items():
+            try:
+                widget.configure(**options)
+            except TclError:
+                pass  # Destroyed since it was queued
+
+
+def scheduler_for(widget) -> Scheduler:
+    """The scheduler shared by every widget under ``widget``'s Tk root."""
+    root = widget._root()
+    scheduler = getattr(root, "_lockguardium_scheduler", None)
+    if scheduler is None:
+        scheduler = root._lockguardium_scheduler = Scheduler(root)
+    return scheduler
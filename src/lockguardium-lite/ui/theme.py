@@ -304,6 +304,7 @@ PLACEHOLDER_SETTINGS = {
     "clipboard_clear_seconds": 30,
     "default_password_length": 16,
     "theme": "dark",
+    "table_renderer": "widgets",
 }
 
 # Is this a new user? (for demo purposes)
@@ -0,0 +1,51 @@
+"""
+LockGuardium Lite - Test Configuration
+Makes the application's packages (core, services, ui) importable
+"""
+
+import os
+import random
+import sys
+from typing import List
+
+APP_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "src",
+    "lockguardium-lite",
+)
+if APP_DIR not in sys.path:
+    sys.path.insert(0, APP_DIR)
+
+SERVICES = ("GitHub", "GitLab", "Gmail", "Bitbucket", "Slack", "Netflix")
+
+
+def make_entry(
+    entry_id: int, service: str = "", email: str = "", username: str = "", **fields
+) -> dict:
+    """A vault entry; fields not given get fixed, valid values."""
+    return {
+        "id": entry_id,
+        "service": service,
+        "email": email,
+        "username": username,
+        "password": "hunter2",
+        "created_at": "2024-06-01",
+        "modified_at": "2024-06-01",
+        **fields,
+    }
+
+
+def make_entries(count: int, seed: int = 7) -> List[dict]:
+    """``count`` reproducible pseudo-random entries with ids from 1."""
+    rng = random.Random(seed)
+    return [
+        make_entry(
+            i,
+            rng.choice(SERVICES) + rng.choice(["", str(rng.randrange(50))]),
+            f"{rng.choice(['ann', 'bob', 'cy'])}@{rng.choice(['corp', 'home'])}.com",
+            rng.choice(["admin", "dev", "ops", ""]),
+            created_at=f"2024-0{rng.randrange(1, 7)}-1{rng.randrange(10)}",
+            modified_at=f"2024-06-{rng.randrange(10, 31)}",
+        )
+        for i in range(1, count + 1)
+    ]
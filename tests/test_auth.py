@@ -0,0 +1,104 @@
+"""
+LockGuardium Lite - Auth Tests
+Creating and unlocking vaults on disk
+"""
+
+import os
+
+import pytest
+
+from core.storage import VaultStorage
+from services import auth_service
+from services.auth_service import AuthError, AuthService
+from services.runtime import ServiceRuntime
+from tests.conftest import make_entry
+
+PASSWORD = "correct horse battery"
+
+
+@pytest.fixture
+def runtime():
+    runtime = ServiceRuntime(name="test-services")
+    yield runtime
+    runtime.stop()
+
+
+@pytest.fixture
+def auth(tmp_path, runtime, monkeypatch):
+    # Keep key derivation fast; the count is stored in the header anyway
+    monkeypatch.setattr(auth_service, "KDF_ITERATIONS", 1000)
+    storage = VaultStorage(os.path.join(tmp_path, "vault.lgv"))
+    return AuthService(storage, runtime)
+
+
+def _created(auth: AuthService) -> str:
+    vault = auth.create_vault(PASSWORD)
+    vault.add(make_entry(0, "GitHub"))
+    vault.save_search("Work", "email:corp")
+    vault.record_use(1)
+    vault.flush_usage()
+    vault.lock()
+    return auth.storage.path
+
+
+def test_create_then_unlock_round_trip(auth):
+    _created(auth)
+
+    vault = auth.unlock(PASSWORD)
+
+    assert [e["service"] for e in vault.get_all()] == ["GitHub"]
+    assert vault.saved_searches() == [{"name": "Work", "query": "email:corp"}]
+    assert vault.usage_score(1) > 0
+    assert vault.session.header.iterations == 1000
+    assert vault._metadata is not None  # Built while unlocking
+    assert vault.add(make_entry(0, "Slack"))["id"] == 2
+
+
+def test_wrong_password_is_rejected(auth):
+    _created(auth)
+
+    for password in ["wrong password", ""]:
+        with pytest.raises(AuthError, match="Invalid master password"):
+            auth.unlock(password)
+
+
+def test_create_refuses_weak_passwords_and_existing_vaults(auth):
+    with pytest.raises(AuthError):
+        auth.create_vault("short")
+    _created(auth)
+    with pytest.raises(AuthError, match="already exists"):
+        auth.create_vault(PASSWORD)
+
+
+def test_unlock_without_a_vault(auth):
+    with pytest.raises(AuthError):
+        auth.unlock(PASSWORD)
+
+
+@pytest.mark.parametrize("damage", ["truncated", "flipped", "missing"])
+def test_damaged_payload(auth, damage):
+    path = _created(auth)
+    _, offset = VaultStorage(path).read_header()
+    with open(path, "r+b") as f:
+        size = os.fstat(f.fileno()).st_size
+        if damage == "truncated":
+            f.truncate(offset + (size - offset) // 2)
+        elif damage == "flipped":
+            f.seek(offset + 40)
+            byte = f.read(1)
+            f.seek(offset + 40)
+            f.write(bytes([byte[0] ^ 0x01]))
+        else:
+            f.truncate(offset)
+
+    with pytest.raises(AuthError, match="corrupt"):
+        auth.unlock(PASSWORD)
+
+
+def test_damaged_header(auth):
+    path = _created(auth)
+    with open(path, "r+b") as f:
+        f.truncate(10)
+
+    with pytest.raises(AuthError):
+        auth.unlock(PASSWORD)
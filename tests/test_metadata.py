@@ -0,0 +1,132 @@
+"""
+LockGuardium Lite - Metadata Index Tests
+SQL sorting, filtering and grouping over non-secret entry fields
+"""
+
+import sqlite3
+
+import pytest
+
+from core.metadata import METADATA_COLUMNS, MetadataIndex
+from services.vault_service import VaultError, VaultService
+from tests.conftest import make_entries, make_entry
+
+
+@pytest.fixture
+def index():
+    index = MetadataIndex()
+    index.load(
+        [
+            make_entry(1, "GitHub", "ann@corp.com", "ann", created_at="2024-01-05"),
+            make_entry(2, "gitlab", "bob@home.net", "bob", created_at="2024-03-01"),
+            make_entry(3, "Slack", "cy@corp.com", "100%_sure", created_at="2024-02-10"),
+            make_entry(4, "Bank", "", "a_b", created_at="2023-12-31"),
+        ]
+    )
+    yield index
+    index.close()
+
+
+def test_select_sorts_case_insensitively(index):
+    assert index.select() == [4, 1, 2, 3]
+    assert index.select(order_by="service", descending=True) == [3, 2, 1, 4]
+    assert index.select(order_by="created_at") == [4, 1, 3, 2]
+    assert index.select(limit=2, offset=1) == [1, 2]
+    assert index.select(offset=3) == [3]
+
+
+@pytest.mark.parametrize(
+    "where, expected",
+    [
+        ([("domain", "=", "corp.com")], [1, 3]),
+        ([("domain", "=", "")], [4]),
+        ([("service", "=", "GITHUB")], [1]),
+        ([("service", "prefix", "git")], [1, 2]),
+        ([("email", "contains", "@corp")], [1, 3]),
+        ([("created_at", ">=", "2024-02-01"), ("domain", "!=", "")], [2, 3]),
+        ([("created_at", "<", "2024-01-01")], [4]),
+    ],
+)
+def test_filters(index, where, expected):
+    assert sorted(index.select(where)) == expected
+    assert index.count(where) == len(expected)
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [("%", [3]), ("_", [3, 4]), ("%_", [3]), ("a_b", [4]), ("\\", [])],
+)
+def test_like_wildcards_are_literal(index, value, expected):
+    assert sorted(index.select([("username", "contains", value)])) == expected
+
+
+def test_rejects_unknown_columns_and_operators(index):
+    with pytest.raises(ValueError):
+        index.select([("password", "=", "hunter2")])
+    with pytest.raises(ValueError):
+        index.select(order_by="password")
+    with pytest.raises(ValueError):
+        index.select([("service", "LIKE", "%")])
+
+
+def test_password_is_never_stored(index):
+    assert "password" not in METADATA_COLUMNS
+    columns = [row[1] for row in index._db.execute("PRAGMA table_info(entries)")]
+    assert "password" not in columns
+    dump = "\n".join(index._db.iterdump())
+    assert "hunter2" not in dump
+
+
+def test_group_counts(index):
+    assert index.group_counts("domain") == [("corp.com", 2), ("", 1), ("home.net", 1)]
+
+
+# ===== Through VaultService =====
+
+
+@pytest.mark.parametrize(
+    "where",
+    [
+        None,
+        [("domain", "=", "corp.com")],
+        [("service", "prefix", "git")],
+        [("modified_at", ">=", "2024-06-20")],
+    ],
+)
+def test_vault_index_follows_batches(where):
+    vault = VaultService.in_memory(make_entries(50))
+    vault.build_metadata_index()
+
+    with vault.batch():
+        vault.add(make_entry(0, "Gitea", "zed@corp.com", modified_at="2024-06-30"))
+        vault.update(1, {"email": "moved@elsewhere.org", "service": "GitKraken"})
+        vault.delete(2)
+
+    rebuilt = MetadataIndex()
+    rebuilt.load(vault.snapshot())
+    ids = [e["id"] for e in vault.select(where, order_by="email")]
+    assert ids == rebuilt.select(where, order_by="email")
+    assert vault.count(where) == len(ids)
+
+
+def test_vault_select_matches_python_sort():
+    entries = make_entries(200)
+    vault = VaultService.in_memory(entries)
+
+    ids = [e["id"] for e in vault.select(order_by="modified_at", descending=True)]
+    expected = sorted(entries, key=lambda e: (e["modified_at"], e["id"]), reverse=True)
+    assert ids == [e["id"] for e in expected]
+
+
+def test_lock_closes_the_index():
+    vault = VaultService.in_memory([make_entry(1, "GitHub")])
+    vault.build_metadata_index()
+    database = vault._metadata._db
+
+    vault.lock()
+
+    assert vault._metadata is None
+    with pytest.raises(sqlite3.ProgrammingError):
+        database.execute("SELECT 1")
+    with pytest.raises(VaultError):
+        vault.select()
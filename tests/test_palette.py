@@ -0,0 +1,197 @@
+"""
+LockGuardium Lite - Command Palette Tests
+Prefix trie, frecency decay and palette ranking
+"""
+
+import random
+
+from core.palette import Frecency, PrefixTrie, words
+from services.palette_service import PaletteService
+from services.vault_service import VaultService
+from tests.conftest import SERVICES, make_entry
+
+HALF_LIFE = Frecency.HALF_LIFE
+
+
+def _scan(labels: dict, query: str) -> set:
+    """Reference lookup: keys with a word starting with every query word."""
+    terms = words(query)
+    return {
+        key
+        for key, label in labels.items()
+        if all(any(w.startswith(t) for w in words(label)) for t in terms)
+    }
+
+
+# ===== PrefixTrie =====
+
+
+def test_words_split_on_punctuation():
+    assert words("Git-Hub (work)_2") == ["git", "hub", "work", "2"]
+
+
+def test_trie_finds_word_prefixes():
+    trie = PrefixTrie()
+    trie.add(1, "GitHub")
+    trie.add(2, "Git Hub Enterprise")
+    trie.add(3, "Big Thumb")
+
+    assert trie.find("gi") == {1, 2}
+    assert trie.find("hub") == {2}
+    assert trie.find("thu") == {3}
+    assert trie.find("x") == set()
+    assert trie.find("") == {1, 2, 3}
+    assert trie.search("hub git") == {2}
+    assert trie.search("  ") == {1, 2, 3}
+
+
+def test_trie_replaces_labels():
+    trie = PrefixTrie()
+    trie.add(1, "GitHub")
+    trie.add(1, "Slack")
+
+    assert len(trie) == 1 and trie.label(1) == "Slack"
+    assert trie.find("git") == set()
+    assert trie.find("sl") == {1}
+
+
+def test_trie_remove_prunes_unshared_nodes():
+    trie = PrefixTrie()
+    trie.add(1, "GitHub")
+    trie.add(2, "Gitea")
+    trie.add(3, "go google")  # Two words of one key share "go"
+
+    trie.remove(2)
+    git = trie._root.children["g"].children["i"].children["t"]
+    assert list(git.children) == ["h"]
+    assert git.keys == {1: 1}
+
+    trie.remove(3)
+    assert list(trie._root.children["g"].children) == ["i"]
+    assert trie.find("go") == set()
+
+    trie.remove(1)
+    trie.remove(1)  # Unknown keys are ignored
+    assert trie._root.children == {} and len(trie) == 0
+
+
+def test_trie_matches_a_scan_through_edits():
+    rng = random.Random(3)
+    trie, labels = PrefixTrie(), {}
+
+    for step in range(500):
+        key = rng.randrange(60)
+        if rng.random() < 0.3:
+            trie.remove(key)
+            labels.pop(key, None)
+        else:
+            label = " ".join(rng.sample(SERVICES, rng.randint(1, 3)))
+            trie.add(key, label)
+            labels[key] = label
+
+        query = rng.choice(["g", "git", "hub", "go goo", "sl", "", "zz"])
+        assert trie.search(query) == _scan(labels, query), (step, query)
+
+
+# ===== Frecency =====
+
+
+def test_frecency_decays_by_half_life():
+    frecency = Frecency()
+    for _ in range(4):
+        frecency.bump("old", now=0.0)
+
+    assert frecency.score("old", now=0.0) == 4.0
+    assert frecency.score("old", now=HALF_LIFE) == 2.0
+    assert frecency.score("old", now=3 * HALF_LIFE) == 0.5
+    assert frecency.score("unused", now=0.0) == 0.0
+
+
+def test_frecency_prefers_recent_over_old_habits():
+    frecency = Frecency()
+    for _ in range(4):
+        frecency.bump("habit", now=0.0)
+    frecency.bump("recent", now=3 * HALF_LIFE)
+
+    now = 3 * HALF_LIFE
+    ranked = sorted(frecency.keys(), key=lambda k: -frecency.score(k, now))
+    assert ranked == ["recent", "habit"]
+
+    # Bumping adds to the decayed score, not the stored one
+    assert frecency.bump("habit", now=now) == 1.5
+
+
+def test_frecency_dump_round_trip():
+    frecency = Frecency()
+    frecency.bump(1, now=10.0)
+    frecency.bump("lock", now=20.0)
+
+    restored = Frecency(frecency.dump())
+    assert restored.score(1, now=10.0) == 1.0
+    assert set(restored.keys()) == {1, "lock"}
+
+    restored.remove(1)
+    assert 1 not in restored and len(restored) == 1
+
+
+# ===== PaletteService =====
+
+
+def _palette(*services) -> PaletteService:
+    vault = VaultService.in_memory(
+        [make_entry(i, service) for i, service in enumerate(services, 1)]
+    )
+    return PaletteService(vault, {"lock": "Lock Vault", "gen": "Generate Password"})
+
+
+def _keys(palette: PaletteService, text: str, limit: int = 10) -> list:
+    return [item.key for item in palette.query(text, limit)]
+
+
+def test_ties_prefer_label_prefix_then_shorter_labels():
+    palette = _palette("Big Git", "GitHub", "Git")
+
+    assert _keys(palette, "git") == [3, 2, 1]
+
+
+def test_usage_outranks_label_ties():
+    palette = _palette("Big Git", "GitHub", "Git")
+
+    palette.record_use(1)
+    assert _keys(palette, "git") == [1, 3, 2]
+
+    palette.record_use(2)
+    palette.record_use(2)
+    assert _keys(palette, "git", limit=2) == [2, 1]
+
+
+def test_actions_rank_with_entries():
+    palette = _palette("Locksmith Pro", "Slack")
+
+    items = palette.query("lo")
+    assert [item.key for item in items] == ["lock", 1]
+    assert items[0].is_action and items[0].detail == "Action"
+    assert not items[1].is_action
+
+
+def test_empty_query_lists_used_items_then_vault_order():
+    palette = _palette("GitHub", "Slack", "Jira", "Zoom")
+    palette.record_use(3)
+    palette.record_use("lock")
+    palette.record_use("lock")
+
+    assert _keys(palette, "", limit=4) == ["lock", 3, "gen", 1]
+
+
+def test_palette_follows_vault_changes():
+    palette = _palette("GitHub", "Slack")
+    assert _keys(palette, "git") == [1]
+
+    with palette.vault.batch():
+        palette.vault.update(1, {"service": "Codeberg"})
+        palette.vault.add(make_entry(0, "GitLab"))
+        palette.vault.delete(2)
+
+    assert _keys(palette, "git") == [3]
+    assert _keys(palette, "code") == [1]
+    assert _keys(palette, "sla") == []
@@ -0,0 +1,63 @@
+"""
+LockGuardium Lite - Presence Tests
+Linux session lookups through a stubbed loginctl
+"""
+
+import pytest
+
+from core import presence
+
+
+@pytest.fixture(autouse=True)
+def fresh_lookups(monkeypatch):
+    monkeypatch.setattr(presence, "_found", {})
+    monkeypatch.delenv("XDG_SESSION_ID", raising=False)
+
+
+def _loginctl(monkeypatch, answers: dict) -> list:
+    calls = []
+
+    def loginctl(*args):
+        calls.append(args[0])
+        return answers.get(args[0])
+
+    monkeypatch.setattr(presence, "_loginctl", loginctl)
+    return calls
+
+
+def test_session_lookup_failures_are_retried(monkeypatch):
+    answers = {}
+    calls = _loginctl(monkeypatch, answers)
+
+    assert presence._linux_session() is None
+    answers["show-user"] = "c2"
+    assert presence._linux_session() == "c2"
+    assert presence._linux_session() == "c2"
+
+    assert calls == ["show-user", "show-user"]  # Kept once found
+
+
+def test_session_from_the_environment(monkeypatch):
+    calls = _loginctl(monkeypatch, {"show-session": "yes"})
+    monkeypatch.setenv("XDG_SESSION_ID", "7")
+
+    assert presence._linux_locked() is True
+    assert calls == ["show-session"]
+
+
+@pytest.mark.parametrize(
+    "hint, expected", [("yes", True), ("no", False), (None, None), ("", None)]
+)
+def test_locked_hint(monkeypatch, hint, expected):
+    _loginctl(monkeypatch, {"show-user": "c2", "show-session": hint})
+
+    assert presence._linux_locked() is expected
+
+
+def test_missing_loginctl_is_looked_up_again(monkeypatch):
+    paths = iter([None, "/usr/bin/loginctl"])
+    monkeypatch.setattr(presence.shutil, "which", lambda name: next(paths))
+
+    assert presence._loginctl_path() is None
+    assert presence._loginctl_path() == "/usr/bin/loginctl"
+    assert presence._loginctl_path() == "/usr/bin/loginctl"
@@ -0,0 +1,140 @@
+"""
+LockGuardium Lite - Query Language Tests
+Parsing search queries and planning them against the indexes
+"""
+
+from datetime import date
+
+import pytest
+
+from core.query import (
+    And,
+    DateRange,
+    Not,
+    Or,
+    QueryError,
+    QueryPlanner,
+    Text,
+    is_structured,
+    parse_query,
+)
+from core.search import ExactIndex, NGramIndex, RecencyIndex
+from tests.conftest import make_entries
+
+TODAY = date(2024, 6, 30)
+
+
+def parse(text: str):
+    return parse_query(text, TODAY)
+
+
+# ===== Parsing =====
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("github", Text(None, "github")),
+        ("service:Git", Text("service", "git")),
+        ("site:=GitHub", Text("service", "github", exact=True)),
+        ("mail:@corp.com", Text("email", "@corp.com")),
+        ("http://x", Text(None, "http://x")),
+        ("-user:admin", Not(Text("username", "admin"))),
+        ("NOT user:admin", Not(Text("username", "admin"))),
+    ],
+)
+def test_parse_terms(text, expected):
+    assert parse(text) == expected
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ('service:"Git Hub"', Text("service", "git hub")),
+        ('service:="Git Hub"', Text("service", "git hub", exact=True)),
+        ('service: "Git Hub"', Text("service", "git hub")),
+        ('-service:"Git Hub"', Not(Text("service", "git hub"))),
+        ('"two words"', Text(None, "two words")),
+        ('created:>="2024-01-01"', DateRange("created_at", "2024-01-01", None)),
+    ],
+)
+def test_parse_quoted_values(text, expected):
+    assert parse(text) == expected
+
+
+def test_parse_boolean_structure():
+    node = parse("a b OR (c | -d) AND e")
+
+    assert node == Or(
+        [
+            And([Text(None, "a"), Text(None, "b")]),
+            And([Or([Text(None, "c"), Not(Text(None, "d"))]), Text(None, "e")]),
+        ]
+    )
+
+
+@pytest.mark.parametrize(
+    "text, start, end",
+    [
+        ("modified:<30d", "2024-06-01", None),
+        ("modified:<=30d", "2024-05-31", None),
+        ("modified:>1w", None, "2024-06-22"),
+        ("modified:=1d", "2024-06-29", "2024-06-29"),
+        ("created:2024-01-01", "2024-01-01", "2024-01-01"),
+        ("created:>2024-01-01", "2024-01-02", None),
+        ("created:<2024-01-01", None, "2023-12-31"),
+        ("created:2024-01-01..2024-03-31", "2024-01-01", "2024-03-31"),
+        ("created:..2024-03-31", None, "2024-03-31"),
+    ],
+)
+def test_parse_dates(text, start, end):
+    node = parse(text)
+
+    assert isinstance(node, DateRange)
+    assert (node.start, node.end) == (start, end)
+
+
+@pytest.mark.parametrize(
+    "text",
+    ["", "(a", "a)", "a OR", "NOT", "service:", "service:=", "created:soon", '"'],
+)
+def test_parse_errors(text):
+    with pytest.raises(QueryError):
+        parse(text)
+
+
+def test_is_structured():
+    assert not is_structured("github")
+    assert not is_structured("two words")
+    assert not is_structured("http://example.com")
+    for text in ["service:git", "a OR b", "-admin", "(a)", "a | b", 'site:"x y"']:
+        assert is_structured(text), text
+
+
+# ===== Planning =====
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "git",
+        "service:=github",
+        "service:=github email:corp",
+        "git -user:admin",
+        "gm OR sl",
+        "(service:git | site:slack) created:>=2024-03-01",
+        "modified:<7d",
+        "NOT corp",
+        "modified:2024-06-15..2024-06-20 user:dev",
+    ],
+)
+def test_planner_matches_a_scan(text):
+    entries = {e["id"]: e for e in make_entries(400)}
+    ngrams, exact, recency = NGramIndex(), ExactIndex(), RecencyIndex()
+    for index in (ngrams, exact, recency):
+        index.build(entries.values())
+    planner = QueryPlanner(ngrams, exact, recency, all_ids=lambda: entries.keys())
+    node = parse(text)
+
+    expected = [i for i, entry in entries.items() if node.matches(entry)]
+    assert planner.execute(node, entries.get) == expected
@@ -0,0 +1,188 @@
+"""
+LockGuardium Lite - Runtime Tests
+ServiceRuntime and the TkBridge, driven by a stub widget instead of Tk
+"""
+
+import asyncio
+import concurrent.futures
+import threading
+
+import pytest
+
+from services.runtime import ServiceRuntime, TkBridge, to_thread
+
+
+class StubRoot:
+    def __init__(self):
+        self.reported = []
+
+    def report_callback_exception(self, exc_type, exc, tb):
+        self.reported.append(exc)
+
+
+class StubWidget:
+    """Records ``after`` callbacks; tests run them with ``fire``."""
+
+    def __init__(self):
+        self.root = StubRoot()
+        self.scheduled = {}
+        self._next_id = 0
+
+    def after(self, ms, callback):
+        self._next_id += 1
+        after_id = f"after#{self._next_id}"
+        self.scheduled[after_id] = callback
+        return after_id
+
+    def after_cancel(self, after_id):
+        self.scheduled.pop(after_id, None)
+
+    def _root(self):
+        return self.root
+
+    def fire(self):
+        """Run the callbacks scheduled so far, like one pass of the Tk loop."""
+        scheduled, self.scheduled = self.scheduled, {}
+        for callback in scheduled.values():
+            callback()
+
+
+@pytest.fixture
+def runtime():
+    runtime = ServiceRuntime(name="test-services")
+    yield runtime
+    runtime.stop()
+
+
+@pytest.fixture
+def widget():
+    return StubWidget()
+
+
+def _settle(bridge, widget, *futures):
+    concurrent.futures.wait(futures, timeout=5)
+    while bridge.pending_count and widget.scheduled:
+        widget.fire()
+
+
+async def _value(value):
+    return value
+
+
+async def _fail(message):
+    raise ValueError(message)
+
+
+# ===== ServiceRuntime =====
+
+
+def test_run_returns_results_from_the_loop_thread(runtime):
+    async def where():
+        await asyncio.sleep(0)
+        return threading.current_thread().name, await to_thread(sum, [1, 2, 3])
+
+    assert runtime.run(where()) == ("test-services", 6)
+
+
+def test_run_reraises_exceptions(runtime):
+    with pytest.raises(ValueError, match="boom"):
+        runtime.run(_fail("boom"))
+
+
+def test_run_refuses_to_block_the_loop(runtime):
+    async def nested():
+        inner = _value(1)
+        with pytest.raises(RuntimeError):
+            runtime.run(inner)
+        return True
+
+    assert runtime.run(nested())
+
+
+def test_stop_cancels_outstanding_tasks(runtime):
+    future = runtime.submit(asyncio.sleep(60))
+    runtime.stop()
+
+    with pytest.raises(concurrent.futures.CancelledError):
+        future.result(timeout=5)
+
+
+# ===== TkBridge =====
+
+
+def test_results_are_delivered_by_the_poll(runtime, widget):
+    bridge = TkBridge(widget, runtime)
+    results = []
+
+    future = bridge.call(_value(42), on_success=results.append)
+    assert bridge.pending_count == 1
+    assert len(widget.scheduled) == 1  # One poll, however many calls
+
+    _settle(bridge, widget, future)
+    assert results == [42]
+    assert bridge.pending_count == 0
+    assert not widget.scheduled  # Polling stops when idle
+
+
+def test_errors_go_to_on_error_or_report_callback_exception(runtime, widget):
+    bridge = TkBridge(widget, runtime)
+    errors = []
+
+    handled = bridge.call(_fail("handled"), on_error=errors.append)
+    unhandled = bridge.call(_fail("unhandled"))
+    _settle(bridge, widget, handled, unhandled)
+
+    assert [str(e) for e in errors] == ["handled"]
+    assert [str(e) for e in widget.root.reported] == ["unhandled"]
+
+
+def test_raising_callback_propagates_and_the_rest_still_run(runtime, widget):
+    bridge = TkBridge(widget, runtime)
+    results = []
+
+    def explode(value):
+        raise RuntimeError("callback failed")
+
+    first = bridge.call(_value(1), on_success=explode)
+    second = bridge.call(_value(2), on_success=results.append)
+    concurrent.futures.wait([first, second], timeout=5)
+
+    with pytest.raises(RuntimeError, match="callback failed"):
+        widget.fire()  # Tk would report this one
+    _settle(bridge, widget)
+
+    assert results == [2]
+    assert bridge.pending_count == 0
+
+
+def test_cancel_all_drops_only_cancellable_calls(runtime, widget):
+    bridge = TkBridge(widget, runtime)
+    release = threading.Event()
+    results = []
+
+    async def blocked(value):
+        await to_thread(release.wait, 5)
+        return value
+
+    search = bridge.call(blocked("search"), on_success=results.append)
+    write = bridge.call(blocked("write"), on_success=results.append, cancellable=False)
+
+    bridge.cancel_all()
+    assert search.cancelled()
+    assert bridge.uncancellable() == [write]
+    assert widget.scheduled  # Still polling for the write
+
+    release.set()
+    _settle(bridge, widget, write)
+    assert results == ["write"]
+    assert bridge.uncancellable() == []
+
+
+def test_cancel_all_stops_polling_when_nothing_is_left(runtime, widget):
+    bridge = TkBridge(widget, runtime)
+    bridge.call(asyncio.sleep(60))
+
+    bridge.cancel_all()
+
+    assert bridge.pending_count == 0
+    assert not widget.scheduled
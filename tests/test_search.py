@@ -0,0 +1,171 @@
+"""
+LockGuardium Lite - Search Index Tests
+Trigram substring index and ranked fuzzy matching
+"""
+
+import random
+
+from core.search import FuzzyIndex, NGramIndex
+from tests.conftest import SERVICES, make_entries, make_entry
+
+
+def _scan(entries, query: str) -> list:
+    """Reference substring search."""
+    query = query.lower()
+    return sorted(
+        e["id"]
+        for e in entries
+        if any(query in (e[f] or "").lower() for f in ("service", "email", "username"))
+    )
+
+
+# ===== NGramIndex =====
+
+
+def test_ngram_search_matches_a_scan():
+    entries = make_entries(500)
+    index = NGramIndex()
+    index.build(entries)
+
+    for query in ["git", "GitHub1", "hub", "@corp", "ad", "x", "", "zzz", "b@h"]:
+        assert index.search(query) == _scan(entries, query), query
+
+
+def test_ngram_does_not_match_across_fields():
+    index = NGramIndex()
+    index.build([make_entry(1, "abc", "def")])
+
+    assert index.search("abc") == [1]
+    assert index.search("cde") == []
+
+
+def test_ngram_add_update_remove():
+    index = NGramIndex()
+    index.build([make_entry(1, "GitHub"), make_entry(2, "GitLab")])
+
+    index.add(make_entry(3, "Gitea"))
+    index.update(make_entry(1, "Codeberg"))
+    index.remove(2)
+
+    assert index.search("git") == [3]
+    assert index.search("codeb") == [1]
+    assert index.search("hub") == []
+    assert len(index) == 2 and 2 not in index
+
+
+def test_ngram_incremental_matches_rebuild():
+    entries = {e["id"]: e for e in make_entries(300)}
+    index = NGramIndex()
+    index.build(entries.values())
+
+    rng = random.Random(3)
+    for step in range(2000):
+        entry_id = rng.randrange(1, 400)
+        if entry_id in entries and rng.random() < 0.3:
+            del entries[entry_id]
+            index.remove(entry_id)
+        else:
+            entries[entry_id] = make_entry(entry_id, rng.choice(SERVICES) + str(step))
+            index.add(entries[entry_id])
+
+    for query in ["git", "lab", "net", "12", "slack1"]:
+        assert index.search(query) == _scan(entries.values(), query), query
+
+
+def test_ngram_search_within_candidates():
+    index = NGramIndex()
+    index.build(make_entries(100))
+
+    everything = index.search("git")
+    assert index.search("git", set(everything[:5])) == everything[:5]
+    assert index.search("git", {10_000}) == []
+
+
+def test_ngram_dump_restore_round_trip():
+    entries = make_entries(200)
+    index = NGramIndex()
+    index.build(entries)
+    documents = [(i, index.text(i)) for i in sorted(e["id"] for e in entries)]
+
+    restored = NGramIndex.restore(documents, index.dump())
+
+    for query in ["git", "@home", "ops"]:
+        assert restored.search(query) == index.search(query)
+
+
+def test_ngram_restore_finds_unrecorded_edits_by_digest():
+    index = NGramIndex()
+    index.build([make_entry(1, "GitHub"), make_entry(2, "Slack")])
+    data = index.dump()
+
+    edited = NGramIndex()
+    edited.build(
+        [make_entry(1, "GitHub"), make_entry(2, "Gitea"), make_entry(3, "GitLab")]
+    )
+    documents = [(i, edited.text(i)) for i in (1, 2, 3)]
+
+    assert NGramIndex.restore(documents, data).search("git") == [1]
+    assert NGramIndex.restore(documents, data, None).search("git") == [1, 2, 3]
+
+
+# ===== FuzzyIndex =====
+
+
+def test_fuzzy_matches_subsequences():
+    index = FuzzyIndex()
+    index.build(
+        [make_entry(1, "GitHub"), make_entry(2, "Gmail"), make_entry(3, "Slack")]
+    )
+
+    assert [i for i, _ in index.top("gthb", 10)] == [1]
+    assert [i for i, _ in index.top("GT HB", 10)] == [1]
+    assert index.top("xyz", 10) == []
+
+
+def test_fuzzy_ranks_prefix_and_service_matches_first():
+    index = FuzzyIndex()
+    index.build(
+        [
+            make_entry(1, "Notes", email="git@example.com"),
+            make_entry(2, "MyGitHub"),
+            make_entry(3, "GitHub"),
+        ]
+    )
+
+    ids = [i for i, _ in index.top("git", 10)]
+    assert ids[0] == 3  # Prefix of the service
+    assert set(ids) == {1, 2, 3}
+
+
+def test_fuzzy_top_k_is_best_first_and_limited():
+    entries = make_entries(400)
+    index = FuzzyIndex()
+    index.build(entries)
+
+    every = index.top("gh", len(entries))
+    scores = [score for _, score in every]
+    assert scores == sorted(scores, reverse=True)
+    assert index.top("gh", 5) == every[:5]
+    assert index.count(index.matches("gh")) == len(every)
+
+
+def test_fuzzy_add_update_remove():
+    index = FuzzyIndex()
+    index.build([make_entry(1, "GitHub"), make_entry(2, "GitLab")])
+
+    index.update(make_entry(1, "Slack"))
+    index.remove(2)
+    index.add(make_entry(3, "Gitea"))
+
+    assert [i for i, _ in index.top("git", 10)] == [3]
+    assert [i for i, _ in index.top("slk", 10)] == [1]
+    assert len(index) == 2
+
+
+def test_fuzzy_refines_within_previous_hits():
+    index = FuzzyIndex()
+    index.build(make_entries(300))
+
+    previous = index.matches("gi")
+    refined = index.select(index.matches("git", within=previous), 50)
+    assert refined == index.select(index.matches("git"), 50)
@@ -0,0 +1,395 @@
+"""
+LockGuardium Lite - Service Tests
+Vault batches, the search service and the persisted search index journal
+"""
+
+import os
+import sys
+import threading
+from datetime import date
+
+import pytest
+from cryptography.fernet import Fernet
+
+from core.models import VaultChange, VaultSnapshot
+from core.persistent import PersistentMap
+from core.search import NGramIndex
+from core.storage import IndexStorage
+from services import search_service
+from services.index_store import SearchIndexStore
+from services.search_service import SearchService
+from services.vault_service import VaultError, VaultService
+from tests.conftest import make_entry
+
+# Vault keys are urlsafe-base64 Fernet keys
+KEY = Fernet.generate_key()
+
+
+def _snapshot(entries, generation: int) -> VaultSnapshot:
+    return VaultSnapshot(
+        PersistentMap.from_items((e["id"], e) for e in entries), generation
+    )
+
+
+@pytest.fixture
+def path(tmp_path):
+    return os.path.join(tmp_path, "vault.lgv.idx")
+
+
+def _store(path: str, key: bytes = KEY) -> SearchIndexStore:
+    return SearchIndexStore(IndexStorage(path), key)
+
+
+def _saved(path: str, entries, generation: int) -> SearchIndexStore:
+    index = NGramIndex()
+    index.build(entries)
+    store = _store(path)
+    store.save(index, generation)
+    return store
+
+
+# ===== VaultService batches =====
+
+
+class FailingStorage:
+    """Vault storage whose writes always fail."""
+
+    def write(self, header, payload):
+        raise OSError("disk full")
+
+
+def _listening(vault: VaultService) -> list:
+    changes = []
+    vault.subscribe(changes.append)
+    return changes
+
+
+def test_batch_emits_one_coalesced_change():
+    vault = VaultService.in_memory([make_entry(1, "GitHub"), make_entry(2, "Slack")])
+    changes = _listening(vault)
+
+    with vault.batch():
+        added = vault.add(make_entry(0, "Gitea"))
+        vault.update(added["id"], {"service": "Codeberg"})
+        temporary = vault.add(make_entry(0, "Scratch"))
+        vault.delete(temporary["id"])
+        vault.update(1, {"username": "octocat"})
+        vault.update(1, {"email": "me@example.com"})
+        vault.delete(2)
+
+    assert len(changes) == 1
+    change = changes[0]
+    assert [e["service"] for e in change.added] == ["Codeberg"]
+    assert [(e["id"], e["username"], e["email"]) for e in change.updated] == [
+        (1, "octocat", "me@example.com")
+    ]
+    assert change.removed == [2]
+    assert change.generation == vault.snapshot().generation
+
+
+def test_failed_validation_restores_the_vault():
+    vault = VaultService.in_memory([make_entry(1, "GitHub")])
+    vault.save_search("Work", "email:corp")
+    changes = _listening(vault)
+    before = vault.snapshot()
+    next_id = vault.session.next_id
+
+    with pytest.raises(VaultError, match="password"):
+        with vault.batch():
+            vault.add(make_entry(0, "Valid"))
+            vault.save_search("Home", "email:home")
+            vault.update(1, {"password": ""})
+
+    assert changes == []
+    assert vault.snapshot() is before
+    assert vault.get(1)["password"] == "hunter2"
+    assert vault.session.next_id == next_id
+    assert vault.saved_searches() == [{"name": "Work", "query": "email:corp"}]
+
+
+def test_failed_write_rolls_back_and_emits_nothing():
+    vault = VaultService.in_memory([make_entry(1, "GitHub")])
+    vault.storage = FailingStorage()
+    vault.session.key = Fernet.generate_key()
+    vault.record_use(1)
+    changes = _listening(vault)
+    generation = vault.session.header.generation
+
+    with pytest.raises(OSError):
+        vault.delete(1)
+
+    assert changes == []
+    assert vault.session.header.generation == generation
+    assert vault.snapshot().generation == generation
+    assert vault.get(1) is not None
+    assert vault.usage_score(1) > 0  # Usage survives a failed delete
+
+
+def test_delete_forgets_usage_once_committed():
+    vault = VaultService.in_memory([make_entry(1, "GitHub"), make_entry(2, "Slack")])
+    vault.record_use(1)
+    vault.record_use(2)
+
+    vault.delete(1)
+
+    assert vault.used_keys() == [2]
+
+
+def test_failing_listener_does_not_fail_the_commit(monkeypatch):
+    vault = VaultService.in_memory([make_entry(1, "GitHub")])
+    reported = []
+    monkeypatch.setattr(sys, "excepthook", lambda *info: reported.append(info[1]))
+
+    def broken(change):
+        raise RuntimeError("listener bug")
+
+    vault.subscribe(broken)
+    changes = _listening(vault)
+
+    entry = vault.update(1, {"service": "Codeberg"})
+
+    assert entry["service"] == "Codeberg"
+    assert len(changes) == 1
+    assert [str(error) for error in reported] == ["listener bug"]
+
+
+def test_listeners_run_without_the_vault_lock():
+    vault = VaultService.in_memory([make_entry(1, "GitHub")])
+    acquired = []
+
+    def try_lock():
+        if vault._lock.acquire(timeout=1):
+            vault._lock.release()
+            acquired.append(True)
+
+    def listener(change):
+        # Another thread can start a write while listeners run
+        thread = threading.Thread(target=try_lock)
+        thread.start()
+        thread.join()
+
+    vault.subscribe(listener)
+    vault.update(1, {"service": "Codeberg"})
+
+    assert acquired == [True]
+
+
+# ===== SearchIndexStore =====
+
+
+def test_load_replays_the_journal(path):
+    entries = [make_entry(1, "GitHub"), make_entry(2, "Slack")]
+    store = _saved(path, entries, 5)
+
+    entries[1] = make_entry(2, "GitLab")
+    entries.append(make_entry(3, "Gitea"))
+    store.record(VaultChange(updated=[entries[1]], generation=6))
+    store.record(VaultChange(added=[entries[2]], generation=7))
+    store.record(VaultChange(removed=[1], generation=8))
+    store.flush()
+    del entries[0]
+
+    loaded = _store(path)
+    index = loaded.load(_snapshot(entries, 8))
+
+    assert index.search("git") == [2, 3]
+    assert index.search("hub") == []
+    assert not loaded.needs_compaction
+
+
+def test_load_reconciles_across_a_gap(path):
+    entries = [make_entry(1, "GitHub"), make_entry(2, "Slack"), make_entry(3, "Notes")]
+    store = _saved(path, entries, 1)
+
+    # Generation 2 was committed while nothing was journaling
+    entries[1] = make_entry(2, "GitLab")
+    entries[2] = make_entry(3, "Gitea")
+    store._generation = 2
+    store.record(VaultChange(updated=[entries[2]], generation=3))
+    store.flush()
+
+    loaded = _store(path)
+    index = loaded.load(_snapshot(entries, 3))
+
+    assert index.search("git") == [1, 2, 3]
+    assert loaded.needs_compaction
+
+
+def test_load_reconciles_a_journal_behind_the_vault(path):
+    entries = [make_entry(1, "GitHub"), make_entry(2, "Slack")]
+    _saved(path, entries, 1)
+
+    entries[1] = make_entry(2, "GitLab")
+    index = _store(path).load(_snapshot(entries, 4))
+
+    assert index.search("gitl") == [2]
+
+
+@pytest.mark.parametrize("damage", ["missing", "foreign key", "garbage"])
+def test_load_rejects_unusable_files(path, damage):
+    entries = [make_entry(1, "GitHub")]
+    if damage != "missing":
+        _saved(path, entries, 1)
+    if damage == "garbage":
+        with open(path, "r+b") as f:
+            f.seek(8)
+            f.write(b"\xff" * 16)
+
+    key = Fernet.generate_key() if damage == "foreign key" else KEY
+    assert _store(path, key).load(_snapshot(entries, 1)) is None
+
+
+def test_torn_journal_record_is_ignored(path):
+    entries = [make_entry(1, "GitHub")]
+    store = _saved(path, entries, 1)
+    entries.append(make_entry(2, "GitLab"))
+    store.record(VaultChange(added=[entries[1]], generation=2))
+    store.flush()
+    with open(path, "ab") as f:
+        f.write(b"\x00\x00\x01\x00partial")
+
+    assert _store(path).load(_snapshot(entries, 2)).search("git") == [1, 2]
+
+
+def test_record_skips_generations_in_the_base(path):
+    entries = [make_entry(1, "GitHub")]
+    store = _saved(path, entries, 3)
+
+    store.record(VaultChange(added=[make_entry(2, "Old")], generation=3))
+    store.flush()
+
+    assert len(IndexStorage(path).read()[2]) == 0
+
+
+class SlowStorage(IndexStorage):
+    """Index storage whose appends wait for ``release``."""
+
+    def __init__(self, path: str):
+        super().__init__(path)
+        self.release = threading.Event()
+        self.appends = []
+
+    def append(self, *records: bytes):
+        self.release.wait(5)
+        self.appends.append(len(records))
+        super().append(*records)
+
+
+def test_records_are_written_off_the_commit_path(path):
+    entries = [make_entry(1, "GitHub")]
+    _saved(path, entries, 1)
+    storage = SlowStorage(path)
+    store = SearchIndexStore(storage, KEY)
+    store.load(_snapshot(entries, 1))
+
+    # The first append blocks; the others queue up behind it
+    for generation in range(2, 6):
+        entries.append(make_entry(generation, f"Git{generation}"))
+        store.record(VaultChange(added=[entries[-1]], generation=generation))
+    storage.release.set()
+    store.flush()
+
+    assert sum(storage.appends) == 4 and len(storage.appends) <= 2
+    index = _store(path).load(_snapshot(entries, 5))
+    assert index.search("git") == [1, 2, 3, 4, 5]
+
+
+def test_a_queued_base_replaces_earlier_records(path):
+    entries = [make_entry(1, "GitHub")]
+    store = _saved(path, entries, 1)
+    entries.append(make_entry(2, "GitLab"))
+    store.record(VaultChange(added=[entries[1]], generation=2))
+
+    index = NGramIndex()
+    index.build(entries)
+    store.save_later(index, 2)
+    entries.append(make_entry(3, "Gitea"))
+    store.record(VaultChange(added=[entries[2]], generation=3))
+    store.flush()
+
+    header, _, records = IndexStorage(path).read()
+    assert header["generation"] == 2 and len(records) == 1
+    assert _store(path).load(_snapshot(entries, 3)).search("git") == [1, 2, 3]
+
+
+def test_deleted_store_writes_nothing_queued(path):
+    store = _saved(path, [make_entry(1, "GitHub")], 1)
+    store.record(VaultChange(added=[make_entry(2, "GitLab")], generation=2))
+
+    store.delete()
+    store.flush()
+    store.record(VaultChange(added=[make_entry(3, "Gitea")], generation=3))
+    store.flush()
+
+    assert not os.path.exists(path)
+
+
+# ===== SearchService =====
+
+
+def _vault():
+    return VaultService.in_memory(
+        [make_entry(1, "GitHub"), make_entry(2, "GitLab"), make_entry(3, "Big Thumb")]
+    )
+
+
+def test_search_follows_vault_changes():
+    vault = _vault()
+    search = SearchService(vault)
+    assert search.search("git") == [1, 2]
+
+    vault.update(2, {"service": "Slack"})
+    vault.add(make_entry(0, "Gitea"))
+
+    assert search.search("git") == [1, 4]
+    assert search.rank("gitea") == [4]
+
+
+def test_find_returns_every_substring_match():
+    search = SearchService(_vault())
+
+    ids, total = search.find("git", limit=1)
+
+    assert sorted(ids) == [1, 2] and total == 2
+    ids, total = search.find("gthb", limit=1)
+    assert len(ids) == 1 and total == 2
+
+
+def test_find_takes_the_lock_once():
+    search = SearchService(_vault())
+
+    class CountingLock:
+        def __init__(self):
+            self.lock = threading.Lock()
+            self.acquired = 0
+
+        def __enter__(self):
+            self.acquired += 1
+            return self.lock.__enter__()
+
+        def __exit__(self, *exc):
+            return self.lock.__exit__(*exc)
+
+    search._lock = CountingLock()
+    ids, total = search.find("git")
+
+    assert sorted(ids) == [1, 2] and total == 2
+    assert search._lock.acquired == 1
+
+
+def test_query_cache_follows_the_date(monkeypatch):
+    vault = _vault()
+    search = SearchService(vault)
+
+    class Today(date):
+        value = date(2024, 6, 10)
+
+        @classmethod
+        def today(cls):
+            return cls.value
+
+    monkeypatch.setattr(search_service, "date", Today)
+    assert search.query("modified:<30d") == [1, 2, 3]
+
+    Today.value = date(2024, 8, 1)
+    assert search.query("modified:<30d") == []
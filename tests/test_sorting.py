@@ -0,0 +1,121 @@
+"""
+LockGuardium Lite - Sort Order Tests
+Collation keys and the incrementally maintained SortIndex
+"""
+
+import random
+
+import pytest
+
+from core.sorting import SORT_FIELDS, SortIndex, collation_key
+from tests.conftest import SERVICES, make_entries, make_entry
+
+
+def _expected(entries: dict, field: str, descending: bool = False) -> list:
+    """Reference order: sort every entry from scratch."""
+    ordered = sorted(
+        entries, key=lambda i: (collation_key(entries[i].get(field) or ""), i)
+    )
+    return ordered[::-1] if descending else ordered
+
+
+def _assert_sorted(index: SortIndex, entries: dict):
+    for field in SORT_FIELDS:
+        assert list(index.ordered(field)) == _expected(entries, field), field
+        assert list(index.ordered(field, True)) == _expected(entries, field, True)
+
+
+# ===== collation_key =====
+
+
+def test_collation_ignores_case_and_accents():
+    values = ["slack", "Éclair", "GitHub", "eclair", "", "Zoom", "github"]
+
+    assert sorted(values, key=collation_key) == [
+        "eclair",
+        "Éclair",
+        "GitHub",
+        "github",
+        "slack",
+        "Zoom",
+        "",
+    ]
+    assert collation_key("GITHUB")[1] == collation_key("github")[1]
+    assert collation_key("Straße")[1] == "strasse"
+
+
+def test_collation_breaks_ties_by_raw_value():
+    assert collation_key("GitHub") != collation_key("github")
+    assert collation_key("GitHub") < collation_key("github")
+
+
+# ===== SortIndex =====
+
+
+def test_build_orders_every_field():
+    entries = {e["id"]: e for e in make_entries(300)}
+    index = SortIndex()
+    index.build(entries.values())
+
+    assert len(index) == 300
+    _assert_sorted(index, entries)
+
+
+def test_add_update_remove_keep_the_order():
+    rng = random.Random(5)
+    entries = {e["id"]: e for e in make_entries(200)}
+    index = SortIndex()
+    index.build(entries.values())
+    next_id = max(entries) + 1
+
+    for _ in range(300):
+        roll = rng.random()
+        if roll < 0.3:
+            entry = make_entry(next_id, rng.choice(SERVICES), username="dev")
+            next_id += 1
+            entries[entry["id"]] = entry
+            index.add(entry)
+        elif roll < 0.7:
+            entry_id = rng.choice(list(entries))
+            entry = dict(entries[entry_id], service=rng.choice(SERVICES).upper())
+            entries[entry_id] = entry
+            index.update(entry)
+        else:
+            entry_id = rng.choice(list(entries))
+            del entries[entry_id]
+            index.remove(entry_id)
+
+    assert len(index) == len(entries)
+    _assert_sorted(index, entries)
+
+
+def test_unchanged_and_unknown_entries_are_ignored():
+    index = SortIndex()
+    index.build([make_entry(1, "GitHub"), make_entry(2, "Slack")])
+
+    index.update(make_entry(1, "GitHub"))
+    index.remove(99)
+
+    assert list(index.ordered("service")) == [1, 2]
+    assert len(index) == 2
+
+
+def test_equal_keys_keep_id_order():
+    index = SortIndex()
+    index.build([make_entry(i, "Same") for i in (3, 1, 2)])
+
+    assert list(index.ordered("service")) == [1, 2, 3]
+    assert list(index.ordered("service", descending=True)) == [3, 2, 1]
+
+
+@pytest.mark.parametrize("count", [5, 150])  # Subset sort, ordered scan
+@pytest.mark.parametrize("descending", [False, True])
+def test_arrange_matches_a_full_sort(count, descending):
+    entries = {e["id"]: e for e in make_entries(200)}
+    index = SortIndex()
+    index.build(entries.values())
+    ids = random.Random(count).sample(list(entries), count)
+
+    for field in SORT_FIELDS:
+        expected = [i for i in _expected(entries, field, descending) if i in set(ids)]
+        assert index.arrange(ids + [999], field, descending) == expected
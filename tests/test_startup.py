@@ -0,0 +1,24 @@
+"""
+LockGuardium Lite - Startup Tests
+Cold import budget and the modules kept off the login path
+"""
+
+import check_startup
+
+
+def test_app_import_is_within_budget_and_lean():
+    total, cumulative = check_startup.measure_imports()
+
+    assert "app" in cumulative
+    assert total <= check_startup.IMPORT_BUDGET_MS
+    assert check_startup._excluded(cumulative) == []
+
+
+def test_excluded_matches_packages_not_prefixes():
+    modules = ["services", "services.runtime", "servicesx", "core.crypto", "core"]
+
+    assert check_startup._excluded(modules) == [
+        "core.crypto",
+        "services",
+        "services.runtime",
+    ]
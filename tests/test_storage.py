@@ -0,0 +1,108 @@
+"""
+LockGuardium Lite - Storage Tests
+Persistent vault state and snapshot isolation
+"""
+
+import random
+
+import pytest
+
+from core.persistent import PersistentMap
+from services.vault_service import VaultError, VaultService
+from tests.conftest import make_entry
+
+# ===== PersistentMap =====
+
+
+def test_set_and_delete_leave_the_original_untouched():
+    original = PersistentMap.from_items((i, str(i)) for i in range(10))
+
+    changed = original.set(3, "three").set(42, "new").delete(7)
+
+    assert dict(original.items()) == {i: str(i) for i in range(10)}
+    assert changed[3] == "three" and changed[42] == "new"
+    assert 7 not in changed and 7 in original
+    assert len(original) == 10 and len(changed) == 10
+
+
+def test_matches_a_dict_under_random_edits():
+    rng = random.Random(1234)
+    expected = {}
+    current = PersistentMap()
+    versions = []
+
+    for _ in range(2000):
+        key = rng.randrange(300)
+        if key in expected and rng.random() < 0.4:
+            del expected[key]
+            current = current.delete(key)
+        else:
+            expected[key] = rng.random()
+            current = current.set(key, expected[key])
+        versions.append((current, dict(expected)))
+
+    # Every version still reads as it did when it was current
+    for version, contents in versions[::97]:
+        assert list(version.items()) == sorted(contents.items())
+        assert len(version) == len(contents)
+
+
+def test_from_items_sorts_and_deduplicates():
+    m = PersistentMap.from_items([(3, "c"), (1, "a"), (2, "b"), (1, "z")])
+
+    assert list(m.items()) == [(1, "z"), (2, "b"), (3, "c")]
+    assert m.nth(0) == (1, "z") and m.nth(-1) == (3, "c")
+    assert m.rank(2) == 1 and m.rank(10) == 3
+
+
+def test_missing_keys():
+    m = PersistentMap.from_items([(1, "a")])
+
+    assert m.get(2) is None
+    with pytest.raises(KeyError):
+        m[2]
+    with pytest.raises(KeyError):
+        m.delete(2)
+
+
+# ===== Vault snapshots =====
+
+
+def test_snapshot_is_isolated_from_later_commits():
+    vault = VaultService.in_memory([make_entry(1, "GitHub"), make_entry(2, "GitLab")])
+    before = vault.snapshot()
+
+    vault.update(1, {"service": "Codeberg"})
+    vault.delete(2)
+    vault.add(make_entry(3, "Forgejo"))  # The vault assigns the id
+    after = vault.snapshot()
+
+    assert [e["service"] for e in before] == ["GitHub", "GitLab"]
+    assert before.get(2)["service"] == "GitLab"
+    assert after.generation > before.generation
+    assert sorted(e["service"] for e in after) == ["Codeberg", "Forgejo"]
+
+
+def test_failed_batch_publishes_nothing():
+    vault = VaultService.in_memory([make_entry(1, "GitHub")])
+    before = vault.snapshot()
+
+    with pytest.raises(RuntimeError):
+        with vault.batch():
+            vault.update(1, {"service": "Changed"})
+            raise RuntimeError("abort")
+
+    assert vault.snapshot() is before
+    assert vault.get(1)["service"] == "GitHub"
+
+
+def test_snapshot_raises_once_locked():
+    vault = VaultService.in_memory([make_entry(1, "GitHub")])
+    snapshot = vault.snapshot()
+
+    vault.lock()
+
+    assert vault.is_locked
+    assert [e["service"] for e in snapshot] == ["GitHub"]
+    with pytest.raises(VaultError):
+        vault.snapshot()
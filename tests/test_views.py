@@ -0,0 +1,163 @@
+"""
+LockGuardium Lite - Smart Folder Tests
+Materialized views and the smart folder service following vault batches
+"""
+
+import random
+from datetime import date
+
+from core.models import VaultChange
+from core.query import parse_query
+from core.views import MaterializedView
+from services.search_service import SearchService
+from services.smart_folders import SmartFolderService
+from services.vault_service import VaultService
+from tests.conftest import SERVICES, make_entries, make_entry
+
+TODAY = date(2024, 6, 10)
+
+FOLDERS = {
+    "Work": "email:@corp",
+    "Git": "service:git OR service:bit",
+    "Not admin": "-username:admin",
+    "Early": "created:<2024-03-01",
+}
+
+
+def _scan(vault: VaultService, query: str) -> list:
+    """Reference result: test every entry against the query."""
+    node = parse_query(query)
+    return sorted(e["id"] for e in vault.get_all() if node.matches(e))
+
+
+# ===== MaterializedView =====
+
+
+def test_view_applies_changes():
+    view = MaterializedView("Work", "email:@corp", TODAY)
+    view.reset([1, 2])
+
+    view.apply(
+        VaultChange(
+            generation=1,
+            added=[make_entry(3, "Slack", "cy@corp.com")],
+            updated=[make_entry(1, "GitHub", "ann@home.com")],
+            removed=[2],
+        )
+    )
+
+    assert view.sorted_ids() == [3]
+    assert len(view) == 1
+
+
+def test_view_with_relative_dates_expires_daily():
+    view = MaterializedView("Recent", "modified:<30d", TODAY)
+    plain = MaterializedView("Work", "email:@corp", TODAY)
+
+    assert view.dated and not plain.dated
+    assert view.is_current(TODAY)
+    assert not view.is_current(date(2024, 6, 11))
+    assert plain.is_current(date(2025, 1, 1))
+
+    view.reset([], today=date(2024, 6, 11))
+    assert view.is_current(date(2024, 6, 11))
+
+
+def test_view_recomputes_dates_on_reset():
+    entry = make_entry(1, "GitHub", modified_at="2024-06-01")
+    view = MaterializedView("Recent", "modified:<30d", TODAY)
+
+    view.apply(VaultChange(generation=1, added=[entry]))
+    assert view.sorted_ids() == [1]
+
+    view.reset([], today=date(2024, 8, 1))
+    view.apply(VaultChange(generation=2, updated=[entry]))
+    assert view.sorted_ids() == []
+
+
+# ===== SmartFolderService =====
+
+
+def _folders(entries) -> SmartFolderService:
+    vault = VaultService.in_memory(entries)
+    with vault.batch():
+        for name, query in FOLDERS.items():
+            vault.save_search(name, query)
+    return SmartFolderService(vault, SearchService(vault))
+
+
+def _assert_current(folders: SmartFolderService):
+    for name, count in folders.folders():
+        expected = _scan(folders.vault, folders.query_of(name))
+        assert folders.ids(name) == expected, name
+        assert count == len(expected), name
+
+
+def test_folders_match_a_full_query():
+    folders = _folders(make_entries(200))
+
+    assert [name for name, _ in folders.folders()] == list(FOLDERS)
+    _assert_current(folders)
+
+
+def test_folders_follow_vault_batches():
+    rng = random.Random(11)
+    folders = _folders(make_entries(200))
+    vault = folders.vault
+    folders.folders()  # Materialize before the edits
+
+    for _ in range(20):
+        ids = [e["id"] for e in vault.get_all()]
+        with vault.batch():
+            for entry_id in rng.sample(ids, 5):
+                vault.update(
+                    entry_id,
+                    {
+                        "service": rng.choice(SERVICES),
+                        "email": rng.choice(["ann@corp.com", "bob@home.com"]),
+                    },
+                )
+            for entry_id in rng.sample(ids, 3):
+                vault.delete(entry_id)
+            for _ in range(4):
+                vault.add(make_entry(0, rng.choice(SERVICES), "cy@corp.com"))
+        _assert_current(folders)
+
+
+def test_folders_follow_saved_search_changes():
+    folders = _folders(make_entries(50))
+    vault = folders.vault
+    folders.folders()
+
+    with vault.batch():
+        vault.save_search("Work", "email:@home")
+        vault.delete_saved_search("Early")
+        vault.save_search("Admins", "username:=admin")
+        vault.add(make_entry(0, "Jira", "ann@home.com", "admin"))
+
+    assert [name for name, _ in folders.folders()] == [
+        "Git",
+        "Not admin",
+        "Work",
+        "Admins",
+    ]
+    _assert_current(folders)
+    assert folders.ids("Early") == []
+
+
+def test_folder_entries_resolve_against_the_snapshot():
+    folders = _folders([make_entry(1, "GitHub"), make_entry(2, "Slack")])
+
+    assert [e["service"] for e in folders.entries("Git")] == ["GitHub"]
+
+    folders.vault.delete(1)
+    assert folders.entries("Git") == []
+
+
+def test_closed_service_stops_following():
+    folders = _folders([make_entry(1, "GitHub")])
+    folders.folders()
+    folders.close()
+
+    folders.vault.add(make_entry(0, "GitLab"))
+    assert folders._views == {}